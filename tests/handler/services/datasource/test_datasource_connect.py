@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
 import pytest
 
 from veaiops.handler.services.datasource.connect import (
@@ -249,18 +251,20 @@ async def test_update_connect_aliyun_credentials():
     connect_id = str(connect.id)
 
     # Act
-    updated = await update_connect(
-        connect_id,
-        {
-            "aliyun_access_key_id": "new_key",
-            "aliyun_access_key_secret": "new_secret",
-        },
-        "user2",
-    )
+    with patch("veaiops.metrics.aliyun.clear_aliyun_client_cache") as mock_clear:
+        updated = await update_connect(
+            connect_id,
+            {
+                "aliyun_access_key_id": "new_key",
+                "aliyun_access_key_secret": "new_secret",
+            },
+            "user2",
+        )
 
     # Assert
     assert updated.aliyun_access_key_id == "new_key"
     assert updated.updated_user == "user2"
+    mock_clear.assert_called_once()
 
     # Cleanup
     await updated.delete()
@@ -488,15 +492,17 @@ async def test_update_connect_volcengine_secret():
     connect_id = str(connect.id)
 
     # Act
-    updated = await update_connect(
-        connect_id,
-        {"volcengine_access_key_secret": "new_secret"},
-        "user2",
-    )
+    with patch("veaiops.metrics.volcengine.clear_volcengine_client_cache") as mock_clear:
+        updated = await update_connect(
+            connect_id,
+            {"volcengine_access_key_secret": "new_secret"},
+            "user2",
+        )
 
     # Assert
     assert updated.updated_user == "user2"
     assert updated.volcengine_access_key_id == "old_id"
+    mock_clear.assert_called_once()
 
     # Cleanup
     await updated.delete()
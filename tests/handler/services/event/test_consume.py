@@ -15,8 +15,8 @@
 
 import pytest
 
-from veaiops.handler.services.event.consume import consume_event
-from veaiops.schema.types import EventStatus
+from veaiops.handler.services.event.consume import consume_event, consume_events
+from veaiops.schema.types import AgentType, ChannelType, EventStatus
 
 
 @pytest.mark.asyncio
@@ -43,7 +43,7 @@ async def test_consume_event_success(mocker):
 
     # Verify the functions were called
     mock_subscription_matching.assert_called_once_with(mock_event)
-    mock_message_card_build.assert_called_once_with(mock_event)
+    mock_message_card_build.assert_called_once_with(mock_event, template_ids=None)
     mock_notification_dispatch.assert_called_once_with(mock_event)
 
 
@@ -122,3 +122,37 @@ async def test_consume_event_exception_handling(mocker):
 
     # Verify subscription_matching was called and the others were not
     mock_subscription_matching.assert_called_once_with(mock_event)
+
+
+@pytest.mark.asyncio
+async def test_consume_events_preloads_templates_and_isolates_failures(mocker):
+    """Test consume_events loads card templates once and keeps consuming when one event fails."""
+    # Mock the event objects
+    failing_event = mocker.MagicMock()
+    failing_event.id = "failing-event-id"
+    failing_event.agent_type = AgentType.INTELLIGENT_THRESHOLD
+    event = mocker.MagicMock()
+    event.id = "test-event-id"
+    event.agent_type = AgentType.INTELLIGENT_THRESHOLD
+
+    card_templates = {AgentType.INTELLIGENT_THRESHOLD: {ChannelType.Lark: "lark-template-id"}}
+    mock_get_card_templates = mocker.patch(
+        "veaiops.handler.services.event.consume.get_card_templates_by_agent_types",
+        mocker.AsyncMock(return_value=card_templates),
+    )
+
+    async def consume_side_effect(e, template_ids=None):
+        if e is failing_event:
+            raise Exception("Mock exception")
+
+    mock_consume_event = mocker.patch(
+        "veaiops.handler.services.event.consume.consume_event", side_effect=consume_side_effect
+    )
+
+    # Call the function
+    await consume_events([failing_event, event])
+
+    # Verify templates were loaded once and both events were consumed with them
+    mock_get_card_templates.assert_called_once_with({AgentType.INTELLIGENT_THRESHOLD})
+    assert mock_consume_event.call_count == 2
+    mock_consume_event.assert_any_call(event, template_ids={ChannelType.Lark: "lark-template-id"})
@@ -15,7 +15,12 @@
 
 import pytest
 
-from veaiops.handler.services.event.template import build_variables, get_card_templates, message_card_build
+from veaiops.handler.services.event.template import (
+    build_variables,
+    get_card_templates,
+    get_card_templates_by_agent_types,
+    message_card_build,
+)
 from veaiops.schema.base import LarkUrl, TemplateVariable
 from veaiops.schema.base.intelligent_threshold import (
     AliyunAlarmNotification,
@@ -83,6 +88,65 @@ async def test_get_card_templates_exception(mocker):
     assert result == {}
 
 
+@pytest.mark.asyncio
+async def test_get_card_templates_by_agent_types(mocker):
+    """Test get_card_templates_by_agent_types groups template ids by agent type."""
+    mock_template1 = mocker.MagicMock()
+    mock_template1.agent_type = AgentType.INTELLIGENT_THRESHOLD
+    mock_template1.channel = ChannelType.Lark
+    mock_template1.template_id = "threshold-template-id"
+
+    mock_template2 = mocker.MagicMock()
+    mock_template2.agent_type = AgentType.CHATOPS_INTEREST
+    mock_template2.channel = ChannelType.Lark
+    mock_template2.template_id = "interest-template-id"
+
+    mock_find = mocker.MagicMock()
+    mock_find.to_list = mocker.AsyncMock(return_value=[mock_template1, mock_template2])
+    mocker.patch.object(AgentTemplate, "find", return_value=mock_find)
+
+    result = await get_card_templates_by_agent_types(
+        [AgentType.INTELLIGENT_THRESHOLD, AgentType.CHATOPS_INTEREST, AgentType.CHATOPS_REACTIVE_REPLY]
+    )
+
+    assert result == {
+        AgentType.INTELLIGENT_THRESHOLD: {ChannelType.Lark: "threshold-template-id"},
+        AgentType.CHATOPS_INTEREST: {ChannelType.Lark: "interest-template-id"},
+        AgentType.CHATOPS_REACTIVE_REPLY: {},
+    }
+    AgentTemplate.find.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_message_card_build_with_preloaded_templates(mocker):
+    """Test message_card_build uses preloaded template ids without querying templates."""
+    mock_event = mocker.MagicMock()
+    mock_event.id = "test-event-id"
+    mock_event.agent_type = AgentType.INTELLIGENT_THRESHOLD
+    mock_event.raw_data = {}
+    mock_event.set = mocker.AsyncMock()
+
+    mock_get_card_templates = mocker.patch("veaiops.handler.services.event.template.get_card_templates")
+    mocker.patch(
+        "veaiops.handler.services.event.template.build_variables",
+        mocker.AsyncMock(
+            return_value=TemplateVariable(
+                event_id="test-event-id",
+                chat_id="",
+                button_name="test-button",
+                button_action="handle",
+                analysis="test-analysis",
+            )
+        ),
+    )
+
+    await message_card_build(mock_event, template_ids={ChannelType.Lark: "lark-template-id"})
+
+    mock_get_card_templates.assert_not_called()
+    args, _ = mock_event.set.call_args
+    assert args[0][Event.channel_msg][ChannelType.Lark].template_id == "lark-template-id"
+
+
 @pytest.mark.asyncio
 async def test_message_card_build(mocker):
     """Test message_card_build function."""
@@ -122,6 +186,8 @@ async def test_message_card_build(mocker):
     # Check that channel_msg contains both predefined Webhook and template channels
     channel_msg = args[0][Event.channel_msg]
     assert ChannelType.Webhook in channel_msg
+    assert channel_msg[ChannelType.Webhook].channel == ChannelType.Webhook
+    assert channel_msg[ChannelType.Webhook].template_id is None
     assert ChannelType.Lark in channel_msg
     assert ChannelType.DingTalk in channel_msg
 
@@ -377,3 +443,18 @@ async def test_build_variables_unknown_type(mocker):
     # Call the function and expect ValueError
     with pytest.raises(ValueError, match="Unknown agent type or raw_data format"):
         await build_variables(mock_event)
+
+
+@pytest.mark.asyncio
+async def test_build_variables_reactive_reply_without_reply_data(mocker):
+    """Test build_variables rejects reply agent events whose data is not an AgentReplyResp."""
+    mock_raw_data = mocker.MagicMock(spec=AgentNotification)
+    mock_raw_data.data = []
+
+    mock_event = mocker.MagicMock()
+    mock_event.id = "test-event-id"
+    mock_event.agent_type = AgentType.CHATOPS_REACTIVE_REPLY
+    mock_event.raw_data = mock_raw_data
+
+    with pytest.raises(ValueError, match="Unknown agent type or raw_data format"):
+        await build_variables(mock_event)
@@ -312,6 +312,46 @@ async def test_cleanup_old_alarm_sync_records():
     assert check is None
 
 
+@pytest.mark.asyncio
+async def test_cleanup_old_alarm_sync_records_in_batches():
+    """Test cleaning up old alarm sync records across multiple delete batches."""
+    # Arrange - create old records spanning several batches and one recent record
+    old_records = [
+        await AlarmSyncRecord(
+            task_id=PydanticObjectId(),
+            task_version_id=PydanticObjectId(),
+            total=1,
+            created=1,
+            updated=0,
+            deleted=0,
+            failed=0,
+            created_at=datetime.now(timezone.utc) - timedelta(days=40),
+        ).insert()
+        for _ in range(5)
+    ]
+    recent_record = await AlarmSyncRecord(
+        task_id=PydanticObjectId(),
+        task_version_id=PydanticObjectId(),
+        total=1,
+        created=1,
+        updated=0,
+        deleted=0,
+        failed=0,
+    ).insert()
+
+    # Act
+    deleted_count = await cleanup_old_alarm_sync_records(days_to_keep=30, batch_size=2)
+
+    # Assert
+    assert deleted_count == len(old_records)
+    for record in old_records:
+        assert await AlarmSyncRecord.get(record.id) is None
+    assert await AlarmSyncRecord.get(recent_record.id) is not None
+
+    # Cleanup
+    await recent_record.delete()
+
+
 @pytest.mark.asyncio
 async def test_sync_alarm_rules_service_task_not_found(mocker):
     """Test sync_alarm_rules_service when task is not found."""
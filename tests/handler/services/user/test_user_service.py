@@ -17,6 +17,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+from starlette.datastructures import State
 
 from veaiops.handler.errors import ForbiddenError, UnauthorizedError
 from veaiops.handler.services.user.user import (
@@ -84,6 +85,7 @@ async def test_get_current_supervisor_not_self_allowed(test_supervisor, test_use
     """Test get_current_supervisor_not_self with valid supervisor deleting other user."""
     # Arrange
     request = MagicMock()
+    request.state = State()
     request.path_params = {"user_id": str(test_user.id)}
 
     # Act
@@ -99,6 +101,7 @@ async def test_get_current_supervisor_not_self_forbidden(test_supervisor):
     """Test get_current_supervisor_not_self when trying to delete self."""
     # Arrange
     request = MagicMock()
+    request.state = State()
     request.path_params = {"user_id": str(test_supervisor.id)}
 
     # Act & Assert
@@ -113,6 +116,7 @@ async def test_get_current_user_password_only_allowed(test_user):
     """Test get_current_user_password_only when user updates own password."""
     # Arrange
     request = MagicMock()
+    request.state = State()
     request.path_params = {"user_id": str(test_user.id)}
 
     # Act
@@ -128,6 +132,7 @@ async def test_get_current_user_password_only_forbidden(test_user, test_regular_
     """Test get_current_user_password_only when user tries to update another user's password."""
     # Arrange
     request = MagicMock()
+    request.state = State()
     request.path_params = {"user_id": str(test_regular_user.id)}
 
     # Act & Assert
@@ -135,3 +140,18 @@ async def test_get_current_user_password_only_forbidden(test_user, test_regular_
         await get_current_user_password_only(request, test_user)
 
     assert "only update your own password" in str(exc_info.value.detail).lower()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_password_only_caches_user_id(test_user):
+    """Test current user id is stringified once and cached on request state."""
+    # Arrange
+    request = MagicMock()
+    request.state = State()
+    request.path_params = {"user_id": str(test_user.id)}
+
+    # Act
+    await get_current_user_password_only(request, test_user)
+
+    # Assert
+    assert request.state.current_user_id == str(test_user.id)
@@ -14,19 +14,31 @@
 
 """Tests for database lifespan management."""
 
+import asyncio
+import sys
+import time
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi import FastAPI
 from mongomock_motor import AsyncMongoMockClient
+from opentelemetry.semconv.trace import SpanAttributes
 
-from veaiops.lifespan.db import db_lifespan
+from veaiops.lifespan.db import MAX_STATEMENT_LENGTH, _build_statement_request_hook, db_lifespan
 from veaiops.settings import MongoSettings, O11ySettings, get_settings
 
+# Defaults of O11ySettings fields that mock settings of each test do not override
+_O11ySettingsDefaults = type(
+    "_O11ySettingsDefaults", (), {name: field.default for name, field in O11ySettings.model_fields.items()}
+)
+
 
 class _MockMongoClientWithClose:
     """Wrapper around AsyncMongoMockClient that provides async close()."""
 
-    def __init__(self, uri):
+    def __init__(self, uri, **kwargs):
         self._client = AsyncMongoMockClient(uri)
+        self.options = kwargs
 
     def __getattr__(self, name):
         return getattr(self._client, name)
@@ -59,7 +71,7 @@ async def test_db_lifespan_with_o11y_disabled(monkeypatch):
     app = FastAPI()
 
     # Mock O11y settings to be disabled
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = False
 
     def mock_get_settings(x):
@@ -76,7 +88,7 @@ async def test_db_lifespan_with_o11y_disabled(monkeypatch):
             instrument_called[0] = True
             return self
 
-    monkeypatch.setattr("veaiops.lifespan.db.PymongoInstrumentor", MockPymongoInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.pymongo.PymongoInstrumentor", MockPymongoInstrumentor)
 
     async with db_lifespan(app):
         # PymongoInstrumentor should not be called when O11y is disabled
@@ -90,7 +102,7 @@ async def test_db_lifespan_with_o11y_enabled(monkeypatch):
     app = FastAPI()
 
     # Mock O11y settings to be enabled
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
 
     def mock_get_settings(x):
@@ -101,17 +113,24 @@ async def test_db_lifespan_with_o11y_enabled(monkeypatch):
 
     # Track if PymongoInstrumentor was called
     instrument_called = [False]
+    captured_statement = []
+    captured_hooks = []
 
     class MockPymongoInstrumentor:
-        def instrument(self, capture_statement=True):
+        def instrument(self, capture_statement=True, **kwargs):
             instrument_called[0] = True
+            captured_statement.append(capture_statement)
+            captured_hooks.append(kwargs)
             return self
 
-    monkeypatch.setattr("veaiops.lifespan.db.PymongoInstrumentor", MockPymongoInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.pymongo.PymongoInstrumentor", MockPymongoInstrumentor)
 
     async with db_lifespan(app):
         # PymongoInstrumentor should be called when O11y is enabled
         assert instrument_called[0] is True
+        # Statements are not attached to spans unless explicitly enabled
+        assert captured_statement == [False]
+        assert captured_hooks == [{}]
         assert hasattr(app, "mongo_client")
 
 
@@ -228,3 +247,184 @@ async def test_db_lifespan_multiple_contexts(monkeypatch):
 
     async with db_lifespan(app2):
         assert hasattr(app2, "mongo_client")
+
+
+@pytest.mark.asyncio
+async def test_db_lifespan_pings_before_init_beanie(monkeypatch):
+    """Test that db lifespan warms the connection and forwards index options to init_beanie."""
+    app = FastAPI()
+    calls = []
+
+    class MockMongoClient(_MockMongoClientWithClose):
+        def __init__(self, uri, **kwargs):
+            super().__init__(uri, **kwargs)
+            self.admin = self
+
+        async def command(self, name):
+            calls.append(name)
+            return {"ok": 1.0}
+
+    async def mock_init_beanie(database, document_models=None, **kwargs):
+        calls.append(kwargs)
+
+    mongo_settings = get_settings(MongoSettings).model_copy(update={"skip_indexes": True})
+
+    def mock_get_settings(x):
+        return mongo_settings if x == MongoSettings else get_settings(x)
+
+    monkeypatch.setattr("veaiops.lifespan.db.get_settings", mock_get_settings)
+    monkeypatch.setattr("veaiops.lifespan.db.AsyncMongoClient", MockMongoClient)
+    monkeypatch.setattr("veaiops.lifespan.db.init_beanie", mock_init_beanie)
+
+    async with db_lifespan(app):
+        assert calls == [
+            "ping",
+            {"allow_index_dropping": False, "recreate_views": False, "skip_indexes": True},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_db_lifespan_client_pool_options(monkeypatch):
+    """Test that db lifespan creates the Mongo client with pool options from settings."""
+    app = FastAPI()
+    monkeypatch.setattr("veaiops.lifespan.db.AsyncMongoClient", _MockMongoClientWithClose)
+
+    async with db_lifespan(app):
+        options = getattr(app, "mongo_client").options
+        assert options == get_settings(MongoSettings).client_options
+        assert options["maxPoolSize"] == 200
+        assert options["minPoolSize"] == 10
+        assert options["compressors"] == "zstd,zlib"
+
+
+@pytest.mark.asyncio
+async def test_db_lifespan_closes_client_on_startup_failure(monkeypatch):
+    """Test that db lifespan closes the Mongo client when initialization fails."""
+    app = FastAPI()
+    closed = [False]
+
+    class MockMongoClient(_MockMongoClientWithClose):
+        async def close(self):
+            closed[0] = True
+
+    async def mock_init_beanie(database, document_models=None, **kwargs):
+        raise RuntimeError("init failed")
+
+    monkeypatch.setattr("veaiops.lifespan.db.AsyncMongoClient", MockMongoClient)
+    monkeypatch.setattr("veaiops.lifespan.db.init_beanie", mock_init_beanie)
+
+    with pytest.raises(RuntimeError, match="init failed"):
+        async with db_lifespan(app):
+            pass
+
+    assert closed[0] is True
+
+
+@pytest.mark.asyncio
+async def test_db_lifespan_capture_mongo_statement_uses_request_hook(monkeypatch):
+    """Test that statement capture is installed as a request hook instead of the instrumentor option."""
+    app = FastAPI()
+
+    class MockO11ySettings(_O11ySettingsDefaults):
+        enabled = True
+        capture_mongo_statement = True
+
+    def mock_get_settings(x):
+        return MockO11ySettings() if x == O11ySettings else get_settings(x)
+
+    captured = []
+
+    class MockPymongoInstrumentor:
+        def instrument(self, **kwargs):
+            captured.append(kwargs)
+
+    monkeypatch.setattr("veaiops.lifespan.db.get_settings", mock_get_settings)
+    monkeypatch.setattr("veaiops.lifespan.db.AsyncMongoClient", _MockMongoClientWithClose)
+    monkeypatch.setattr("opentelemetry.instrumentation.pymongo.PymongoInstrumentor", MockPymongoInstrumentor)
+
+    async with db_lifespan(app):
+        assert len(captured) == 1
+        assert captured[0]["capture_statement"] is False
+        assert callable(captured[0]["request_hook"])
+
+
+@pytest.mark.asyncio
+async def test_db_lifespan_capture_mongo_statement_without_command_mapping(monkeypatch):
+    """Test that statement capture falls back to the instrumentor option when its private mapping is missing."""
+    app = FastAPI()
+
+    class MockO11ySettings(_O11ySettingsDefaults):
+        enabled = True
+        capture_mongo_statement = True
+
+    def mock_get_settings(x):
+        return MockO11ySettings() if x == O11ySettings else get_settings(x)
+
+    captured = []
+
+    class MockPymongoInstrumentor:
+        def instrument(self, **kwargs):
+            captured.append(kwargs)
+
+    monkeypatch.setattr("veaiops.lifespan.db.get_settings", mock_get_settings)
+    monkeypatch.setattr("veaiops.lifespan.db.AsyncMongoClient", _MockMongoClientWithClose)
+    monkeypatch.setattr("opentelemetry.instrumentation.pymongo.PymongoInstrumentor", MockPymongoInstrumentor)
+    # A None entry makes importing the module raise ImportError
+    monkeypatch.setitem(sys.modules, "opentelemetry.instrumentation.pymongo.utils", None)
+
+    async with db_lifespan(app):
+        assert captured == [{"capture_statement": True}]
+
+
+def test_statement_request_hook_only_on_recording_spans():
+    """Test that the statement is serialized for sampled spans only."""
+    event = MagicMock()
+    event.command_name = "find"
+    event.command = {"find": "event", "filter": {"_id": {"$in": [1, 2]}}}
+
+    statement_request_hook = _build_statement_request_hook()
+
+    dropped_span = MagicMock()
+    dropped_span.is_recording.return_value = False
+    statement_request_hook(dropped_span, event)
+    dropped_span.set_attribute.assert_not_called()
+
+    sampled_span = MagicMock()
+    sampled_span.is_recording.return_value = True
+    statement_request_hook(sampled_span, event)
+    sampled_span.set_attribute.assert_called_once_with(SpanAttributes.DB_STATEMENT, "find {'_id': {'$in': [1, 2]}}")
+
+
+def test_statement_request_hook_truncates_long_statement():
+    """Test that large statements are cut off at the maximum length."""
+    event = MagicMock()
+    event.command_name = "find"
+    event.command = {"find": "event", "filter": {"_id": {"$in": list(range(10_000))}}}
+
+    span = MagicMock()
+    span.is_recording.return_value = True
+    _build_statement_request_hook()(span, event)
+
+    key, statement = span.set_attribute.call_args.args
+    assert key == SpanAttributes.DB_STATEMENT
+    assert len(statement) == MAX_STATEMENT_LENGTH
+    assert statement.startswith("find {'_id': {'$in': [0, 1, 2")
+
+
+@pytest.mark.asyncio
+async def test_db_lifespan_close_bounded_by_deadline(monkeypatch):
+    """Test that a hanging Mongo client close does not block shutdown beyond the deadline."""
+    app = FastAPI()
+
+    class MockMongoClient(_MockMongoClientWithClose):
+        async def close(self):
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr("veaiops.lifespan.db.AsyncMongoClient", MockMongoClient)
+    monkeypatch.setattr("veaiops.lifespan.db.MONGO_CLOSE_TIMEOUT", 0.05)
+
+    start = time.monotonic()
+    async with db_lifespan(app):
+        pass
+
+    assert time.monotonic() - start < 5
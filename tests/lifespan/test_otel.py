@@ -15,13 +15,31 @@
 """Tests for OpenTelemetry lifespan management."""
 
 import os
+import socket
+import threading
+import time
 
 import pytest
 from fastapi import FastAPI
-
-from veaiops.lifespan.otel import otel_lifespan
+from opentelemetry.exporter.otlp.proto.grpc.exporter import Compression
+from opentelemetry.util.http import parse_excluded_urls
+
+from veaiops.lifespan.otel import (
+    EXCLUDED_URLS,
+    OTLP_CHANNEL_OPTIONS,
+    OTLP_EXPORTER_TIMEOUT,
+    _metric_temporality,
+    _service_resource,
+    _shutdown_providers,
+    otel_lifespan,
+)
 from veaiops.settings import O11ySettings, get_settings
 
+# Defaults of O11ySettings fields that mock settings of each test do not override
+_O11ySettingsDefaults = type(
+    "_O11ySettingsDefaults", (), {name: field.default for name, field in O11ySettings.model_fields.items()}
+)
+
 
 @pytest.mark.asyncio
 async def test_otel_lifespan_with_o11y_disabled(monkeypatch):
@@ -29,7 +47,7 @@ async def test_otel_lifespan_with_o11y_disabled(monkeypatch):
     app = FastAPI()
 
     # Mock O11y settings to be disabled
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = False
 
     def mock_get_settings(x):
@@ -56,7 +74,7 @@ async def test_otel_lifespan_with_o11y_enabled(monkeypatch):
     app = FastAPI()
 
     # Mock O11y settings to be enabled
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "test_service"
         service_version = "1.0.0"
@@ -97,7 +115,7 @@ async def test_otel_lifespan_with_o11y_enabled(monkeypatch):
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", mock_set_tracer_provider)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", mock_set_meter_provider)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", mock_setup_logging)
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         # All initialization steps should have been called
@@ -115,7 +133,7 @@ async def test_otel_lifespan_resource_attributes(monkeypatch):
     """Test that otel lifespan creates resource with correct attributes."""
     app = FastAPI()
 
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "my_service"
         service_version = "2.0.0"
@@ -137,7 +155,10 @@ async def test_otel_lifespan_resource_attributes(monkeypatch):
         def add_span_processor(self, processor):
             pass
 
-    monkeypatch.setattr("veaiops.lifespan.otel.TracerProvider", MockTracerProvider)
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr("opentelemetry.sdk.trace.TracerProvider", MockTracerProvider)
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
@@ -151,7 +172,7 @@ async def test_otel_lifespan_resource_attributes(monkeypatch):
         def uninstrument_app(app):
             pass
 
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         # Verify resource attributes
@@ -169,7 +190,7 @@ async def test_otel_lifespan_trace_sampling(monkeypatch):
     """Test that otel lifespan configures correct sampling ratio."""
     app = FastAPI()
 
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "test_service"
         service_version = "1.0.0"
@@ -191,7 +212,10 @@ async def test_otel_lifespan_trace_sampling(monkeypatch):
         def add_span_processor(self, processor):
             pass
 
-    monkeypatch.setattr("veaiops.lifespan.otel.TracerProvider", MockTracerProvider)
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr("opentelemetry.sdk.trace.TracerProvider", MockTracerProvider)
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
@@ -205,7 +229,7 @@ async def test_otel_lifespan_trace_sampling(monkeypatch):
         def uninstrument_app(app):
             pass
 
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         # Verify sampler was created
@@ -217,7 +241,7 @@ async def test_otel_lifespan_batch_span_processor_config(monkeypatch):
     """Test that otel lifespan configures BatchSpanProcessor correctly."""
     app = FastAPI()
 
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "test_service"
         service_version = "1.0.0"
@@ -239,7 +263,10 @@ async def test_otel_lifespan_batch_span_processor_config(monkeypatch):
         def add_span_processor(self, processor):
             captured_processor[0] = processor
 
-    monkeypatch.setattr("veaiops.lifespan.otel.TracerProvider", MockTracerProvider)
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr("opentelemetry.sdk.trace.TracerProvider", MockTracerProvider)
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
@@ -253,19 +280,147 @@ async def test_otel_lifespan_batch_span_processor_config(monkeypatch):
         def uninstrument_app(app):
             pass
 
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         # Verify span processor was added
         assert captured_processor[0] is not None
 
 
+@pytest.mark.asyncio
+async def test_otel_lifespan_batch_span_processor_uses_settings(monkeypatch):
+    """Test that otel lifespan passes processor tuning from settings to BatchSpanProcessor."""
+    app = FastAPI()
+
+    class MockO11ySettings(_O11ySettingsDefaults):
+        enabled = True
+        exporter_otlp_endpoint = "http://localhost:4317"
+        max_queue_size = 8192
+        schedule_delay_millis = 500
+        max_export_batch_size = 128
+        export_timeout_millis = 3000
+
+    def mock_get_settings(x):
+        return MockO11ySettings() if x == O11ySettings else get_settings(x)
+
+    monkeypatch.setattr("veaiops.settings.get_settings", mock_get_settings)
+
+    captured_kwargs = [None]
+
+    def mock_batch_span_processor(exporter, **kwargs):
+        captured_kwargs[0] = kwargs
+
+    class MockTracerProvider:
+        def __init__(self, resource=None, sampler=None):
+            pass
+
+        def add_span_processor(self, processor):
+            pass
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr("opentelemetry.sdk.trace.export.BatchSpanProcessor", mock_batch_span_processor)
+    monkeypatch.setattr("opentelemetry.sdk.trace.TracerProvider", MockTracerProvider)
+    monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
+    monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
+    monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
+
+    class MockFastAPIInstrumentor:
+        @staticmethod
+        def instrument_app(app, excluded_urls=None):
+            pass
+
+        @staticmethod
+        def uninstrument_app(app):
+            pass
+
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
+
+    async with otel_lifespan(app):
+        assert captured_kwargs[0] == {
+            "max_queue_size": 8192,
+            "schedule_delay_millis": 500,
+            "max_export_batch_size": 128,
+            "export_timeout_millis": 3000,
+        }
+
+
+@pytest.mark.asyncio
+async def test_otel_lifespan_exporter_channel_options(monkeypatch):
+    """Test that otel lifespan configures transport and export options of both OTLP exporters and the reader."""
+    app = FastAPI()
+
+    class MockO11ySettings(_O11ySettingsDefaults):
+        enabled = True
+        exporter_otlp_endpoint = "http://localhost:4317"
+
+    def mock_get_settings(x):
+        return MockO11ySettings() if x == O11ySettings else get_settings(x)
+
+    monkeypatch.setattr("veaiops.settings.get_settings", mock_get_settings)
+
+    captured_kwargs = {}
+
+    def mock_exporter(name):
+        def _exporter(endpoint, **kwargs):
+            captured_kwargs[name] = kwargs
+
+        return _exporter
+
+    monkeypatch.setattr("opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter", mock_exporter("span"))
+    monkeypatch.setattr(
+        "opentelemetry.exporter.otlp.proto.grpc.metric_exporter.OTLPMetricExporter", mock_exporter("metric")
+    )
+    monkeypatch.setattr("opentelemetry.sdk.trace.export.BatchSpanProcessor", lambda exporter, **kwargs: None)
+    monkeypatch.setattr(
+        "opentelemetry.sdk.metrics.export.PeriodicExportingMetricReader",
+        lambda exporter, **kwargs: captured_kwargs.setdefault("reader", kwargs),
+    )
+    monkeypatch.setattr(
+        "opentelemetry.sdk.metrics.MeterProvider",
+        lambda resource=None, metric_readers=None: type("obj", (object,), {"shutdown": lambda self: None})(),
+    )
+    monkeypatch.setattr(
+        "opentelemetry.sdk.trace.TracerProvider",
+        lambda resource, sampler: type(
+            "obj", (object,), {"add_span_processor": lambda self, x: None, "shutdown": lambda self: None}
+        )(),
+    )
+    monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
+    monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
+    monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
+
+    class MockFastAPIInstrumentor:
+        @staticmethod
+        def instrument_app(app, excluded_urls=None):
+            pass
+
+        @staticmethod
+        def uninstrument_app(app):
+            pass
+
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
+
+    async with otel_lifespan(app):
+        assert captured_kwargs["span"]["channel_options"] == OTLP_CHANNEL_OPTIONS
+        assert captured_kwargs["metric"]["channel_options"] == OTLP_CHANNEL_OPTIONS
+        assert captured_kwargs["span"]["compression"] == Compression.Gzip
+        assert captured_kwargs["metric"]["compression"] == Compression.Gzip
+        assert captured_kwargs["span"]["timeout"] == OTLP_EXPORTER_TIMEOUT
+        assert captured_kwargs["metric"]["timeout"] == OTLP_EXPORTER_TIMEOUT
+        assert captured_kwargs["metric"]["preferred_temporality"] == _metric_temporality()
+        assert "preferred_temporality" not in captured_kwargs["span"]
+        assert captured_kwargs["reader"] == {"export_interval_millis": 10000, "export_timeout_millis": 5000}
+        assert ("grpc.max_send_message_length", 16 * 1024 * 1024) in OTLP_CHANNEL_OPTIONS
+
+
 @pytest.mark.asyncio
 async def test_otel_lifespan_metric_export_interval(monkeypatch):
     """Test that otel lifespan configures correct metric export interval."""
     app = FastAPI()
 
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "test_service"
         service_version = "1.0.0"
@@ -284,7 +439,10 @@ async def test_otel_lifespan_metric_export_interval(monkeypatch):
         def __init__(self, resource=None, metric_readers=None):
             captured_meter_provider[0] = {"resource": resource, "metric_readers": metric_readers}
 
-    monkeypatch.setattr("veaiops.lifespan.otel.MeterProvider", MockMeterProvider)
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr("opentelemetry.sdk.metrics.MeterProvider", MockMeterProvider)
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
@@ -298,7 +456,7 @@ async def test_otel_lifespan_metric_export_interval(monkeypatch):
         def uninstrument_app(app):
             pass
 
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         # Verify meter provider was created with metric readers
@@ -311,7 +469,7 @@ async def test_otel_lifespan_fastapi_instrumentation_excludes_urls(monkeypatch):
     """Test that FastAPI instrumentation excludes specific URLs."""
     app = FastAPI()
 
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "test_service"
         service_version = "1.0.0"
@@ -336,17 +494,19 @@ async def test_otel_lifespan_fastapi_instrumentation_excludes_urls(monkeypatch):
             pass
 
     monkeypatch.setattr(
-        "veaiops.lifespan.otel.TracerProvider",
-        lambda resource, sampler: type("obj", (object,), {"add_span_processor": lambda self, x: None})(),
+        "opentelemetry.sdk.trace.TracerProvider",
+        lambda resource, sampler: type(
+            "obj", (object,), {"add_span_processor": lambda self, x: None, "shutdown": lambda self: None}
+        )(),
     )
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         # Verify excluded URLs were set
-        assert captured_excluded_urls[0] == "/docs,/redoc"
+        assert captured_excluded_urls[0] == "/docs,/redoc,/openapi.json,/healthz"
 
 
 @pytest.mark.asyncio
@@ -377,7 +537,7 @@ async def test_otel_lifespan_cleanup_on_exit(monkeypatch):
     """Test that otel lifespan properly cleans up on exit."""
     app = FastAPI()
 
-    class MockO11ySettings:
+    class MockO11ySettings(_O11ySettingsDefaults):
         enabled = True
         service_name = "test_service"
         service_version = "1.0.0"
@@ -402,16 +562,63 @@ async def test_otel_lifespan_cleanup_on_exit(monkeypatch):
             uninstrument_called[0] = True
 
     monkeypatch.setattr(
-        "veaiops.lifespan.otel.TracerProvider",
-        lambda resource, sampler: type("obj", (object,), {"add_span_processor": lambda self, x: None})(),
+        "opentelemetry.sdk.trace.TracerProvider",
+        lambda resource, sampler: type(
+            "obj", (object,), {"add_span_processor": lambda self, x: None, "shutdown": lambda self: None}
+        )(),
     )
     monkeypatch.setattr("veaiops.lifespan.otel.trace.set_tracer_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.metrics.set_meter_provider", lambda x: None)
     monkeypatch.setattr("veaiops.lifespan.otel.setup_logging", lambda: None)
-    monkeypatch.setattr("veaiops.lifespan.otel.FastAPIInstrumentor", MockFastAPIInstrumentor)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", MockFastAPIInstrumentor)
 
     async with otel_lifespan(app):
         pass
 
     # After exiting context, uninstrument should be called
     assert uninstrument_called[0] is True
+
+
+@pytest.mark.asyncio
+async def test_shutdown_providers_bounded_by_deadline(monkeypatch):
+    """Test that a slow provider shutdown does not block beyond the shutdown deadline."""
+    monkeypatch.setattr("veaiops.lifespan.otel.PROVIDER_SHUTDOWN_TIMEOUT", 0.05)
+
+    shutdown_called = []
+
+    class FastProvider:
+        def shutdown(self):
+            shutdown_called.append("fast")
+
+    class SlowProvider:
+        def shutdown(self):
+            # Process exit must not wait for a shutdown that outlives the deadline
+            shutdown_called.append("slow" if threading.current_thread().daemon else "joined")
+            time.sleep(0.3)
+
+    start = time.monotonic()
+    await _shutdown_providers(FastProvider(), SlowProvider())
+
+    assert time.monotonic() - start < 0.3
+    assert sorted(shutdown_called) == ["fast", "slow"]
+
+
+def test_service_resource_is_shared():
+    """Test that the service resource is built once per service attributes and reused."""
+    first = _service_resource("test_service", "1.0.0", "test")
+    second = _service_resource("test_service", "1.0.0", "test")
+    other = _service_resource("test_service", "2.0.0", "test")
+
+    assert first is second
+    assert other is not first
+    assert first.attributes["host.name"] == socket.gethostname()
+
+
+def test_excluded_urls_cover_probe_and_docs():
+    """Test that health probes and API docs are not traced while business endpoints are."""
+    excluded = parse_excluded_urls(EXCLUDED_URLS)
+
+    assert excluded.url_disabled("http://localhost:8000/healthz")
+    assert excluded.url_disabled("http://localhost:8000/openapi.json")
+    assert excluded.url_disabled("http://localhost:8000/docs")
+    assert not excluded.url_disabled("http://localhost:8000/apis/v1/manager/event/")
@@ -12,16 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
+from pydantic import SecretStr, ValidationError
 
 from veaiops.metrics.aliyun import (
+    CLIENT_MAX_IDLE_CONNS,
+    DELETE_RULES_BATCH_SIZE,
+    LIST_RULES_PAGE_SIZE,
     AliyunClient,
     AliyunDataSource,
+    RuleSynchronizer,
+    clear_aliyun_client_cache,
+    get_aliyun_client,
 )
+from veaiops.metrics.base import get_executor
 from veaiops.schema.base.data_source import AliyunDataSourceConfig
 from veaiops.schema.documents import Connect
 from veaiops.schema.documents.datasource.base import DataSource as DataSourceDoc
@@ -250,6 +262,80 @@ async def test_aliyun_client_get_metric_data(aliyun_client):
         mock_aliyun_client.describe_metric_list_with_options.assert_called_once()
 
 
+def test_aliyun_client_shares_runtime_options(aliyun_client):
+    """Test that requests reuse the runtime options shared by all clients."""
+    with patch.object(aliyun_client, "_client") as mock_aliyun_client:
+        for _ in range(2):
+            aliyun_client.get_metric_data(
+                namespace="test_namespace",
+                metric_name="cpu.usage_active",
+                dimensions=None,
+                start_time="2023-01-01 00:00:00",
+                end_time="2023-01-01 01:00:00",
+            )
+
+        runtimes = [call.args[1] for call in mock_aliyun_client.describe_metric_list_with_options.call_args_list]
+        assert runtimes[0] is runtimes[1] is aliyun_client._runtime
+
+
+def test_aliyun_client_config_timeouts_and_pool(aliyun_client):
+    """Test that timeouts and the keep-alive pool size are configured once on the SDK client."""
+    assert aliyun_client._client._read_timeout == 10000
+    assert aliyun_client._client._connect_timeout == 5000
+    assert aliyun_client._client._max_idle_conns == CLIENT_MAX_IDLE_CONNS
+    assert aliyun_client._client._endpoint == "metrics.cn-beijing.aliyuncs.com"
+
+
+def test_aliyun_client_get_metric_data_serializes_dimensions(aliyun_client):
+    """Test that dimensions and express are sent as JSON strings."""
+    with patch.object(aliyun_client, "_client") as mock_aliyun_client:
+        aliyun_client.get_metric_data(
+            namespace="test_namespace",
+            metric_name="cpu.usage_active",
+            dimensions=[{"instanceId": "i-123"}],
+            start_time="2023-01-01 00:00:00",
+            end_time="2023-01-01 01:00:00",
+            express={"groupby": ["instanceId"]},
+        )
+
+        request = mock_aliyun_client.describe_metric_list_with_options.call_args.args[0]
+        assert json.loads(request.dimensions) == [{"instanceId": "i-123"}]
+        assert json.loads(request.express) == {"groupby": ["instanceId"]}
+
+        # Already serialized parameters are sent as is
+        aliyun_client.get_metric_data(
+            namespace="test_namespace",
+            metric_name="cpu.usage_active",
+            dimensions='[{"instanceId": "i-123"}]',
+            start_time="2023-01-01 00:00:00",
+            end_time="2023-01-01 01:00:00",
+        )
+
+        request = mock_aliyun_client.describe_metric_list_with_options.call_args.args[0]
+        assert request.dimensions == '[{"instanceId": "i-123"}]'
+        assert request.express == "{}"
+
+
+def test_get_aliyun_client_shared_per_credentials_and_region():
+    """Test that data sources with the same credentials and region share one client."""
+    clear_aliyun_client_cache()
+    # Connects loaded from the database carry the encrypted value as a plain SecretStr
+    encrypted_sk = SecretStr(EncryptedSecretStr("test_sk").get_secret_value())
+
+    first = get_aliyun_client("test_ak", encrypted_sk, "cn-beijing")
+    second = get_aliyun_client("test_ak", SecretStr(encrypted_sk.get_secret_value()), "cn-beijing")
+    other_region = get_aliyun_client("test_ak", encrypted_sk, "cn-hangzhou")
+
+    assert first is second
+    assert first is not other_region
+    assert other_region.region == "cn-hangzhou"
+    # The secret is decrypted for the client only, cache keys keep the encrypted value
+    assert first.access_key_secret == "test_sk"
+
+    clear_aliyun_client_cache()
+    assert get_aliyun_client("test_ak", encrypted_sk, "cn-beijing") is not first
+
+
 @pytest.mark.asyncio
 async def test_aliyun_client_get_existing_rules(aliyun_client):
     # Mock the client
@@ -350,7 +436,9 @@ async def test_aliyun_client_describe_contact_group_list(aliyun_client):
         result = aliyun_client.describe_contact_group_list(mock_request)
 
         assert result == mock_response
-        mock_aliyun_client.describe_contact_group_list_with_options.assert_called_once()
+        mock_aliyun_client.describe_contact_group_list_with_options.assert_called_once_with(
+            mock_request, AliyunClient._runtime
+        )
 
 
 @pytest.mark.asyncio
@@ -373,6 +461,7 @@ async def test_aliyun_datasource_concurrency_group(aliyun_data_source):
 
     assert "aliyun_" in result
     assert "test_ak" in result
+    assert aliyun_data_source.rule_concurrency_group == f"{result}_rule"
 
 
 @pytest.mark.asyncio
@@ -388,6 +477,25 @@ async def test_aliyun_datasource_get_group_key(aliyun_data_source):
     assert "Average" not in result
 
 
+def test_aliyun_datasource_convert_datapoints_mixed_fields(aliyun_data_source):
+    """Test that points whose fields differ from the rest of the page get their own group key."""
+    points = [
+        {"timestamp": 1672531260000, "Average": 1.0, "instanceId": "i-1"},
+        {"timestamp": 1672531260000, "Average": 2.0, "instanceId": "i-1", "device": "/dev/vda1"},
+        {"timestamp": 1672531320000, "instanceId": "i-1", "device": "/dev/vda1"},
+        {"timestamp": 1672531320000, "Average": 3.0, "instanceId": "i-1"},
+    ]
+    points[2]["Average"] = 4.0
+
+    result = aliyun_data_source._convert_datapoints_to_timeseries(points)
+
+    assert [ts["labels"] for ts in result] == [{"instanceId": "i-1"}, {"instanceId": "i-1", "device": "/dev/vda1"}]
+    assert result[0]["values"] == [1.0, 3.0]
+    assert result[1]["values"] == [2.0, 4.0]
+    # Keys are ordered by field name, also when one field name prefixes another
+    assert aliyun_data_source._get_group_key({"a-b": "2", "a": "1", "timestamp": 1}) == "a:1|a-b:2"
+
+
 @pytest.mark.asyncio
 async def test_aliyun_datasource_extract_labels(aliyun_data_source):
     """Test _extract_labels method."""
@@ -399,6 +507,24 @@ async def test_aliyun_datasource_extract_labels(aliyun_data_source):
     assert "Average" not in result
 
 
+def test_aliyun_datasource_convert_datapoints_interleaved_instances(aliyun_data_source):
+    """Test interleaved points are grouped per instance in first-seen order."""
+    points = [
+        {"timestamp": 1672531260000, "Average": "1.5", "instanceId": "i-2"},
+        {"timestamp": 1672531260000, "Average": 2, "instanceId": "i-1"},
+        {"timestamp": 1672531320999, "Average": "3.5", "instanceId": "i-2"},
+        {"timestamp": None, "Average": 4, "instanceId": "i-1"},
+    ]
+
+    result = aliyun_data_source._convert_datapoints_to_timeseries(points)
+
+    assert [ts["labels"] for ts in result] == [{"instanceId": "i-2"}, {"instanceId": "i-1"}]
+    assert result[0]["timestamps"] == [1672531260, 1672531320]
+    assert result[0]["values"] == [1.5, 3.5]
+    assert result[1]["timestamps"] == [1672531260]
+    assert result[1]["values"] == [2.0]
+
+
 @pytest.mark.asyncio
 async def test_aliyun_datasource_build_labels():
     """Test _build_labels static method."""
@@ -444,6 +570,46 @@ async def test_aliyun_datasource_create_escalations(aliyun_data_source):
     assert result.critical is None
     assert result.warn is None
     assert result.info is not None
+    assert result.info.comparison_operator == "GreaterThanThreshold"
+    assert result.info.threshold == "80.0"
+    assert result.info.times == 3
+
+    # Test unknown level
+    result = aliyun_data_source._create_escalations("unknown", params)
+    assert result.critical is None
+    assert result.warn is None
+    assert result.info is None
+
+
+def test_aliyun_datasource_generate_rules(aliyun_data_source):
+    """Test _generate_rules builds upper and lower rules sharing per-task fields."""
+    threshold_result = SimpleNamespace(
+        unique_key="key-1",
+        labels={"instanceId": "i-123"},
+        thresholds=[
+            SimpleNamespace(start_hour=0, end_hour=12, upper_bound=80.0, lower_bound=10.0, window_size=3),
+            SimpleNamespace(start_hour=12, end_hour=24, upper_bound=90.0, lower_bound=None, window_size=5),
+        ],
+    )
+    task_version = SimpleNamespace(result=[threshold_result])
+
+    rules = aliyun_data_source._generate_rules(
+        task_version=task_version, contact_group_ids=["g1", "g2"], webhook="http://hook", alarm_level="P0"
+    )
+
+    name = aliyun_data_source.name
+    assert list(rules) == [f"{name}-key-1-upper-0-12", f"{name}-key-1-lower-0-12", f"{name}-key-1-upper-12-24"]
+    upper = rules[f"{name}-key-1-upper-0-12"]
+    lower = rules[f"{name}-key-1-lower-0-12"]
+    assert upper.effective_interval == "00:00-12:00"
+    assert upper.contact_groups == "g1,g2"
+    assert upper.webhook == "http://hook"
+    assert json.loads(upper.resources) == [{"instanceId": "i-123"}]
+    assert upper.labels is lower.labels
+    assert upper.resources is lower.resources
+    assert upper.escalations.critical.comparison_operator == "GreaterThanThreshold"
+    assert lower.escalations.critical.comparison_operator == "LessThanThreshold"
+    assert lower.escalations.critical.threshold == "10.0"
 
 
 @pytest.mark.asyncio
@@ -465,8 +631,8 @@ async def test_aliyun_datasource_compare_rules():
 
     create_rules, update_rules, delete_rule_ids = AliyunDataSource._compare_rules(existing_rules, desired_rules)
 
-    assert len(create_rules) == 1
-    assert len(update_rules) == 2
+    assert create_rules == [desired_rules["rule4"]]
+    assert update_rules == [desired_rules["rule2"], desired_rules["rule3"]]
     assert delete_rule_ids == ["rule1"]
 
 
@@ -485,7 +651,8 @@ async def test_aliyun_datasource_put_rule(aliyun_data_source):
 
     assert result["rule_id"] == "test_rule_123"
     assert result["status"] == "success"
-    assert "response" in result
+    assert result["response"] is mock_response
+    mock_response.to_dict.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -514,7 +681,8 @@ async def test_aliyun_datasource_delete_rules(aliyun_data_source):
 
     assert result["rule_ids"] == rule_ids
     assert result["status"] == "success"
-    assert "response" in result
+    assert result["response"] is mock_response
+    mock_response.to_dict.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -541,11 +709,74 @@ async def test_aliyun_datasource_list_rules(aliyun_data_source):
 
     aliyun_data_source.client.get_existing_rules = MagicMock(return_value=mock_response)
 
-    result = aliyun_data_source._list_rules()
+    result = await aliyun_data_source._list_rules()
+
+    assert result == {"rule1": None, "rule2": None}
+    assert list(result) == ["rule1", "rule2"]
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_list_rules_fetches_all_pages(aliyun_data_source):
+    """Test _list_rules fetches every page reported by the first response."""
+    total = LIST_RULES_PAGE_SIZE * 2 + 1
+    requested_pages = []
+
+    def get_existing_rules(request):
+        requested_pages.append(request.page)
+        start = (request.page - 1) * request.page_size
+        response = MagicMock()
+        response.body.total = str(total)
+        response.body.alarms.alarm = [
+            SimpleNamespace(rule_id=f"rule{i}") for i in range(start, min(start + request.page_size, total))
+        ]
+        return response
+
+    aliyun_data_source.client.get_existing_rules = get_existing_rules
+
+    result = await aliyun_data_source._list_rules()
+
+    assert sorted(requested_pages) == [1, 2, 3]
+    assert len(result) == total
+    assert set(result) == {f"rule{i}" for i in range(total)}
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_list_rules_rate_limited(aliyun_data_source):
+    """Test _list_rules takes a rate limiter token for every page it fetches."""
+    total = LIST_RULES_PAGE_SIZE + 1
+
+    def get_existing_rules(request):
+        response = MagicMock()
+        response.body.total = str(total)
+        response.body.alarms.alarm = [SimpleNamespace(rule_id=f"rule{request.page}")]
+        return response
+
+    aliyun_data_source.client.get_existing_rules = get_existing_rules
+
+    with patch("veaiops.metrics.base.RateLimiter.acquire_token", new_callable=AsyncMock) as mock_acquire:
+        await aliyun_data_source._list_rules()
+
+    assert mock_acquire.await_count == 2
+    mock_acquire.assert_awaited_with(
+        f"{aliyun_data_source.concurrency_group}_rule", aliyun_data_source.get_concurrency_quota
+    )
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_list_rules_missing_rule_id(aliyun_data_source):
+    """Test _list_rules rejects alarms without a rule ID."""
+    mock_response = MagicMock()
+    mock_alarm1 = MagicMock()
+    mock_alarm1.rule_id = "rule1"
+    mock_alarm2 = MagicMock()
+    mock_alarm2.rule_id = None
+
+    mock_response.body.alarms.alarm = [mock_alarm1, mock_alarm2]
 
-    assert len(result) == 2
-    assert "rule1" in result
-    assert "rule2" in result
+    aliyun_data_source.client.get_existing_rules = MagicMock(return_value=mock_response)
+
+    with pytest.raises(ValueError, match="Rule ID is None"):
+        await aliyun_data_source._list_rules()
 
 
 @pytest.mark.asyncio
@@ -554,7 +785,7 @@ async def test_aliyun_datasource_list_rules_error(aliyun_data_source):
     aliyun_data_source.client.get_existing_rules = MagicMock(side_effect=Exception("List failed"))
 
     with pytest.raises(Exception, match="List failed"):
-        aliyun_data_source._list_rules()
+        await aliyun_data_source._list_rules()
 
 
 @pytest.mark.asyncio
@@ -582,6 +813,207 @@ async def test_aliyun_datasource_fetch_with_pagination(aliyun_data_source):
     assert time_series[0]["timestamps"] == [1672531260, 1672531320]
 
 
+@pytest.mark.asyncio
+async def test_aliyun_datasource_fetch_partial_data_uses_group_executor(aliyun_data_source):
+    """Test that blocking SDK calls run on the executor of the data source's concurrency group."""
+    thread_names = []
+
+    def get_metric_data(**kwargs):
+        thread_names.append(threading.current_thread().name)
+        return MagicMock()
+
+    aliyun_data_source.client.get_metric_data = MagicMock(side_effect=get_metric_data)
+
+    await aliyun_data_source.fetch_partial_data(
+        namespace="acs_ecs_dashboard",
+        metric_name="cpu_total",
+        dimensions=None,
+        start_time="2023-01-01 00:00:00",
+        end_time="2023-01-01 00:10:00",
+    )
+
+    assert thread_names[0].startswith("aliyun-cms")
+    executor = get_executor(aliyun_data_source.concurrency_group, aliyun_data_source.get_concurrency_quota)
+    assert executor is get_executor(aliyun_data_source.concurrency_group, aliyun_data_source.get_concurrency_quota)
+    assert executor._max_workers == aliyun_data_source.get_concurrency_quota
+
+
+@pytest.mark.asyncio
+async def test_aliyun_rule_synchronizer_runs_operations_concurrently(aliyun_data_source):
+    """Test that rule operations run in parallel on the rule executor instead of blocking the loop."""
+    barrier = threading.Barrier(2, timeout=5)
+    thread_names = []
+
+    def put_rule(self, rule):
+        thread_names.append(threading.current_thread().name)
+        # Only returns once both rules are being written at the same time
+        barrier.wait()
+        return {"rule_id": rule.rule_name}
+
+    rules = [MagicMock(rule_name="rule1"), MagicMock(rule_name="rule2")]
+    synchronizer = RuleSynchronizer(aliyun_data_source)
+    with patch.object(AliyunDataSource, "_put_rule", put_rule):
+        result = await synchronizer._execute_operations({"create": rules, "update": [], "delete": []})
+
+    assert all(name.startswith("aliyun-cms") for name in thread_names)
+    assert result["created"] == 2
+    assert result["failed"] == 0
+    assert sorted(op.rule_id for op in result["rule_operations"].create) == ["rule1", "rule2"]
+
+
+@pytest.mark.asyncio
+async def test_aliyun_rule_synchronizer_deletes_rules_in_batches(aliyun_data_source):
+    """Test that rule deletions are split into batches within the API limit."""
+    batches = []
+
+    def delete_rules(self, rule_ids):
+        batches.append(rule_ids)
+        return {"rule_ids": rule_ids}
+
+    rule_ids = [f"rule{i}" for i in range(DELETE_RULES_BATCH_SIZE * 2 + 5)]
+    synchronizer = RuleSynchronizer(aliyun_data_source)
+    with patch.object(AliyunDataSource, "_delete_rules", delete_rules):
+        result = await synchronizer._execute_operations({"create": [], "update": [], "delete": rule_ids})
+
+    assert sorted(len(batch) for batch in batches) == [5, DELETE_RULES_BATCH_SIZE, DELETE_RULES_BATCH_SIZE]
+    assert sorted(rule_id for batch in batches for rule_id in batch) == sorted(rule_ids)
+    assert result["deleted"] == len(rule_ids)
+    assert result["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_delete_all_rules_concurrent_batches(aliyun_data_source):
+    """Test that all rules are deleted in concurrent batches and throttled batches are retried."""
+    rule_ids = [f"rule{i}" for i in range(DELETE_RULES_BATCH_SIZE * 2)]
+    barrier = threading.Barrier(2, timeout=5)
+    attempted = set()
+    deleted = []
+
+    class ThrottlingError(Exception):
+        code = "Throttling.User"
+
+    def delete_rules(self, batch):
+        if batch[0] not in attempted:
+            attempted.add(batch[0])
+            # First attempts only return once both batches are being deleted at the same time
+            barrier.wait()
+            if batch[0] == rule_ids[0]:
+                raise ThrottlingError("Request was denied due to user flow control")
+        deleted.extend(batch)
+        return {"rule_ids": batch}
+
+    with (
+        patch.object(AliyunDataSource, "_list_rules", AsyncMock(return_value=dict.fromkeys(rule_ids))),
+        patch.object(AliyunDataSource, "_delete_rules", delete_rules),
+        patch("veaiops.metrics.aliyun.asyncio.sleep") as mock_sleep,
+    ):
+        await aliyun_data_source.delete_all_rules()
+
+    assert sorted(deleted) == sorted(rule_ids)
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_delete_all_rules_batch_size(aliyun_data_source):
+    """Test that delete_all_rules splits the rules by the given batch size."""
+    rule_ids = [f"rule{i}" for i in range(5)]
+    batches = []
+
+    def delete_rules(self, batch):
+        batches.append(batch)
+        return {"rule_ids": batch}
+
+    with (
+        patch.object(AliyunDataSource, "_list_rules", AsyncMock(return_value=dict.fromkeys(rule_ids))),
+        patch.object(AliyunDataSource, "_delete_rules", delete_rules),
+    ):
+        await aliyun_data_source.delete_all_rules(batch_size=2)
+
+    assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+    assert sorted(rule_id for batch in batches for rule_id in batch) == rule_ids
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_delete_all_rules_raises_on_failed_batch(aliyun_data_source):
+    """Test that failures other than throttling are not retried and fail the deletion."""
+    calls = []
+
+    def delete_rules(self, batch):
+        calls.append(batch)
+        raise ValueError("rule not found")
+
+    with (
+        patch.object(AliyunDataSource, "_list_rules", AsyncMock(return_value={"rule1": None})),
+        patch.object(AliyunDataSource, "_delete_rules", delete_rules),
+    ):
+        with pytest.raises(Exception, match="Failed to delete 1 of 1 rule batches: rule not found"):
+            await aliyun_data_source.delete_all_rules()
+
+    assert calls == [["rule1"]]
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_fetch_pagination_invalid_page_cancels_next(aliyun_data_source):
+    """Test that a page failing to parse stops pagination and cancels the prefetched next page."""
+    start = datetime(2023, 1, 1)
+    end = start + timedelta(minutes=10)
+
+    mock_response1 = MagicMock()
+    mock_response1.body.datapoints = "invalid json"
+    mock_response1.body.next_token = "token123"
+
+    async def fetch_partial_data(self, **kwargs):
+        if kwargs["next_token"] is None:
+            return mock_response1
+        await asyncio.sleep(10)
+
+    with patch.object(AliyunDataSource, "fetch_partial_data", fetch_partial_data):
+        with pytest.raises(Exception, match="Failed to parse JSON data from Aliyun API"):
+            await aliyun_data_source._fetch_aliyun_data(start, end)
+
+    # The cancelled prefetched page has been awaited, nothing may be left running
+    assert [task for task in asyncio.all_tasks() if task is not asyncio.current_task()] == []
+
+
+@pytest.mark.asyncio
+async def test_aliyun_datasource_fetch_one_slot_groups_pages_as_they_arrive(aliyun_data_source):
+    """Test that series spanning several pages are merged and a bad page cancels the prefetched one."""
+    start = datetime(2023, 1, 1)
+    end = start + timedelta(minutes=10)
+
+    pages = {
+        None: ('[{"timestamp": 1672531260000, "Average": 1.0, "instanceId": "i-1"}]', "token1"),
+        "token1": ('[{"timestamp": 1672531320000, "Average": 2.0, "instanceId": "i-1"}]', None),
+    }
+
+    async def fetch_partial_data(self, **kwargs):
+        response = MagicMock()
+        response.body.datapoints, response.body.next_token = pages[kwargs["next_token"]]
+        return response
+
+    with patch.object(AliyunDataSource, "fetch_partial_data", fetch_partial_data):
+        result = await aliyun_data_source._fetch_one_slot(start, end)
+
+    assert len(result) == 1
+    assert result[0]["timestamps"] == [1672531260, 1672531320]
+    assert result[0]["values"] == [1.0, 2.0]
+
+    async def fetch_partial_data_slow_next(self, **kwargs):
+        if kwargs["next_token"] is None:
+            response = MagicMock()
+            response.body.datapoints, response.body.next_token = pages[None]
+            return response
+        await asyncio.sleep(10)
+
+    with patch.object(AliyunDataSource, "fetch_partial_data", fetch_partial_data_slow_next):
+        with patch.object(AliyunDataSource, "_get_group_key", side_effect=ValueError("bad point")):
+            with pytest.raises(Exception, match="Failed to convert data from Aliyun API"):
+                await aliyun_data_source._fetch_one_slot(start, end)
+
+    await asyncio.sleep(0)
+    assert [task for task in asyncio.all_tasks() if task is not asyncio.current_task()] == []
+
+
 @pytest.mark.asyncio
 async def test_aliyun_datasource_fetch_with_group_by(test_aliyun_connect):
     """Test DataSource with group_by parameter."""
@@ -619,3 +1051,10 @@ async def test_aliyun_datasource_fetch_with_group_by(test_aliyun_connect):
         assert len(time_series) == 1
         assert time_series[0]["labels"]["InstanceId"] == "i-123"
         assert time_series[0]["labels"]["Region"] == "cn-beijing"
+        call_kwargs = mock_client_instance.get_metric_data.call_args.kwargs
+        assert json.loads(call_kwargs["express"]) == {"groupby": ["InstanceId", "Region"]}
+        assert call_kwargs["dimensions"] == "{}"
+
+    # Request parameters are serialized once at construction, the fields they derive from are frozen
+    with pytest.raises(ValidationError):
+        ds.group_by = ["InstanceId"]
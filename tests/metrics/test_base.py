@@ -15,6 +15,7 @@
 """Tests for DataSource base class."""
 
 from datetime import datetime
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -270,6 +271,45 @@ async def test_rate_limiter_multiple_acquisitions():
     assert True
 
 
+def test_get_executor_shared_per_group_and_size():
+    """Test executors are shared per concurrency group and never resized silently."""
+    from veaiops.metrics.base import get_executor
+
+    executor = get_executor("executor_group", 2, "test-executor")
+
+    assert get_executor("executor_group", 2) is executor
+    assert executor._max_workers == 2
+    assert get_executor("executor_group", 4)._max_workers == 4
+    assert get_executor("other_executor_group", 2) is not executor
+
+
+@pytest.mark.asyncio
+async def test_run_rate_limited_retries_on_429():
+    """Test run_rate_limited runs calls on the group executor and retries rate limited calls."""
+    import threading
+
+    from veaiops.metrics.base import RateLimiter, run_rate_limited
+
+    class RateLimitedError(Exception):
+        status = 429
+
+    thread_names = []
+
+    def call(value):
+        thread_names.append(threading.current_thread().name)
+        if len(thread_names) == 1:
+            raise RateLimitedError()
+        return value
+
+    with patch.object(RateLimiter, "penalize", new_callable=AsyncMock) as mock_penalize:
+        result = await run_rate_limited("run_group", 1000, "run-group", call, "done")
+
+    assert result == "done"
+    assert all(name.startswith("run-group") for name in thread_names)
+    assert len(thread_names) == 2
+    mock_penalize.assert_awaited_once_with("run_group", 1000)
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_decorator_with_callable_group(test_aliyun_connect):
     """Test rate_limit decorator with callable concurrency_group."""
@@ -325,6 +365,84 @@ async def test_rate_limit_decorator_with_async_quota(test_aliyun_connect):
     assert result == "async_data"
 
 
+@pytest.mark.asyncio
+async def test_rate_limiter_penalize_drains_bucket():
+    """Test RateLimiter penalize leaves the bucket below zero tokens."""
+    from veaiops.metrics.base import RateLimiter
+
+    # Arrange
+    group = "penalize_group"
+    qps = 1000
+
+    # Act
+    await RateLimiter.penalize(group, qps)
+
+    # Assert
+    assert RateLimiter._buckets[f"{group}_{qps}"]["tokens"] == -1.0
+    await RateLimiter.acquire_token(group, qps)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_decorator_retries_on_429():
+    """Test rate_limit decorator penalizes the bucket and retries rate limited calls."""
+    from veaiops.metrics.base import RateLimiter, rate_limit
+
+    class RateLimitedError(Exception):
+        status = 429
+
+    class TestDataSourceThrottled:
+        concurrency_group = "throttled_group"
+        get_concurrency_quota = 1000
+
+        def __init__(self):
+            self.calls = 0
+
+        @rate_limit
+        async def fetch_data(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise RateLimitedError()
+            return "data_fetched"
+
+    # Arrange
+    ds = TestDataSourceThrottled()
+
+    # Act
+    with patch.object(RateLimiter, "penalize", wraps=RateLimiter.penalize) as mock_penalize:
+        result = await ds.fetch_data()
+
+    # Assert
+    assert result == "data_fetched"
+    assert ds.calls == 2
+    mock_penalize.assert_awaited_once_with("throttled_group", 1000)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_decorator_does_not_retry_other_errors():
+    """Test rate_limit decorator re-raises errors that are not rate limits."""
+    from veaiops.metrics.base import rate_limit
+
+    class TestDataSourceFailing:
+        concurrency_group = "failing_group"
+        get_concurrency_quota = 1000
+
+        def __init__(self):
+            self.calls = 0
+
+        @rate_limit
+        async def fetch_data(self):
+            self.calls += 1
+            raise ValueError("boom")
+
+    # Arrange
+    ds = TestDataSourceFailing()
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="boom"):
+        await ds.fetch_data()
+    assert ds.calls == 1
+
+
 @pytest.mark.asyncio
 async def test_base_rule_synchronizer_execute_operations_success(test_aliyun_connect):
     """Test BaseRuleSynchronizer execute_operations with successful operations."""
@@ -0,0 +1,48 @@
+# Copyright 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for lazy exports of veaiops.metrics package."""
+
+import pytest
+
+import veaiops.metrics
+from veaiops.metrics.aliyun import AliyunDataSource
+from veaiops.metrics.volcengine import VolcengineDataSource
+from veaiops.metrics.zabbix import ZabbixDataSource
+
+
+def test_lazy_exports_resolve_to_vendor_classes():
+    """Test that vendor data sources are still importable from the package."""
+    from veaiops.metrics import (
+        AliyunDataSource as LazyAliyun,
+        VolcengineDataSource as LazyVolcengine,
+        ZabbixDataSource as LazyZabbix,
+    )
+
+    assert LazyAliyun is AliyunDataSource
+    assert LazyVolcengine is VolcengineDataSource
+    assert LazyZabbix is ZabbixDataSource
+
+
+def test_unknown_attribute_raises_attribute_error():
+    """Test that unknown attributes raise AttributeError."""
+    with pytest.raises(AttributeError, match="NotADataSource"):
+        getattr(veaiops.metrics, "NotADataSource")
+
+
+def test_lazy_export_cached_after_first_access():
+    """Test that a lazily imported data source is cached in the package namespace."""
+    veaiops.metrics.ZabbixDataSource
+
+    assert vars(veaiops.metrics)["ZabbixDataSource"] is ZabbixDataSource
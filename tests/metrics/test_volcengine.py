@@ -13,14 +13,20 @@
 # limitations under the License.
 
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import SecretStr
 
+from veaiops.metrics.base import generate_unique_key, get_executor
 from veaiops.metrics.volcengine import (
+    DELETE_RULES_BATCH_SIZE,
     VolcengineClient,
     VolcengineDataSource,
+    clear_volcengine_client_cache,
+    get_volcengine_client,
 )
 from veaiops.schema.documents.datasource.base import Connect
 from veaiops.utils.crypto import EncryptedSecretStr
@@ -205,6 +211,34 @@ def test_volcengine_data_source_fetch_one_slot_error_handling(volcengine_data_so
         asyncio.run(volcengine_data_source._fetch_one_slot(start, end))
 
 
+@pytest.mark.asyncio
+async def test_volcengine_data_source_fetch_partial_data_uses_group_executor(volcengine_data_source):
+    """Test that blocking SDK calls run on the executor of the data source's concurrency group."""
+    thread_names = []
+
+    def get_metric_data(**kwargs):
+        thread_names.append(threading.current_thread().name)
+        return {}
+
+    volcengine_data_source.client.get_metric_data = MagicMock(side_effect=get_metric_data)
+
+    await volcengine_data_source.fetch_partial_data(
+        namespace="VCM_ECS",
+        sub_namespace="ecs",
+        metric_name="CpuUtil",
+        start_time=1640000000,
+        end_time=1640000060,
+        period="60s",
+    )
+
+    assert thread_names[0].startswith("volc-observe")
+    executor = get_executor(volcengine_data_source.concurrency_group, volcengine_data_source.get_concurrency_quota)
+    assert executor is get_executor(
+        volcengine_data_source.concurrency_group, volcengine_data_source.get_concurrency_quota
+    )
+    assert executor._max_workers == volcengine_data_source.get_concurrency_quota
+
+
 # Tests for VolcengineClient
 @pytest.fixture
 def volcengine_client(mock_volcengine_api):
@@ -223,6 +257,26 @@ def volcengine_client(mock_volcengine_api):
     return client
 
 
+def test_get_volcengine_client_shared_per_credentials_and_region():
+    """Test that data sources with the same credentials and region share one client."""
+    clear_volcengine_client_cache()
+    # Connects loaded from the database carry the encrypted value as a plain SecretStr
+    encrypted_sk = SecretStr(EncryptedSecretStr("test_sk").get_secret_value())
+
+    first = get_volcengine_client("test_ak", encrypted_sk, "cn-beijing")
+    second = get_volcengine_client("test_ak", SecretStr(encrypted_sk.get_secret_value()), "cn-beijing")
+    other_region = get_volcengine_client("test_ak", encrypted_sk, "cn-shanghai")
+
+    assert first is second
+    assert first is not other_region
+    assert other_region.region == "cn-shanghai"
+    # The secret is decrypted for the client only, cache keys keep the encrypted value
+    assert first.sk == "test_sk"
+
+    clear_volcengine_client_cache()
+    assert get_volcengine_client("test_ak", encrypted_sk, "cn-beijing") is not first
+
+
 def test_volcengine_client_create_rule(volcengine_client, mock_volcengine_api):
     # Mock response
     mock_response = MagicMock()
@@ -330,6 +384,15 @@ def test_volcengine_data_source_generate_unique_key_from_rule():
     assert isinstance(result, str)
     assert len(result) > 0
 
+    # The key matches the unique key generated for the time series of the same labels
+    mock_rule.conditions = [MagicMock(metric_name="CpuUtil")]
+    mock_rule.original_dimensions = {"Region": ["cn-beijing"], "InstanceId": ["i-123", "i-456"], "Empty": []}
+    result = VolcengineDataSource._generate_unique_key_from_rule(mock_rule)
+    assert result == generate_unique_key("CpuUtil", {"InstanceId": "i-123", "Region": "cn-beijing"})
+
+    mock_rule.original_dimensions = {"Empty": []}
+    assert VolcengineDataSource._generate_unique_key_from_rule(mock_rule) == "Unknown"
+
 
 @pytest.mark.asyncio
 async def test_volcengine_data_source_sync_rules_for_intelligent_threshold_task(volcengine_data_source):
@@ -349,7 +412,7 @@ async def test_volcengine_data_source_sync_rules_for_intelligent_threshold_task(
     mock_task_version.threshold_config.window_size = 3
 
     # Mock client methods
-    with patch.object(volcengine_data_source.client, "list_all_rules", return_value=[]):
+    with patch.object(VolcengineDataSource, "_list_rules", AsyncMock(return_value=[])):
         with patch.object(volcengine_data_source.client, "create_rule", return_value={"rule_id": "test_rule_id"}):
             result = await volcengine_data_source.sync_rules_for_intelligent_threshold_task(
                 task=mock_task,
@@ -365,6 +428,230 @@ async def test_volcengine_data_source_sync_rules_for_intelligent_threshold_task(
             assert "deleted" in result
 
 
+def test_volcengine_rule_synchronizer_request_template_reused(volcengine_data_source):
+    """Test the shared request fields are built once per config."""
+    from veaiops.metrics.volcengine import RuleSynchronizer
+    from veaiops.schema.types import EventLevel
+
+    config = MagicMock()
+    config.alert_methods = ["Email"]
+    config.webhook = "http://example.com/webhook"
+    config.contact_group_ids = ["group1"]
+    config.alarm_level = EventLevel.P1
+    config.default_silence_time = 5
+    config.task.projects = ["project1"]
+
+    synchronizer = RuleSynchronizer(volcengine_data_source)
+    with patch.object(RuleSynchronizer, "_build_tags", wraps=RuleSynchronizer._build_tags) as mock_build_tags:
+        template = synchronizer._get_request_template(config)
+        assert synchronizer._get_request_template(config) is template
+
+    mock_build_tags.assert_called_once_with(config)
+    assert template["alert_methods"] == ["Email", "Webhook"]
+    assert template["level"] == "warning"
+    assert template["contact_group_ids"] == ["group1"]
+
+    # A different config rebuilds the template
+    other_config = MagicMock(alert_methods=None, webhook=None, contact_group_ids=None, alarm_level=EventLevel.P0)
+    other_template = synchronizer._get_request_template(other_config)
+    assert other_template is not template
+    assert other_template["alert_methods"] == []
+    assert other_template["level"] == "critical"
+
+
+def test_volcengine_rule_synchronizer_format_time_range():
+    """Test format_time_range output and caching."""
+    from veaiops.metrics.volcengine import RuleSynchronizer
+
+    assert RuleSynchronizer.format_time_range(0, 24) == ("00:00", "23:59")
+    assert RuleSynchronizer.format_time_range(8, 18) == ("08:00", "17:59")
+    assert RuleSynchronizer.format_time_range(18, 8) == ("00:00", "23:59")
+
+    hits = RuleSynchronizer.format_time_range.cache_info().hits
+    assert RuleSynchronizer.format_time_range(8, 18) == ("08:00", "17:59")
+    assert RuleSynchronizer.format_time_range.cache_info().hits == hits + 1
+
+
+def test_volcengine_rule_synchronizer_metric_unit_resolved_once(volcengine_data_source):
+    """Test the metric unit is looked up once for all conditions of a synchronization."""
+    from veaiops.metrics.volcengine import RuleSynchronizer
+
+    config = MagicMock(default_unit="Percent", default_period="60")
+    threshold = MagicMock(upper_bound=90.0, lower_bound=10.0)
+
+    synchronizer = RuleSynchronizer(volcengine_data_source)
+    with patch("veaiops.metrics.volcengine.volcengine_metric_cache") as mock_cache:
+        mock_cache.get_metric_by_name.return_value = MagicMock(unit="Count")
+        create_conditions = synchronizer._build_create_conditions(threshold, config)
+        update_conditions = synchronizer._build_update_conditions(threshold, config)
+
+    mock_cache.get_metric_by_name.assert_called_once_with(volcengine_data_source.metric_name)
+    assert [c.metric_unit for c in create_conditions + update_conditions] == ["Count"] * 4
+
+
+@pytest.mark.asyncio
+async def test_volcengine_rule_synchronizer_retries_rate_limited_delete(volcengine_data_source):
+    """Test a rule operation rejected with HTTP 429 penalizes the rate limiter and is retried."""
+    from veaiops.metrics.base import RateLimiter
+    from veaiops.metrics.volcengine import RuleSynchronizer
+
+    class RateLimitedError(Exception):
+        status = 429
+
+    volcengine_data_source.client.delete_rules = MagicMock(side_effect=[RateLimitedError(), {}])
+    synchronizer = RuleSynchronizer(volcengine_data_source)
+
+    with patch.object(RateLimiter, "penalize", new_callable=AsyncMock) as mock_penalize:
+        result = await synchronizer._delete_rules_wrapper(["rule1"])
+
+    assert result["status"] == "success"
+    assert volcengine_data_source.client.delete_rules.call_count == 2
+    mock_penalize.assert_awaited_once_with(synchronizer.concurrency_group, synchronizer.get_concurrency_quota)
+
+
+@pytest.mark.asyncio
+async def test_volcengine_rule_synchronizer_runs_operations_on_rule_executor(volcengine_data_source):
+    """Test rule operations run their blocking SDK call on the rule executor of the account."""
+    from veaiops.metrics.volcengine import RuleSynchronizer
+
+    thread_names = []
+
+    def update_rule(request):
+        thread_names.append(threading.current_thread().name)
+        return {}
+
+    volcengine_data_source.client.update_rule = MagicMock(side_effect=update_rule)
+    synchronizer = RuleSynchronizer(volcengine_data_source)
+
+    with patch.object(RuleSynchronizer, "_build_update_request", return_value=MagicMock()):
+        result = await synchronizer._update_rule_wrapper({"rule_name": "rule"}, "rule1", MagicMock())
+
+    assert result["status"] == "success"
+    assert thread_names[0].startswith("volc-observe")
+    executor = get_executor(synchronizer.concurrency_group, synchronizer.get_concurrency_quota)
+    assert executor is not get_executor(
+        volcengine_data_source.concurrency_group, volcengine_data_source.get_concurrency_quota
+    )
+
+
+def _list_rules_pages(total: int):
+    """Build a list_rules side effect serving `total` rules page by page."""
+    requested_pages = []
+
+    def list_rules(page_number, page_size, **kwargs):
+        requested_pages.append(page_number)
+        start = (page_number - 1) * page_size
+        response = MagicMock()
+        response.data = [
+            MagicMock(id=f"id{i}", rule_id=f"rule{i}") for i in range(start, min(start + page_size, total))
+        ]
+        response.total_count = total
+        return response
+
+    return list_rules, requested_pages
+
+
+@pytest.mark.asyncio
+async def test_volcengine_data_source_list_rules(volcengine_data_source):
+    """Test _list_rules fetches every page reported by the first response, one rule group token per page."""
+    list_rules, requested_pages = _list_rules_pages(5)
+    volcengine_data_source.client.list_rules = MagicMock(side_effect=list_rules)
+
+    with patch("veaiops.metrics.base.RateLimiter.acquire_token", new_callable=AsyncMock) as mock_acquire:
+        result = await volcengine_data_source._list_rules(enable_state=["enable"], batch_size=2)
+
+    assert sorted(requested_pages) == [1, 2, 3]
+    assert [rule.rule_id for rule in result] == [f"rule{i}" for i in range(5)]
+    assert mock_acquire.await_count == 3
+    mock_acquire.assert_awaited_with(
+        volcengine_data_source.rule_concurrency_group, volcengine_data_source.get_concurrency_quota
+    )
+    call_kwargs = volcengine_data_source.client.list_rules.call_args.kwargs
+    assert call_kwargs["rule_name"] == volcengine_data_source.name
+    assert call_kwargs["namespace"] == [volcengine_data_source.namespace]
+    assert call_kwargs["enable_state"] == ["enable"]
+
+
+@pytest.mark.asyncio
+async def test_volcengine_data_source_list_rules_ids_only_retries_rate_limited_page(volcengine_data_source):
+    """Test _list_rules returns only the rule IDs and retries a page rejected with HTTP 429."""
+    from veaiops.metrics.base import RateLimiter
+
+    class RateLimitedError(Exception):
+        status = 429
+
+    list_rules, _ = _list_rules_pages(3)
+    throttled = []
+
+    def list_rules_throttled_once(page_number, page_size, **kwargs):
+        if not throttled:
+            throttled.append(page_number)
+            raise RateLimitedError()
+        return list_rules(page_number, page_size, **kwargs)
+
+    volcengine_data_source.client.list_rules = MagicMock(side_effect=list_rules_throttled_once)
+
+    with patch.object(RateLimiter, "penalize", new_callable=AsyncMock) as mock_penalize:
+        result = await volcengine_data_source._list_rules(ids_only=True, batch_size=2)
+
+    assert result == ["id0", "id1", "id2"]
+    mock_penalize.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_volcengine_data_source_delete_all_rules(volcengine_data_source):
+    """Test delete_all_rules deletes every rule in batches."""
+    rule_ids = [f"rule{i}" for i in range(DELETE_RULES_BATCH_SIZE * 2 + 1)]
+    volcengine_data_source.client.delete_rules = MagicMock(return_value={})
+
+    with patch.object(VolcengineDataSource, "_list_rules", AsyncMock(return_value=rule_ids)) as mock_list_rules:
+        await volcengine_data_source.delete_all_rules()
+
+    assert mock_list_rules.await_args.kwargs["ids_only"] is True
+    batches = [call.args[0] for call in volcengine_data_source.client.delete_rules.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [1, DELETE_RULES_BATCH_SIZE, DELETE_RULES_BATCH_SIZE]
+    assert sorted(rule_id for batch in batches for rule_id in batch) == sorted(rule_ids)
+
+
+@pytest.mark.asyncio
+async def test_volcengine_data_source_delete_all_rules_retries_rate_limited_batch(volcengine_data_source):
+    """Test delete_all_rules throttles every batch and retries a batch rejected with HTTP 429."""
+    from veaiops.metrics.base import RateLimiter
+
+    class RateLimitedError(Exception):
+        status = 429
+
+    rule_ids = [f"rule{i}" for i in range(DELETE_RULES_BATCH_SIZE + 1)]
+    volcengine_data_source.client.delete_rules = MagicMock(side_effect=[RateLimitedError(), {}, {}])
+
+    with (
+        patch.object(VolcengineDataSource, "_list_rules", AsyncMock(return_value=rule_ids)),
+        patch.object(RateLimiter, "acquire_token", new_callable=AsyncMock) as mock_acquire,
+        patch.object(RateLimiter, "penalize", new_callable=AsyncMock) as mock_penalize,
+    ):
+        await volcengine_data_source.delete_all_rules()
+
+    assert volcengine_data_source.client.delete_rules.call_count == 3
+    assert mock_acquire.await_count == 3
+    mock_acquire.assert_awaited_with(
+        volcengine_data_source.rule_concurrency_group, volcengine_data_source.get_concurrency_quota
+    )
+    mock_penalize.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_volcengine_data_source_delete_all_rules_raises_on_failed_batch(volcengine_data_source):
+    """Test delete_all_rules reports failed batches after attempting all of them."""
+    rule_ids = [f"rule{i}" for i in range(DELETE_RULES_BATCH_SIZE + 1)]
+    volcengine_data_source.client.delete_rules = MagicMock(side_effect=[ValueError("rule not found"), {}])
+
+    with patch.object(VolcengineDataSource, "_list_rules", AsyncMock(return_value=rule_ids)):
+        with pytest.raises(Exception, match="Failed to delete 1 of 2 rule batches: rule not found"):
+            await volcengine_data_source.delete_all_rules()
+
+    assert volcengine_data_source.client.delete_rules.call_count == 2
+
+
 def test_volcengine_data_source_convert_datapoints_to_timeseries(volcengine_data_source):
     """Test convert_datapoints_to_timeseries method."""
     start = datetime(2023, 1, 1)
@@ -409,6 +696,30 @@ def test_volcengine_data_source_conversion_helpers(volcengine_data_source):
     assert len(timestamps) == 2 and len(values) == 2
     assert timestamps[0] == 1640000000 and values[0] == 10.5
 
+    # Millisecond timestamps are converted to seconds
+    timestamps, values = VolcengineDataSource._extract_timestamps_and_values({"timestamp": 1640000060500, "value": 1})
+    assert timestamps == [1640000060] and values == [1.0]
+    assert all(type(timestamp) is int for timestamp in timestamps)
+
+    with pytest.raises(Exception, match="Data point is not a dictionary"):
+        VolcengineDataSource._extract_timestamps_and_values([data_points[0], "invalid"])
+
+    # None and non-numeric values fail instead of turning into NaN
+    with pytest.raises(Exception, match="Failed to convert data from Volcengine API: .* None at index 1"):
+        VolcengineDataSource._extract_timestamps_and_values([data_points[0], {"timestamp": 1640000120, "value": None}])
+    with pytest.raises(Exception, match="Failed to convert data from Volcengine API"):
+        VolcengineDataSource._extract_timestamps_and_values([{"timestamp": 1640000000, "value": "n/a"}])
+
+    # Test _extract_labels skips malformed dimensions and fills empty values
+    dimensions = [
+        {"name": "InstanceId", "value": "i-123"},
+        {"name": "Region", "value": ""},
+        {"name": "Zone"},
+        "invalid",
+    ]
+    assert VolcengineDataSource._extract_labels(dimensions) == {"InstanceId": "i-123", "Region": "unknown"}
+    assert VolcengineDataSource._extract_labels(None) == {}
+
     # Test api_instance property initialization
     client = VolcengineClient(ak="test_ak", sk="test_sk", region="cn-beijing")
     api = client.api_instance
@@ -438,6 +749,28 @@ def test_volcengine_client_get_metric_data_with_instances():
         assert "data" in result
 
 
+def test_volcengine_client_get_metric_data_reuses_api_per_region():
+    """Test get_metric_data creates one API instance per region and reuses it."""
+    client = VolcengineClient(ak="test_ak", sk="test_sk", region="cn-beijing")
+
+    with patch("veaiops.metrics.volcengine.VOLCOBSERVEApi") as mock_api_class:
+        mock_api_class.return_value.get_metric_data.return_value.to_dict.return_value = {"data": {}}
+
+        for region in (None, "cn-beijing", "cn-shanghai", "cn-shanghai"):
+            client.get_metric_data(
+                namespace="VCM_ECS",
+                sub_namespace="ecs",
+                metric_name="CpuUsagePercent",
+                start_time=1640000000,
+                end_time=1640000060,
+                period="60",
+                region=region,
+            )
+
+        assert mock_api_class.call_count == 2
+        assert mock_api_class.return_value.get_metric_data.call_count == 4
+
+
 def test_volcengine_client_operations_without_region():
     """Test various client operations raise error when region is not provided."""
     client = VolcengineClient(ak="test_ak", sk="test_sk")
@@ -0,0 +1,45 @@
+# Copyright 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for settings registry."""
+
+import pytest
+from pydantic_settings import BaseSettings
+
+from veaiops.settings.registry import get_settings, init_settings
+
+
+class _RegistryTestSettings(BaseSettings):
+    value: int = 1
+
+
+class _UnregisteredSettings(BaseSettings):
+    value: int = 1
+
+
+def test_get_settings_returns_registered_instance():
+    """Test that get_settings returns the instance built by init_settings every time."""
+    init_settings(_RegistryTestSettings)
+
+    first = get_settings(_RegistryTestSettings)
+    second = get_settings(_RegistryTestSettings)
+
+    assert first is second
+    assert first.value == 1
+
+
+def test_get_settings_unregistered_raises():
+    """Test that get_settings raises RuntimeError for an unregistered settings class."""
+    with pytest.raises(RuntimeError, match="_UnregisteredSettings not registered"):
+        get_settings(_UnregisteredSettings)
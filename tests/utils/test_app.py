@@ -107,6 +107,37 @@ async def test_combine_lifespans_multiple():
     assert shutdown_order == ["lifespan3", "lifespan2", "lifespan1"]
 
 
+@pytest.mark.asyncio
+async def test_combine_lifespans_startup_failure_cleans_up_entered():
+    """Test that a failing lifespan startup still shuts down the lifespans entered before it."""
+    shutdown_order = []
+
+    @asynccontextmanager
+    async def lifespan1(app: FastAPI) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            shutdown_order.append("lifespan1")
+
+    @asynccontextmanager
+    async def lifespan2(app: FastAPI) -> AsyncGenerator[None, None]:
+        raise RuntimeError("startup failed")
+        yield
+
+    @asynccontextmanager
+    async def lifespan3(app: FastAPI) -> AsyncGenerator[None, None]:
+        shutdown_order.append("lifespan3 entered")
+        yield
+
+    combined = combine_lifespans(lifespan1, lifespan2, lifespan3)
+
+    with pytest.raises(RuntimeError, match="startup failed"):
+        async with combined(FastAPI()):
+            pass
+
+    assert shutdown_order == ["lifespan1"]
+
+
 def test_create_fastapi_app_minimal():
     """Test creating a FastAPI app with minimal configuration."""
     app = create_fastapi_app(title="Test App")
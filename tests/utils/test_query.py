@@ -0,0 +1,41 @@
+# Copyright 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for query utilities."""
+
+from datetime import datetime, timezone
+
+from veaiops.schema.models.base import TimeRange
+from veaiops.utils.query import time_range_filter
+
+
+def test_time_range_filter():
+    """Test epoch seconds are converted to an inclusive UTC datetime range."""
+    result = time_range_filter(TimeRange(start_time=0, end_time=3600))
+
+    assert result == {
+        "$gte": datetime(1970, 1, 1, 0, 0, tzinfo=timezone.utc),
+        "$lte": datetime(1970, 1, 1, 1, 0, tzinfo=timezone.utc),
+    }
+
+
+def test_time_range_filter_returns_new_dict():
+    """Test repeated calls over the same range do not share the returned dict."""
+    time_range = TimeRange(start_time=100, end_time=200)
+
+    first = time_range_filter(time_range)
+    first["$lte"] = None
+    second = time_range_filter(time_range)
+
+    assert second["$lte"] == datetime.fromtimestamp(200, tz=timezone.utc)
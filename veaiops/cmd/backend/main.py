@@ -44,7 +44,6 @@ def get_app():
     Imports are placed inside this function to ensure settings are initialized first.
     """
     from fastapi.middleware.cors import CORSMiddleware
-    from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
     from starlette.middleware import Middleware
     from starlette_context import plugins
     from starlette_context.middleware import RawContextMiddleware
@@ -81,6 +80,8 @@ def get_app():
     ]
 
     if o11y_settings.enabled:
+        from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
+
         middlewares.insert(2, Middleware(OpenTelemetryMiddleware))  # type: ignore
 
     fastapi_app = create_fastapi_app(
@@ -25,7 +25,7 @@ from veaiops.handler.services.event import (
     convert_proactive_to_event,
     convert_reactive_to_event,
 )
-from veaiops.handler.services.event.consume import consume_event
+from veaiops.handler.services.event.consume import consume_event, consume_events
 from veaiops.handler.services.event.converter.intelligent_threshold import convert_intelligent_threshold_alarm_to_event
 from veaiops.schema.base.intelligent_threshold import (
     AliyunAlarmNotification,
@@ -168,9 +168,9 @@ async def create_volcengine_intelligent_threshold_event(
         logger.info("No event created due to conversion failure")
         raise BadRequestError(message="Failed to convert alarm to event")
 
+    # Trigger the consumption process in the background
+    background_tasks.add_task(consume_events, events=events)
     for event in events:
-        # Trigger the consumption process in the background
-        background_tasks.add_task(consume_event, event=event)
         logger.info(f"Intelligent threshold event {event.id} created or updated successfully")
 
     return APIResponse(data=",".join(str(event.id) for event in events))
@@ -190,9 +190,9 @@ async def create_zabbix_intelligent_threshold_event(
         logger.info("No event created due to conversion failure")
         raise BadRequestError(message="Failed to convert alarm to event")
 
+    # Trigger the consumption process in the background
+    background_tasks.add_task(consume_events, events=events)
     for event in events:
-        # Trigger the consumption process in the background
-        background_tasks.add_task(consume_event, event=event)
         logger.info(f"Intelligent threshold event {event.id} created or updated successfully")
 
     return APIResponse(data=",".join(str(event.id) for event in events))
@@ -264,9 +264,9 @@ async def create_aliyun_intelligent_threshold_event_form(
         logger.info("No event created due to conversion failure")
         raise BadRequestError(message="Failed to convert alarm to event")
 
+    # Trigger the consumption process in the background
+    background_tasks.add_task(consume_events, events=events)
     for event in events:
-        # Trigger the consumption process in the background
-        background_tasks.add_task(consume_event, event=event)
         logger.info(f"Intelligent threshold event {event.id} created or updated successfully")
 
     return APIResponse(data=",".join(str(event.id) for event in events))
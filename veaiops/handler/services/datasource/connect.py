@@ -116,6 +116,18 @@ async def update_connect(connect_id: str, update_data: Dict[str, Any], updated_u
     # Save the updated connect
     await connect.save()
 
+    if "aliyun_access_key_id" in validated_data or "aliyun_access_key_secret" in validated_data:
+        from veaiops.metrics.aliyun import clear_aliyun_client_cache
+
+        # Clients built with the old credentials must not be reused
+        clear_aliyun_client_cache()
+
+    if "volcengine_access_key_id" in validated_data or "volcengine_access_key_secret" in validated_data:
+        from veaiops.metrics.volcengine import clear_volcengine_client_cache
+
+        # Clients built with the old credentials must not be reused
+        clear_volcengine_client_cache()
+
     return connect
 
 
@@ -11,25 +11,54 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+from typing import Dict, List, Optional
+
 from veaiops.schema.documents import Event
-from veaiops.schema.types import EventStatus
+from veaiops.schema.types import ChannelType, EventStatus
 from veaiops.utils.log import logger
 
 from .dispatch import notification_dispatch
 from .subscribe import subscription_matching
-from .template import message_card_build
+from .template import get_card_templates_by_agent_types, message_card_build
+
+# Maximum number of events of a batch consumed concurrently
+CONSUME_CONCURRENCY = 32
 
 
-async def consume_event(event: Event):
+async def consume_event(event: Event, template_ids: Optional[Dict[ChannelType, str]] = None):
     """Consume an event.
 
     Args:
         event (Event): Event to consume.
+        template_ids (Optional[Dict[ChannelType, str]]): Preloaded card template ids of the event agent type.
     """
     logger.info(f"Start event consumer. event_id={event.id}")
     if event.status >= EventStatus.DISPATCHED:
         logger.info(f"event {event.id} no need to process.")
         return
     await subscription_matching(event)
-    await message_card_build(event)
+    await message_card_build(event, template_ids=template_ids)
     await notification_dispatch(event)
+
+
+async def consume_events(events: List[Event]):
+    """Consume a batch of events concurrently.
+
+    Card templates are loaded once for all agent types of the batch, and a failing event does not prevent
+    the others from being consumed.
+
+    Args:
+        events (List[Event]): Events to consume.
+    """
+    card_templates = await get_card_templates_by_agent_types({event.agent_type for event in events})
+    semaphore = asyncio.Semaphore(CONSUME_CONCURRENCY)
+
+    async def _consume(event: Event):
+        async with semaphore:
+            await consume_event(event, template_ids=card_templates[event.agent_type])
+
+    results = await asyncio.gather(*(_consume(event) for event in events), return_exceptions=True)
+    for event, result in zip(events, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to consume event {event.id}: {result}")
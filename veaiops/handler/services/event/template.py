@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
 
 from beanie import PydanticObjectId
+from beanie.operators import In
 from fastapi.encoders import jsonable_encoder
 
 from veaiops.schema.base import ChannelMsg, LarkUrl, TemplateVariable
@@ -28,6 +29,12 @@ from veaiops.schema.models.chatops import AgentReplyResp
 from veaiops.schema.types import AgentType, ChannelType, EventStatus
 from veaiops.utils.log import logger
 
+# Encoder for ObjectId fields in raw data, shared across calls instead of a per-call lambda
+_OBJECT_ID_ENCODER = {PydanticObjectId: str}
+
+# Webhook channel message prototype, copied with the event raw data for each card build
+_WEBHOOK_CHANNEL_MSG = ChannelMsg.model_construct(channel=ChannelType.Webhook)
+
 
 async def get_card_templates(agent_type: AgentType) -> Dict[ChannelType, str]:
     """Get card template id.
@@ -49,15 +56,40 @@ async def get_card_templates(agent_type: AgentType) -> Dict[ChannelType, str]:
     return template_id
 
 
-async def message_card_build(event: Event):
-    """Phase two: Message card build."""
+async def get_card_templates_by_agent_types(
+    agent_types: Iterable[AgentType],
+) -> Dict[AgentType, Dict[ChannelType, str]]:
+    """Get card template ids of several agent types with a single query.
+
+    Args: agent_types(Iterable[AgentType]): Agent types
+
+    Returns: Dict[AgentType, Dict[ChannelType, str]]: card template id for different channel, by agent type
+    """
+    template_ids: Dict[AgentType, Dict[ChannelType, str]] = {agent_type: {} for agent_type in agent_types}
+    try:
+        agent_templates = await AgentTemplate.find(In(AgentTemplate.agent_type, list(template_ids))).to_list()
+        for template in agent_templates:
+            template_ids[template.agent_type][template.channel] = template.template_id
+    except Exception as e:
+        logger.error(f"Failed to get card template id {e}")
+    return template_ids
+
+
+async def message_card_build(event: Event, template_ids: Optional[Dict[ChannelType, str]] = None):
+    """Phase two: Message card build.
+
+    Args:
+        event (Event): The event.
+        template_ids (Optional[Dict[ChannelType, str]]): Preloaded card template ids of the event agent type,
+            fetched from database when not given.
+    """
     # Generate message card content with template id
-    template_ids = await get_card_templates(agent_type=event.agent_type)
+    if template_ids is None:
+        template_ids = await get_card_templates(agent_type=event.agent_type)
     variables = await build_variables(event=event)
     channel_msg: Dict[ChannelType, ChannelMsg] = {
-        ChannelType.Webhook: ChannelMsg(
-            channel=ChannelType.Webhook,
-            template_variables=jsonable_encoder(event.raw_data, custom_encoder={PydanticObjectId: lambda r: str(r)}),
+        ChannelType.Webhook: _WEBHOOK_CHANNEL_MSG.model_copy(
+            update={"template_variables": jsonable_encoder(event.raw_data, custom_encoder=_OBJECT_ID_ENCODER)}
         ),
     }
     for channel, template_id in template_ids.items():
@@ -70,6 +102,122 @@ async def message_card_build(event: Event):
     await event.set({Event.status: EventStatus.CARD_BUILT, Event.channel_msg: channel_msg})
 
 
+def _unknown_event(event: Event) -> ValueError:
+    """Log and build the error raised for events without a matching variable builder."""
+    logger.error(f"Unknown agent type or raw_data format for event {event.id}")
+    return ValueError("Unknown agent type or raw_data format")
+
+
+def _reply_analysis(data: AgentReplyResp) -> str:
+    """Render agent reply response with its citations as markdown."""
+    if not data.citations:
+        return data.response
+    citations = "\n".join([f"[{i.title}]({i.source})" for i in data.citations])
+    return f"{data.response}\n\n{citations}"
+
+
+def _threshold_alarm_variable(event: Event, class_title: str, analysis: str) -> TemplateVariable:
+    """Build template variables shared by intelligent threshold alarms."""
+    return TemplateVariable(
+        class_title=class_title,
+        chat_id="",
+        event_id=str(event.id),
+        button_name="告警屏蔽（告警聚合功能上线后生效）",
+        button_disable=True,
+        button_action="handle",
+        analysis=analysis,
+    )
+
+
+async def _build_interest_variables(event: Event) -> TemplateVariable:
+    """Build variables for chatops interest notifications."""
+    raw_data = event.raw_data
+    satisfied = [i for i in raw_data.data if i.is_satisfied]
+    chat_id = raw_data.chat_id
+    chat = await Chat.find_one(Chat.chat_id == chat_id)
+    chat_link = (chat.chat_link if chat else "") or ""
+    return TemplateVariable(
+        background_color="red",
+        class_title="|".join([i.name for i in satisfied]),
+        event_id=str(event.id),
+        chat_id=chat_id,
+        button_name="群聊跳转",
+        button_link=LarkUrl(
+            url=chat_link,
+            pc_url=chat_link,
+            ios_url=chat_link,
+            android_url=chat_link,
+        ),
+        button_action="redirect",
+        analysis="\n".join([i.thinking for i in satisfied]),
+    )
+
+
+async def _build_reactive_reply_variables(event: Event) -> TemplateVariable:
+    """Build variables for chatops reactive replies."""
+    raw_data = event.raw_data
+    if not isinstance(raw_data.data, AgentReplyResp):
+        raise _unknown_event(event)
+    return TemplateVariable(
+        chat_id=raw_data.chat_id,
+        event_id=str(event.id),
+        button_name="采纳",
+        button_action="public",
+        button_disable=True,
+        analysis=_reply_analysis(raw_data.data),
+    )
+
+
+async def _build_proactive_reply_variables(event: Event) -> TemplateVariable:
+    """Build variables for chatops proactive replies."""
+    raw_data = event.raw_data
+    if not isinstance(raw_data.data, AgentReplyResp):
+        raise _unknown_event(event)
+    return TemplateVariable(
+        chat_id=raw_data.chat_id,
+        event_id=str(event.id),
+        button_name="采纳（转为所有人可见）",
+        button_action="public",
+        analysis=_reply_analysis(raw_data.data),
+    )
+
+
+async def _build_volcengine_alarm_variables(event: Event) -> TemplateVariable:
+    """Build variables for Volcengine intelligent threshold alarms."""
+    raw_data = event.raw_data
+    return _threshold_alarm_variable(event, "火山引擎智能阈值告警", f"{raw_data.rule_condition}\n{raw_data.rule_name}")
+
+
+async def _build_aliyun_alarm_variables(event: Event) -> TemplateVariable:
+    """Build variables for Aliyun intelligent threshold alarms."""
+    raw_data = event.raw_data
+    return _threshold_alarm_variable(
+        event,
+        "阿里云智能阈值告警",
+        f"地域：{raw_data.regionName}\n"
+        f"指标名称：{raw_data.metricName}\n"
+        f"监控对象：{raw_data.dimensions} \n"
+        f"持续时间： {raw_data.lastTime}\n"
+        f"当前值： {raw_data.curValue}",
+    )
+
+
+async def _build_zabbix_alarm_variables(event: Event) -> TemplateVariable:
+    """Build variables for Zabbix intelligent threshold alarms."""
+    return _threshold_alarm_variable(event, "Zabbix智能阈值告警", f"{event.raw_data.message}")
+
+
+# Template variable builders specialized per (agent type, raw data type), resolved with a single lookup
+_VARIABLE_BUILDERS: Dict[Tuple[AgentType, type], Callable[[Event], Awaitable[TemplateVariable]]] = {
+    (AgentType.CHATOPS_INTEREST, AgentNotification): _build_interest_variables,
+    (AgentType.CHATOPS_REACTIVE_REPLY, AgentNotification): _build_reactive_reply_variables,
+    (AgentType.CHATOPS_PROACTIVE_REPLY, AgentNotification): _build_proactive_reply_variables,
+    (AgentType.INTELLIGENT_THRESHOLD, VolcengineAlarmNotification): _build_volcengine_alarm_variables,
+    (AgentType.INTELLIGENT_THRESHOLD, AliyunAlarmNotification): _build_aliyun_alarm_variables,
+    (AgentType.INTELLIGENT_THRESHOLD, ZabbixAlarmNotification): _build_zabbix_alarm_variables,
+}
+
+
 async def build_variables(event: Event) -> TemplateVariable:
     """Build variables.
 
@@ -79,105 +227,7 @@ async def build_variables(event: Event) -> TemplateVariable:
     Returns:
         TemplateVariable: template card variables.
     """
-    match event.agent_type:
-        case AgentType.CHATOPS_INTEREST if isinstance(event.raw_data, AgentNotification):
-            _title = "|".join([i.name for i in event.raw_data.data if i.is_satisfied])
-            _analysis = "\n".join([i.thinking for i in event.raw_data.data if i.is_satisfied])
-            chat_id = event.raw_data.chat_id
-            chat = await Chat.find_one(Chat.chat_id == chat_id)
-            chat_link = chat.chat_link if chat else ""
-            chat_link = chat_link or ""
-            var = TemplateVariable(
-                background_color="red",
-                class_title=_title,
-                event_id=str(event.id),
-                chat_id=chat_id,
-                button_name="群聊跳转",
-                button_link=LarkUrl(
-                    url=chat_link,
-                    pc_url=chat_link,
-                    ios_url=chat_link,
-                    android_url=chat_link,
-                ),
-                button_action="redirect",
-                analysis=_analysis,
-            )
-
-        case AgentType.CHATOPS_REACTIVE_REPLY if isinstance(event.raw_data, AgentNotification) and isinstance(
-            event.raw_data.data, AgentReplyResp
-        ):
-            _analysis = event.raw_data.data.response
-            if event.raw_data.data.citations:
-                _analysis += "\n\n"
-                _analysis += "\n".join(
-                    [f"[{i.title}]({i.source})" for idx, i in enumerate(event.raw_data.data.citations)]
-                )
-
-            var = TemplateVariable(
-                chat_id=event.raw_data.chat_id,
-                event_id=str(event.id),
-                button_name="采纳",
-                button_action="public",
-                button_disable=True,
-                analysis=_analysis,
-            )
-        case AgentType.CHATOPS_PROACTIVE_REPLY if isinstance(event.raw_data, AgentNotification) and isinstance(
-            event.raw_data.data, AgentReplyResp
-        ):
-            _analysis = event.raw_data.data.response
-            if event.raw_data.data.citations:
-                _analysis += "\n\n"
-                _analysis += "\n".join(
-                    [f"[{i.title}]({i.source})" for idx, i in enumerate(event.raw_data.data.citations)]
-                )
-            var = TemplateVariable(
-                chat_id=event.raw_data.chat_id,
-                event_id=str(event.id),
-                button_name="采纳（转为所有人可见）",
-                button_action="public",
-                analysis=_analysis,
-            )
-        case AgentType.INTELLIGENT_THRESHOLD if isinstance(event.raw_data, VolcengineAlarmNotification):
-            _analysis = f"{event.raw_data.rule_condition}\n{event.raw_data.rule_name}"
-            var = TemplateVariable(
-                class_title="火山引擎智能阈值告警",
-                chat_id="",
-                event_id=str(event.id),
-                button_name="告警屏蔽（告警聚合功能上线后生效）",
-                button_disable=True,
-                button_action="handle",
-                analysis=_analysis,
-            )
-        case AgentType.INTELLIGENT_THRESHOLD if isinstance(event.raw_data, AliyunAlarmNotification):
-            _analysis = (
-                f"地域：{event.raw_data.regionName}\n"
-                f"指标名称：{event.raw_data.metricName}\n"
-                f"监控对象：{event.raw_data.dimensions} \n"
-                f"持续时间： {event.raw_data.lastTime}\n"
-                f"当前值： {event.raw_data.curValue}"
-            )
-            var = TemplateVariable(
-                class_title="阿里云智能阈值告警",
-                chat_id="",
-                event_id=str(event.id),
-                button_name="告警屏蔽（告警聚合功能上线后生效）",
-                button_disable=True,
-                button_action="handle",
-                analysis=_analysis,
-            )
-        case AgentType.INTELLIGENT_THRESHOLD if isinstance(event.raw_data, ZabbixAlarmNotification):
-            _analysis = f"{event.raw_data.message}"
-            var = TemplateVariable(
-                class_title="Zabbix智能阈值告警",
-                chat_id="",
-                event_id=str(event.id),
-                button_name="告警屏蔽（告警聚合功能上线后生效）",
-                button_disable=True,
-                button_action="handle",
-                analysis=_analysis,
-            )
-        case _:
-            logger.error(f"Unknown agent type or raw_data format for event {event.id}")
-            raise ValueError("Unknown agent type or raw_data format")
-
-    return var
+    builder = _VARIABLE_BUILDERS.get((event.agent_type, event.raw_data.__class__))
+    if builder is None:
+        raise _unknown_event(event)
+    return await builder(event)
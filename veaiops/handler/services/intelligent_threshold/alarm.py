@@ -13,7 +13,7 @@
 # limitations under the License.
 
 # Service functions for AlarmSyncRecord
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from urllib.parse import urljoin
 
@@ -27,6 +27,10 @@ from veaiops.schema.models.base import TimeRange
 from veaiops.schema.models.intelligent_threshold.alarm import SyncAlarmRulesPayload, SyncAlarmRulesResponse
 from veaiops.schema.types import AlarmSyncRecordStatus, DataSourceType
 from veaiops.settings import WebhookSettings, get_settings
+from veaiops.utils.query import time_range_filter
+
+# Maximum number of expired alarm sync records deleted per round trip
+CLEANUP_BATCH_SIZE = 10_000
 
 
 async def list_alarm_sync_records(
@@ -46,9 +50,7 @@ async def list_alarm_sync_records(
     if status:
         query_conditions["status"] = status
     if created_at_range:
-        start = datetime.fromtimestamp(created_at_range.start_time, tz=timezone.utc)
-        end = datetime.fromtimestamp(created_at_range.end_time, tz=timezone.utc)
-        query_conditions["created_at"] = {"$gte": start, "$lte": end}
+        query_conditions["created_at"] = time_range_filter(created_at_range)
 
     query = AlarmSyncRecord.find(query_conditions).sort(-AlarmSyncRecord.created_at)
     total_count = await query.count()
@@ -179,21 +181,34 @@ async def get_alarm_sync_records_by_status(status: AlarmSyncRecordStatus) -> Lis
     return await AlarmSyncRecord.find(AlarmSyncRecord.status == status).sort(-AlarmSyncRecord.created_at).to_list()
 
 
-async def cleanup_old_alarm_sync_records(days_to_keep: int = 30) -> int:
+async def cleanup_old_alarm_sync_records(days_to_keep: int = 30, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
     """Clean up old alarm sync records older than specified days.
 
+    Records are deleted in bounded batches selected by created_at, so that a large backlog
+    does not turn into a single long-running delete.
+
     Args:
         days_to_keep: Number of days to keep records. Records older than this will be deleted.
+        batch_size: Maximum number of records deleted per round trip.
 
     Returns:
         int: Number of records deleted.
     """
-    from datetime import datetime, timedelta, timezone
-
     # Calculate the cutoff date
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
 
-    # Delete old records
-    result = await AlarmSyncRecord.find(AlarmSyncRecord.created_at < cutoff_date).delete()
-
-    return result.deleted_count
+    # Delete old records batch by batch
+    collection = AlarmSyncRecord.get_pymongo_collection()
+    query = {"created_at": {"$lt": cutoff_date}}
+    deleted_count = 0
+    while True:
+        cursor = collection.find(query, {"_id": 1}).limit(batch_size)
+        ids = [doc["_id"] async for doc in cursor]
+        if not ids:
+            break
+        result = await collection.delete_many({"_id": {"$in": ids}})
+        deleted_count += result.deleted_count
+        if len(ids) < batch_size:
+            break
+
+    return deleted_count
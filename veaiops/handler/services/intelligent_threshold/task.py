@@ -26,6 +26,7 @@ from veaiops.schema.documents import (
 )
 from veaiops.schema.models.base import TimeRange
 from veaiops.schema.types import DataSourceType, IntelligentThresholdTaskStatus
+from veaiops.utils.query import time_range_filter
 
 
 async def list_tasks(
@@ -53,14 +54,10 @@ async def list_tasks(
         query["task_name"] = {"$regex": task_name, "$options": "i"}
 
     if created_at_range:
-        start = datetime.fromtimestamp(created_at_range.start_time, tz=timezone.utc)
-        end = datetime.fromtimestamp(created_at_range.end_time, tz=timezone.utc)
-        query["created_at"] = {"$gte": start, "$lte": end}
+        query["created_at"] = time_range_filter(created_at_range)
 
     if updated_at_range:
-        start = datetime.fromtimestamp(updated_at_range.start_time, tz=timezone.utc)
-        end = datetime.fromtimestamp(updated_at_range.end_time, tz=timezone.utc)
-        query["updated_at"] = {"$gte": start, "$lte": end}
+        query["updated_at"] = time_range_filter(updated_at_range)
 
     # Build sort criteria
     sort_criteria = [("created_at", -1)]
@@ -171,14 +168,10 @@ async def list_task_versions(
         query_conditions["status"] = status
 
     if created_at_range:
-        start = datetime.fromtimestamp(created_at_range.start_time, tz=timezone.utc)
-        end = datetime.fromtimestamp(created_at_range.end_time, tz=timezone.utc)
-        query_conditions["created_at"] = {"$gte": start, "$lte": end}
+        query_conditions["created_at"] = time_range_filter(created_at_range)
 
     if updated_at_range:
-        start = datetime.fromtimestamp(updated_at_range.start_time, tz=timezone.utc)
-        end = datetime.fromtimestamp(updated_at_range.end_time, tz=timezone.utc)
-        query_conditions["updated_at"] = {"$gte": start, "$lte": end}
+        query_conditions["updated_at"] = time_range_filter(updated_at_range)
 
     query = IntelligentThresholdTaskVersion.find(query_conditions)
 
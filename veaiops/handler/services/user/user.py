@@ -25,11 +25,25 @@ __all__ = [
 ]
 
 
+def _current_user_id(request: Request, current_user: User) -> str:
+    """Get the stringified id of current user, computed once per request and cached on request state."""
+    state = request.state
+    try:
+        return state.current_user_id
+    except AttributeError:
+        state.current_user_id = str(current_user.id)
+        return state.current_user_id
+
+
 async def get_current_user(request: Request) -> User:
     """Dependency function to get currently logged-in user."""
-    if not hasattr(request.state, "user") or not request.state.user:
+    try:
+        user = request.state.user
+    except AttributeError:
+        user = None
+    if not user:
         raise UnauthorizedError(message="Not authenticated")
-    return request.state.user
+    return user
 
 
 async def get_current_supervisor(
@@ -46,7 +60,7 @@ async def get_current_supervisor_not_self(
 ) -> User:
     """Dependency function to verify if current user is administrator but not trying to operate on themselves."""
     user_id = request.path_params.get("user_id")
-    if str(current_user.id) == str(user_id):
+    if _current_user_id(request, current_user) == str(user_id):
         raise ForbiddenError(message="Administrators cannot delete themselves")
     return current_user
 
@@ -54,6 +68,6 @@ async def get_current_supervisor_not_self(
 async def get_current_user_password_only(request: Request, current_user: User = Depends(get_current_user)) -> User:
     """Dependency function to verify if current user is the target user and only updating password."""
     user_id = request.path_params.get("user_id")
-    if str(current_user.id) != str(user_id):
+    if _current_user_id(request, current_user) != str(user_id):
         raise ForbiddenError(message="You can only update your own password")
     return current_user
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from veaiops.cache import VolcengineMetricCache, VolcengineProductCache
@@ -22,11 +23,19 @@ from veaiops.utils.log import logger
 async def cache_lifespan(app):
     """Cache lifespan management."""
     try:
-        # Initialize on startup
-        logger.info("🔄 Initializing Volcengine product cache...")
-        await volcengine_product_cache.refresh_products()
-        logger.info("🔄 Initializing Volcengine metric cache...")
-        await volcengine_metric_cache.refresh_metrics()
+        # Initialize on startup, products and metrics come from independent upstreams
+        logger.info("🔄 Initializing Volcengine product and metric cache...")
+        tasks = [
+            asyncio.create_task(volcengine_product_cache.refresh_products()),
+            asyncio.create_task(volcengine_metric_cache.refresh_metrics()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            # Do not leave the sibling refresh running in the background once startup failed
+            for task in tasks:
+                task.cancel()
+            raise
     except Exception as e:
         logger.critical(f"Failed to initialize cache during startup: {e}. Application will not start.", exc_info=True)
         raise
@@ -51,7 +60,9 @@ volcengine_metric_cache = VolcengineMetricCache(refresh_interval_seconds=600)  #
 # Graceful shutdown handler
 async def graceful_shutdown():
     """Gracefully shutdown all cache tasks."""
-    await volcengine_product_cache.stop_refresh_task()
-    await volcengine_metric_cache.stop_refresh_task()
+    await asyncio.gather(
+        volcengine_product_cache.stop_refresh_task(),
+        volcengine_metric_cache.stop_refresh_task(),
+    )
 
     logger.info("Cache cleanup completed")
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Optional
 
 from beanie import init_beanie
 from fastapi import FastAPI
-from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
+from opentelemetry.trace import Span
 from pymongo import AsyncMongoClient
+from pymongo.monitoring import CommandStartedEvent
 
 from veaiops.schema.documents import (
     AgentNotification,
@@ -50,51 +52,109 @@ from veaiops.schema.documents import (
 from veaiops.settings import MongoSettings, O11ySettings, get_settings
 from veaiops.utils.log import logger
 
+# Deadline in seconds for closing the Mongo client, so an unresponsive node can not block application shutdown
+MONGO_CLOSE_TIMEOUT = 5.0
+
+# Longest Mongo statement attached to a span, large pipelines and ``$in`` lists are cut off beyond it
+MAX_STATEMENT_LENGTH = 4096
+
+
+def _build_statement_request_hook() -> Optional[Callable[[Span, CommandStartedEvent], None]]:
+    """Build a request hook attaching the Mongo statement to sampled spans only.
+
+    The instrumentor's own ``capture_statement`` stringifies every command before the sampling decision is
+    checked, so dropped spans would still pay for serializing large pipelines and ``$in`` queries. The statement
+    is attached as a string of at most ``MAX_STATEMENT_LENGTH`` characters, so the exporter never walks the
+    command document and span size stays bounded. Imports are resolved here once, not on every command.
+
+    Returns:
+        The request hook, or None when the instrumentation does not provide its command attribute mapping
+    """
+    try:
+        # Not part of the instrumentation's public API, so its absence disables the hook instead of failing startup
+        from opentelemetry.instrumentation.pymongo.utils import COMMAND_TO_ATTRIBUTE_MAPPING
+    except ImportError:
+        return None
+    from opentelemetry.semconv.trace import SpanAttributes
+
+    def _statement_request_hook(span: Span, event: CommandStartedEvent) -> None:
+        if not span.is_recording():
+            return
+        command = event.command.get(COMMAND_TO_ATTRIBUTE_MAPPING.get(event.command_name))
+        if command:
+            span.set_attribute(SpanAttributes.DB_STATEMENT, f"{event.command_name} {command}"[:MAX_STATEMENT_LENGTH])
+
+    return _statement_request_hook
+
 
 @asynccontextmanager
 async def db_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Initialize application services."""
-    if get_settings(O11ySettings).enabled:
-        PymongoInstrumentor().instrument(capture_statement=True)
+    o11y_settings = get_settings(O11ySettings)
+    if o11y_settings.enabled:
+        # Imported only when telemetry is enabled
+        from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
+
+        instrument_options = {"capture_statement": False}
+        if o11y_settings.capture_mongo_statement:
+            request_hook = _build_statement_request_hook()
+            if request_hook is None:
+                logger.warning("Pymongo instrumentation lacks its command mapping, capture statements of all spans.")
+                instrument_options["capture_statement"] = True
+            else:
+                instrument_options["request_hook"] = request_hook
+        PymongoInstrumentor().instrument(**instrument_options)
         logger.info("OpenTelemetry for PymongoInstrumentor started.")
 
-    app.mongo_client = AsyncMongoClient(get_settings(MongoSettings).mongo_uri)  # type: ignore
+    mongo_settings = get_settings(MongoSettings)
+    app.mongo_client = AsyncMongoClient(mongo_settings.mongo_uri, **mongo_settings.client_options)  # type: ignore
     logger.info("Initializing ...")
 
-    app.mongodb_veaiops = app.mongo_client.veaiops  # type: ignore
-    await init_beanie(
-        app.mongodb_veaiops,
-        document_models=[
-            Message,
-            Chat,
-            Bot,
-            User,
-            Customer,
-            Product,
-            Project,
-            VeKB,
-            DataSource,
-            Connect,
-            Interest,
-            Event,
-            EventNoticeDetail,
-            EventNoticeFeedback,
-            InformStrategy,
-            Subscribe,
-            IntelligentThresholdTask,
-            IntelligentThresholdTaskVersion,
-            AutoIntelligentThresholdTaskRecord,
-            AutoIntelligentThresholdTaskRecordDetail,
-            AlarmSyncRecord,
-            AgentTemplate,
-            BotAttribute,
-            AgentNotification,
-            MetricTemplate,
-        ],
-    )  # type: ignore
-    logger.info("Connected to MongoDB db=veaiops")
-
-    yield
-
-    await app.mongo_client.close()  # type: ignore
-    logger.info("Disconnected from MongoDB")
+    # Close the client on startup failure and when a later lifespan fails, not only on normal shutdown
+    try:
+        # Pay connection setup and authentication once before init_beanie fans out index operations
+        await app.mongo_client.admin.command("ping")  # type: ignore
+
+        app.mongodb_veaiops = app.mongo_client.veaiops  # type: ignore
+        await init_beanie(
+            app.mongodb_veaiops,
+            document_models=[
+                Message,
+                Chat,
+                Bot,
+                User,
+                Customer,
+                Product,
+                Project,
+                VeKB,
+                DataSource,
+                Connect,
+                Interest,
+                Event,
+                EventNoticeDetail,
+                EventNoticeFeedback,
+                InformStrategy,
+                Subscribe,
+                IntelligentThresholdTask,
+                IntelligentThresholdTaskVersion,
+                AutoIntelligentThresholdTaskRecord,
+                AutoIntelligentThresholdTaskRecordDetail,
+                AlarmSyncRecord,
+                AgentTemplate,
+                BotAttribute,
+                AgentNotification,
+                MetricTemplate,
+            ],
+            allow_index_dropping=False,
+            recreate_views=False,
+            skip_indexes=mongo_settings.skip_indexes,
+        )  # type: ignore
+        logger.info("Connected to MongoDB db=veaiops")
+
+        yield
+    finally:
+        try:
+            await asyncio.wait_for(app.mongo_client.close(), timeout=MONGO_CLOSE_TIMEOUT)  # type: ignore
+            logger.info("Disconnected from MongoDB")
+        except asyncio.TimeoutError:
+            logger.warning(f"MongoDB client did not close within {MONGO_CLOSE_TIMEOUT}s, skip waiting.")
@@ -12,24 +12,118 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import asyncio
+import socket
+import threading
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator, Dict
 
 from fastapi import FastAPI
 from opentelemetry import metrics, trace
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 from veaiops.utils.log import logger, setup_logging
 
+# The OTel SDK, OTLP exporters and FastAPI instrumentation are imported only when telemetry is enabled, so
+# processes running without it do not pay for loading them
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics.export import AggregationTemporality
+    from opentelemetry.sdk.resources import Resource
+
+# gRPC channel options for OTLP exporters: allow larger export requests than the 4MB default and keep the
+# connection to the collector alive between exports
+OTLP_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", 16 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30000),
+)
+
+# Endpoints not traced by FastAPI instrumentation: API docs and the liveness/readiness probe, which kubelet polls
+# far more often than any business endpoint is called
+EXCLUDED_URLS = "/docs,/redoc,/openapi.json,/healthz"
+
+# Deadline in seconds for each OTLP export, so an unreachable collector can not stall startup or shutdown
+OTLP_EXPORTER_TIMEOUT = 5
+
+# Deadline in seconds for flushing and shutting down providers on application shutdown
+PROVIDER_SHUTDOWN_TIMEOUT = 3.0
+
+# Host name of current process, resolved once at import
+_HOSTNAME = socket.gethostname()
+
+
+@lru_cache
+def _metric_temporality() -> Dict[type, "AggregationTemporality"]:
+    """Export counters and histograms as deltas.
+
+    The SDK then does not keep growing cumulative state for high-cardinality series, and each export only carries
+    the latest interval.
+    """
+    from opentelemetry.sdk.metrics import Counter, Histogram
+    from opentelemetry.sdk.metrics.export import AggregationTemporality
+
+    return {
+        Counter: AggregationTemporality.DELTA,
+        Histogram: AggregationTemporality.DELTA,
+    }
+
+
+@lru_cache
+def _service_resource(service_name: str, service_version: str, environment: str) -> "Resource":
+    """Build the service resource, shared by every provider created with the same service attributes."""
+    from opentelemetry.sdk.resources import Resource
+
+    return Resource(
+        attributes={
+            "service.name": service_name,
+            "service.version": service_version,
+            "environment": environment,
+            "host.name": _HOSTNAME,
+        }
+    )
+
+
+def _shutdown_in_daemon_thread(provider) -> asyncio.Future:
+    """Shut a provider down on a daemon thread and return a future resolved when it is done.
+
+    Unlike the default executor, the daemon thread is neither joined by ``asyncio.run`` nor on interpreter exit, so a
+    shutdown stuck on an unreachable collector is abandoned once the caller stops waiting for it.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(error: BaseException | None) -> None:
+        # The caller may have stopped waiting, which cancels the future
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+    def _run() -> None:
+        error = None
+        try:
+            provider.shutdown()
+        except Exception as e:
+            error = e
+        # The event loop may already be closed when a slow shutdown finishes
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(_resolve, error)
+
+    threading.Thread(target=_run, name="otel-shutdown", daemon=True).start()
+    return future
+
+
+async def _shutdown_providers(*providers) -> None:
+    """Flush and shut down telemetry providers without blocking application shutdown beyond the deadline."""
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(_shutdown_in_daemon_thread(provider) for provider in providers)),
+            timeout=PROVIDER_SHUTDOWN_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Telemetry providers did not shut down within {PROVIDER_SHUTDOWN_TIMEOUT}s, skip draining.")
+
 
 @asynccontextmanager
 async def otel_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -38,28 +132,42 @@ async def otel_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     o11_y_settings = get_settings(O11ySettings)
     if o11_y_settings.enabled:
+        from opentelemetry.exporter.otlp.proto.grpc.exporter import Compression
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
         # 1. Configure service resource (will be passed to Collector)
-        resource = Resource(
-            attributes={
-                "service.name": o11_y_settings.service_name,
-                "service.version": o11_y_settings.service_version,
-                "environment": o11_y_settings.service_environment,
-                "host.name": os.uname().nodename,  # Automatically get the host name
-            }
+        resource = _service_resource(
+            o11_y_settings.service_name,
+            o11_y_settings.service_version,
+            o11_y_settings.service_environment,
         )
 
         # 2. Configure sampling strategy (10% sampling is recommended in production)
         sampler = ParentBased(TraceIdRatioBased(o11_y_settings.trace_id_ratio))
 
         # 3. Initialize tracer (connect to Collector's OTLP gRPC endpoint)
-        trace_exporter = OTLPSpanExporter(o11_y_settings.exporter_otlp_endpoint)
+        trace_exporter = OTLPSpanExporter(
+            o11_y_settings.exporter_otlp_endpoint,
+            timeout=OTLP_EXPORTER_TIMEOUT,
+            compression=Compression.Gzip,
+            channel_options=OTLP_CHANNEL_OPTIONS,
+        )
 
         trace_provider = TracerProvider(resource=resource, sampler=sampler)
         trace_provider.add_span_processor(
             BatchSpanProcessor(
                 trace_exporter,
-                max_queue_size=2048,
-                schedule_delay_millis=5000,  # Export in batch every 5 seconds
+                max_queue_size=o11_y_settings.max_queue_size,
+                schedule_delay_millis=o11_y_settings.schedule_delay_millis,
+                max_export_batch_size=o11_y_settings.max_export_batch_size,
+                export_timeout_millis=o11_y_settings.export_timeout_millis,
             )
         )
         trace.set_tracer_provider(trace_provider)
@@ -69,10 +177,17 @@ async def otel_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Telemetry enabled.")
 
         # 5. Initialize meter (metrics data)
-        metric_exporter = OTLPMetricExporter(o11_y_settings.exporter_otlp_endpoint)
+        metric_exporter = OTLPMetricExporter(
+            o11_y_settings.exporter_otlp_endpoint,
+            timeout=OTLP_EXPORTER_TIMEOUT,
+            compression=Compression.Gzip,
+            channel_options=OTLP_CHANNEL_OPTIONS,
+            preferred_temporality=_metric_temporality(),
+        )
         metric_reader = PeriodicExportingMetricReader(
             metric_exporter,
             export_interval_millis=10000,  # Export metrics every 10 seconds
+            export_timeout_millis=5000,
         )
         metric_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
         metrics.set_meter_provider(metric_provider)
@@ -81,10 +196,13 @@ async def otel_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Auto-monitor FastAPI
         FastAPIInstrumentor.instrument_app(
             app=app,
-            excluded_urls="/docs,/redoc",  # Exclude non-business endpoints
+            excluded_urls=EXCLUDED_URLS,  # Exclude non-business endpoints
         )
 
-    yield
-    if o11_y_settings.enabled:
-        FastAPIInstrumentor.uninstrument_app(app)
-        logger.info("shutdown tracer providers or meter providers.")
+    try:
+        yield
+    finally:
+        if o11_y_settings.enabled:
+            FastAPIInstrumentor.uninstrument_app(app)
+            await _shutdown_providers(trace_provider, metric_provider)
+            logger.info("shutdown tracer providers or meter providers.")
@@ -12,11 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .aliyun import AliyunDataSource
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .base import DataSource, DataSourceTypeLiteralType, generate_unique_key
 from .timeseries import InputTimeSeries
-from .volcengine import VolcengineDataSource
-from .zabbix import ZabbixDataSource
+
+if TYPE_CHECKING:
+    from .aliyun import AliyunDataSource
+    from .volcengine import VolcengineDataSource
+    from .zabbix import ZabbixDataSource
+
+# Vendor data sources pull in their SDKs, import them on first access only
+_LAZY_ATTRIBUTES = {
+    "AliyunDataSource": ".aliyun",
+    "VolcengineDataSource": ".volcengine",
+    "ZabbixDataSource": ".zabbix",
+}
 
 __all__ = [
     "DataSource",
@@ -27,3 +39,14 @@ __all__ = [
     "ZabbixDataSource",
     "InputTimeSeries",
 ]
+
+
+def __getattr__(name: str):
+    """Import vendor data sources lazily on first attribute access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
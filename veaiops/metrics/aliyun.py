@@ -13,32 +13,76 @@
 # limitations under the License.
 
 import asyncio
-import json
+import random
+from contextlib import aclosing, suppress
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import batched
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
+import numpy as np
+import orjson
 from alibabacloud_cms20190101 import models as cms_20190101_models
-from alibabacloud_cms20190101.client import Client as Cms20190101Client
-from alibabacloud_tea_openapi import models as open_api_models
 from alibabacloud_tea_util import models as util_models
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, SecretStr
 
 from veaiops.metrics.base import (
     BaseRuleConfig,
     BaseRuleSynchronizer,
     DataSource,
     generate_unique_key,
+    get_executor,
     rate_limit,
+    run_rate_limited,
 )
 from veaiops.metrics.timeseries import InputTimeSeries
 from veaiops.schema.types import EventLevel
 from veaiops.utils.log import logger
 
+if TYPE_CHECKING:
+    from alibabacloud_cms20190101.client import Client as Cms20190101Client
+
 __all__ = ["AliyunDataSource", "AliyunClient"]
 
 from veaiops.utils.crypto import decrypt_secret_value
 
+# Timeouts of every Aliyun API request, in milliseconds
+CLIENT_CONNECT_TIMEOUT_MS = 5000
+CLIENT_READ_TIMEOUT_MS = 10000
+
+# Idle keep-alive connections kept per Aliyun endpoint, covers the concurrency quota of several accounts
+CLIENT_MAX_IDLE_CONNS = 64
+
+# Maximum number of rule IDs sent in a single DeleteMetricRules request
+DELETE_RULES_BATCH_SIZE = 10
+
+# Number of rules requested per DescribeMetricRuleList page, the API defaults to 10
+LIST_RULES_PAGE_SIZE = 100
+
+# Name prefix of the threads running blocking Aliyun SDK calls
+EXECUTOR_THREAD_NAME_PREFIX = "aliyun-cms"
+
+_ALIYUN_LEVEL_MAPPING = {EventLevel.P0: "critical", EventLevel.P1: "warn", EventLevel.P2: "info"}
+
+_EMPTY_JSON = "{}"
+
+# Datapoint fields that carry measurements rather than series identity
+_NON_LABEL_FIELDS = frozenset({"timestamp", "Minimum", "Maximum", "Average"})
+
+_ESCALATION_CLASSES = {
+    "critical": cms_20190101_models.PutResourceMetricRuleRequestEscalationsCritical,
+    "warn": cms_20190101_models.PutResourceMetricRuleRequestEscalationsWarn,
+    "info": cms_20190101_models.PutResourceMetricRuleRequestEscalationsInfo,
+}
+
+
+def _to_json_param(value: Any) -> str:
+    """Serialize an API JSON parameter, passing through values that are already serialized."""
+    if isinstance(value, str):
+        return value
+    return orjson.dumps(value).decode() if value else _EMPTY_JSON
+
 
 @dataclass
 class AliyunRuleConfig(BaseRuleConfig):
@@ -56,8 +100,7 @@ class AliyunRuleConfig(BaseRuleConfig):
         Returns:
             Corresponding Aliyun escalation level ("critical", "warn", or "info")
         """
-        level_mapping = {EventLevel.P0: "critical", EventLevel.P1: "warn", EventLevel.P2: "info"}
-        return level_mapping.get(alarm_level, "info")  # default to "info" if not found
+        return _ALIYUN_LEVEL_MAPPING.get(alarm_level, "info")  # default to "info" if not found
 
 
 class RuleSynchronizer(BaseRuleSynchronizer):
@@ -77,7 +120,7 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         Returns:
             str: The concurrency group identifier based on ak/sk
         """
-        return f"{self.datasource.concurrency_group}_rule"
+        return self.datasource.rule_concurrency_group
 
     @property
     def get_concurrency_quota(self) -> int:
@@ -92,7 +135,7 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         """Asynchronously synchronize rules."""
         try:
             # Fetch existing rules
-            existing_rules = self.datasource._list_rules()
+            existing_rules = await self.datasource._list_rules()
 
             # # Generate desired rules
             desired_rules = self.datasource._generate_rules(
@@ -128,10 +171,9 @@ class RuleSynchronizer(BaseRuleSynchronizer):
             operation = {"type": "update", "rule": rule, "rule_name": getattr(rule, "rule_name", "unknown")}
             all_operations.append(operation)
 
-        # Add delete operations
-        delete_rule_ids = operations.get("delete", [])
-        if delete_rule_ids:
-            operation = {"type": "delete", "rule_ids": delete_rule_ids}
+        # Add delete operations, one per batch so batches are deleted concurrently
+        for batch in batched(operations.get("delete", []), DELETE_RULES_BATCH_SIZE):
+            operation = {"type": "delete", "rule_ids": list(batch)}
             all_operations.append(operation)
 
         # Define operation function map
@@ -144,10 +186,13 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         # Use base class method to execute operations
         return await self.execute_operations(all_operations, operation_func_map)
 
-    @rate_limit
-    def _create_rule_wrapper(self, rule):
+    async def _run_blocking(self, func, *args):
+        """Run a blocking SDK call on the rule executor of this account."""
+        return await self.datasource._run_rule_blocking(func, *args)
+
+    async def _create_rule_wrapper(self, rule):
         try:
-            result = self.datasource._put_rule(rule)
+            result = await self._run_blocking(self.datasource._put_rule, rule)
             return {
                 "status": "success",
                 "operation": "create",
@@ -163,10 +208,9 @@ class RuleSynchronizer(BaseRuleSynchronizer):
                 "error": str(e),
             }
 
-    @rate_limit
-    def _update_rule_wrapper(self, rule):
+    async def _update_rule_wrapper(self, rule):
         try:
-            result = self.datasource._put_rule(rule)
+            result = await self._run_blocking(self.datasource._put_rule, rule)
             return {
                 "status": "success",
                 "operation": "update",
@@ -182,10 +226,9 @@ class RuleSynchronizer(BaseRuleSynchronizer):
                 "error": str(e),
             }
 
-    @rate_limit
-    def _delete_rules_wrapper(self, rule_ids):
+    async def _delete_rules_wrapper(self, rule_ids):
         try:
-            result = self.datasource._delete_rules(rule_ids)
+            result = await self._run_blocking(self.datasource._delete_rules, rule_ids)
             # Return information for proper statistics handling
             return {
                 "status": "success",
@@ -209,15 +252,29 @@ class RuleSynchronizer(BaseRuleSynchronizer):
 class AliyunClient:
     """Aliyun monitoring API client."""
 
+    # Timeouts and pool size are set on the client config, so every request of every client shares these options
+    _runtime = util_models.RuntimeOptions()
+
     def __init__(self, ak: str, sk: str, region: str):
         self.access_key_id = ak
         self.access_key_secret = sk
         self.region = region
         self._client = self._create_client()
 
-    def _create_client(self) -> Cms20190101Client:
+    def _create_client(self) -> "Cms20190101Client":
         """Initialize account client with credentials."""
-        config = open_api_models.Config(access_key_id=self.access_key_id, access_key_secret=self.access_key_secret)
+        # The SDK client pulls in the credentials and OpenAPI stack, only load it once a client is needed
+        from alibabacloud_cms20190101.client import Client as Cms20190101Client
+        from alibabacloud_tea_openapi import models as open_api_models
+
+        config = open_api_models.Config(
+            access_key_id=self.access_key_id,
+            access_key_secret=self.access_key_secret,
+            connect_timeout=CLIENT_CONNECT_TIMEOUT_MS,
+            read_timeout=CLIENT_READ_TIMEOUT_MS,
+            # The SDK keeps one keep-alive session per endpoint and pool size, shared by all clients of a region
+            max_idle_conns=CLIENT_MAX_IDLE_CONNS,
+        )
 
         config.endpoint = f"metrics.{self.region}.aliyuncs.com"
         return Cms20190101Client(config)
@@ -226,16 +283,19 @@ class AliyunClient:
         self,
         namespace: str,
         metric_name: str,
-        dimensions: Optional[List[Dict[str, str]]],
+        dimensions: Optional[List[Dict[str, str]] | str],
         start_time: str,
         end_time: str,
         period: str = "60",
-        express: Optional[Dict[str, List[str]]] = None,
+        express: Optional[Dict[str, List[str]] | str] = None,
         next_token: Optional[str] = None,
     ) -> cms_20190101_models.DescribeMetricListResponse:
-        """Get specified metric data."""
-        dimension_str = json.dumps(dimensions) if dimensions else "{}"
-        express_str = json.dumps(express) if express else "{}"
+        """Get specified metric data.
+
+        dimensions and express may be passed already serialized, so paginated callers encode them only once.
+        """
+        dimension_str = _to_json_param(dimensions)
+        express_str = _to_json_param(express)
 
         describe_metric_list_request = cms_20190101_models.DescribeMetricListRequest(
             namespace=namespace,
@@ -250,11 +310,7 @@ class AliyunClient:
         if next_token:
             describe_metric_list_request.next_token = next_token
 
-        runtime = util_models.RuntimeOptions()
-        runtime.read_timeout = 10000
-        runtime.connect_timeout = 5000
-
-        return self._client.describe_metric_list_with_options(describe_metric_list_request, runtime)
+        return self._client.describe_metric_list_with_options(describe_metric_list_request, self._runtime)
 
     def get_existing_rules(
         self, request: cms_20190101_models.DescribeMetricRuleListRequest
@@ -268,8 +324,7 @@ class AliyunClient:
             Response containing existing rules.
         """
         # Call the API to get existing rules
-        runtime = util_models.RuntimeOptions()
-        return self._client.describe_metric_rule_list_with_options(request, runtime)
+        return self._client.describe_metric_rule_list_with_options(request, self._runtime)
 
     def create_rule(
         self,
@@ -283,8 +338,7 @@ class AliyunClient:
         Returns:
             Response from the API call.
         """
-        runtime = util_models.RuntimeOptions()
-        return self._client.put_resource_metric_rule_with_options(request, runtime)
+        return self._client.put_resource_metric_rule_with_options(request, self._runtime)
 
     def delete_rules(
         self, request: cms_20190101_models.DeleteMetricRulesRequest
@@ -298,8 +352,7 @@ class AliyunClient:
             Response from the API call.
         """
         # Call the API to delete the rules
-        runtime = util_models.RuntimeOptions()
-        return self._client.delete_metric_rules_with_options(request, runtime)
+        return self._client.delete_metric_rules_with_options(request, self._runtime)
 
     def describe_project_meta(
         self, request: cms_20190101_models.DescribeProjectMetaRequest
@@ -312,8 +365,7 @@ class AliyunClient:
         Returns:
             Response from the API call.
         """
-        runtime = util_models.RuntimeOptions()
-        return self._client.describe_project_meta_with_options(request, runtime)
+        return self._client.describe_project_meta_with_options(request, self._runtime)
 
     def describe_metric_meta_list(
         self, request: cms_20190101_models.DescribeMetricMetaListRequest
@@ -326,14 +378,8 @@ class AliyunClient:
         Returns:
             Response from the API call.
         """
-        runtime = util_models.RuntimeOptions()
-        runtime.queries = {}
-        # Set page number and page size for pagination
-        if request.page_number is not None:
-            runtime.queries["PageNumber"] = request.page_number
-        if request.page_size is not None:
-            runtime.queries["PageSize"] = request.page_size
-        return self._client.describe_metric_meta_list_with_options(request, runtime)
+        # Page number and page size are sent by the SDK from the request itself
+        return self._client.describe_metric_meta_list_with_options(request, self._runtime)
 
     def describe_contact_group_list(
         self, request: cms_20190101_models.DescribeContactGroupListRequest
@@ -346,16 +392,8 @@ class AliyunClient:
         Returns:
             Response from the API call.
         """
-        runtime = util_models.RuntimeOptions()
-        runtime.read_timeout = 10000
-        runtime.connect_timeout = 5000
-        runtime.queries = {}
-        # Set page number and page size for pagination
-        if request.page_number is not None:
-            runtime.queries["PageNumber"] = request.page_number
-        if request.page_size is not None:
-            runtime.queries["PageSize"] = request.page_size
-        return self._client.describe_contact_group_list_with_options(request, runtime)
+        # Page number and page size are sent by the SDK from the request itself
+        return self._client.describe_contact_group_list_with_options(request, self._runtime)
 
     def test_connection(self):
         """Test if the Aliyun connection is working.
@@ -369,29 +407,59 @@ class AliyunClient:
         return
 
 
+@lru_cache(maxsize=128)
+def get_aliyun_client(ak: str, encrypted_sk: SecretStr, region: str) -> AliyunClient:
+    """Get the Aliyun client shared by all data sources with the same credentials and region.
+
+    Clients are cached by the encrypted secret, so decrypted secrets are never part of the cache keys and
+    the secret is only decrypted when a client is created.
+
+    Args:
+        ak: Aliyun access key id
+        encrypted_sk: Encrypted Aliyun access key secret as stored on the connect
+        region: Aliyun region
+
+    Returns:
+        AliyunClient: Shared client instance
+    """
+    return AliyunClient(ak, decrypt_secret_value(encrypted_sk), region)
+
+
+def _is_throttled(error: Exception) -> bool:
+    """Check whether an Aliyun API error was caused by flow control."""
+    code = getattr(error, "code", None) or ""
+    return code.startswith("Throttling") or "LimitExceeded" in code
+
+
+def clear_aliyun_client_cache() -> None:
+    """Drop all shared Aliyun clients, e.g. after credentials were rotated."""
+    get_aliyun_client.cache_clear()
+
+
 class AliyunDataSource(DataSource):
     """Aliyun monitoring data source implementation."""
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    region: str = Field(..., description="Aliyun region")
-    namespace: str = Field(..., description="Namespace")
-    metric_name: str = Field(..., description="Metric name")
-    group_by: Optional[List[str]] = Field(default=None, description="Group by dimensions")
-    dimensions: Optional[List[Dict[str, str]]] = Field(default=None, description="Dimensions")
+    # Frozen as the serialized request parameters below are derived from them once
+    region: str = Field(..., description="Aliyun region", frozen=True)
+    namespace: str = Field(..., description="Namespace", frozen=True)
+    metric_name: str = Field(..., description="Metric name", frozen=True)
+    group_by: Optional[List[str]] = Field(default=None, description="Group by dimensions", frozen=True)
+    dimensions: Optional[List[Dict[str, str]]] = Field(default=None, description="Dimensions", frozen=True)
 
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
         self._client = None
+        self._dimensions_json = _to_json_param(self.dimensions)
+        self._express_json = _to_json_param({"groupby": self.group_by} if self.group_by else None)
 
     @property
     def client(self) -> AliyunClient:
         """Get Aliyun client instance."""
         if self._client is None:
-            self._client = AliyunClient(
-                self.connect.aliyun_access_key_id,
-                decrypt_secret_value(self.connect.aliyun_access_key_secret),
-                self.region,
+            self._client = get_aliyun_client(
+                self.connect.aliyun_access_key_id, self.connect.aliyun_access_key_secret, self.region
             )
         return self._client
 
@@ -400,11 +468,11 @@ class AliyunDataSource(DataSource):
         self,
         namespace: str,
         metric_name: str,
-        dimensions: Optional[List[Dict[str, str]]],
+        dimensions: Optional[List[Dict[str, str]] | str],
         start_time: str,
         end_time: str,
         period: str = "60",
-        express: Optional[Dict[str, List[str]]] = None,
+        express: Optional[Dict[str, List[str]] | str] = None,
         next_token: Optional[str] = None,
     ) -> cms_20190101_models.DescribeMetricListResponse:
         """Fetch partial data for a single page from Aliyun API.
@@ -412,11 +480,11 @@ class AliyunDataSource(DataSource):
         Args:
             namespace: Namespace for the metric
             metric_name: Name of the metric
-            dimensions: Dimensions for filtering
+            dimensions: Dimensions for filtering, or their JSON string
             start_time: Start time in format 'YYYY-MM-DD HH:MM:SS'
             end_time: End time in format 'YYYY-MM-DD HH:MM:SS'
             period: Aggregation period in seconds (default: "60")
-            express: Expressions for grouping (default: None)
+            express: Expressions for grouping, or their JSON string (default: None)
             next_token: Token for pagination (default: None)
 
         Returns:
@@ -435,140 +503,163 @@ class AliyunDataSource(DataSource):
                 next_token=next_token,
             )
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _get_metric_data)
+        executor = get_executor(self.concurrency_group, self.get_concurrency_quota, EXECUTOR_THREAD_NAME_PREFIX)
+        return await asyncio.get_running_loop().run_in_executor(executor, _get_metric_data)
 
     async def _fetch_one_slot(self, start: datetime, end: datetime | None = None) -> list[InputTimeSeries]:
         """Get Aliyun monitoring data."""
-        all_data_points = await self._fetch_aliyun_data(start, end)
-        return self._convert_datapoints_to_timeseries(all_data_points)
+        # Group each page as it arrives so the raw datapoints of earlier pages can be released
+        instance_data: Dict[str, tuple] = {}
+        async with aclosing(self._iter_aliyun_pages(start, end)) as pages:
+            async for data_points in pages:
+                self._group_datapoints(data_points, instance_data)
+        return self._build_timeseries(instance_data)
 
     async def _fetch_aliyun_data(self, start: datetime, end: datetime | None = None) -> list:
         """Get monitoring data from Aliyun API."""
+        all_data_points = []
+        async with aclosing(self._iter_aliyun_pages(start, end)) as pages:
+            async for data_points in pages:
+                all_data_points.extend(data_points)
+        return all_data_points
+
+    async def _iter_aliyun_pages(self, start: datetime, end: datetime | None = None) -> AsyncIterator[list]:
+        """Yield the parsed datapoints of each page returned by the Aliyun API."""
         start_time_str = start.strftime("%Y-%m-%d %H:%M:%S")
         end_time_str = end.strftime("%Y-%m-%d %H:%M:%S")
 
-        express = {"groupby": self.group_by} if self.group_by else {}
-
-        all_data_points = []
-        next_token = None
-
-        while True:
-            resp = await self.fetch_partial_data(
-                namespace=self.namespace,
-                metric_name=self.metric_name,
-                dimensions=self.dimensions,
-                start_time=start_time_str,
-                end_time=end_time_str,
-                period=str(self.interval_seconds),
-                express=express,
-                next_token=next_token,
+        def _fetch_page(next_token: Optional[str]) -> asyncio.Task:
+            return asyncio.create_task(
+                self.fetch_partial_data(
+                    namespace=self.namespace,
+                    metric_name=self.metric_name,
+                    dimensions=self._dimensions_json,
+                    start_time=start_time_str,
+                    end_time=end_time_str,
+                    period=str(self.interval_seconds),
+                    express=self._express_json,
+                    next_token=next_token,
+                )
             )
 
-            data_points = []
-            if hasattr(resp, "body") and hasattr(resp.body, "datapoints") and resp.body.datapoints:
-                datapoints = resp.body.datapoints
-                try:
-                    data_points = json.loads(datapoints)
-                except json.JSONDecodeError as e:
-                    raise Exception(f"Failed to parse JSON data from Aliyun API: {e}")
-
-            if isinstance(data_points, list):
-                all_data_points.extend(data_points)
-
-            if hasattr(resp.body, "next_token") and resp.body.next_token:
-                next_token = resp.body.next_token
-            else:
-                break
+        next_page: Optional[asyncio.Task] = _fetch_page(None)
 
-        return all_data_points
+        try:
+            while next_page is not None:
+                resp = await next_page
+
+                # Pages are chained by next_token, request the next page before parsing this one so the parsing
+                # overlaps the round trip instead of adding to it
+                if hasattr(resp.body, "next_token") and resp.body.next_token:
+                    next_page = _fetch_page(resp.body.next_token)
+                else:
+                    next_page = None
+
+                data_points = []
+                if hasattr(resp, "body") and hasattr(resp.body, "datapoints") and resp.body.datapoints:
+                    datapoints = resp.body.datapoints
+                    try:
+                        data_points = orjson.loads(datapoints)
+                    except orjson.JSONDecodeError as e:
+                        raise Exception(f"Failed to parse JSON data from Aliyun API: {e}")
+
+                if isinstance(data_points, list):
+                    yield data_points
+        finally:
+            # Parsing failed or the consumer stopped early, the prefetched page is not needed anymore
+            if next_page is not None:
+                next_page.cancel()
+                # Wait for the page to settle and retrieve its outcome, so it neither outlives the iterator nor
+                # reports an exception that was never retrieved
+                with suppress(asyncio.CancelledError, Exception):
+                    await next_page
 
     def _convert_datapoints_to_timeseries(self, all_data_points: list) -> list[InputTimeSeries]:
         """Convert Aliyun data points to time series format."""
-        result = []
-        instance_data = {}
-
+        instance_data: Dict[str, tuple] = {}
         if isinstance(all_data_points, list):
-            for point in all_data_points:
-                try:
-                    if isinstance(point, dict):
-                        timestamp = point.get("timestamp")
-                        value = point.get("Average")
-
-                        group_key = self._get_group_key(point)
+            self._group_datapoints(all_data_points, instance_data)
+        return self._build_timeseries(instance_data)
 
-                        if timestamp:
-                            timestamp_sec = int(timestamp / 1000)
+    def _group_datapoints(self, data_points: list, instance_data: Dict[str, tuple]) -> None:
+        """Append data points to their series in instance_data.
 
-                            if group_key not in instance_data:
-                                labels = self._extract_labels(point)
-
-                                instance_data[group_key] = {"timestamps": [], "values": [], "labels": labels}
-
-                            instance_data[group_key]["timestamps"].append(timestamp_sec)
-                            instance_data[group_key]["values"].append(value)
-                except Exception as e:
-                    raise Exception(f"Failed to convert data from Aliyun API: {e}") from e
-
-            for group_key, inst_data in instance_data.items():
-                try:
-                    timestamps = []
-                    values = []
-                    for i in range(len(inst_data["timestamps"])):
-                        try:
-                            ts = inst_data["timestamps"][i]
-                            val = inst_data["values"][i]
-                            if ts is None or val is None:
-                                raise Exception(f"Timestamp or value is None at index {i}")
-                            timestamps.append(ts)
-                            values.append(float(val))
-                        except (ValueError, TypeError) as e:
-                            raise Exception(f"Failed to convert data from Aliyun API: {e}") from e
-
-                    labels = inst_data.get("labels", {})
-                    unique_key = generate_unique_key(self.metric_name, labels)
-                    result.append(
-                        InputTimeSeries(
-                            name=self.metric_name,
-                            timestamps=timestamps,
-                            values=values,
-                            labels=labels,
-                            unique_key=unique_key,
-                        )
-                    )
-                except Exception as e:
-                    raise Exception(f"Failed to convert data from Aliyun API: {e}") from e
+        Args:
+            data_points: Data points parsed from one or more Aliyun API pages
+            instance_data: Group key -> (raw timestamps in milliseconds, raw values, labels), updated in place
+        """
+        # Points of a page normally share their fields, sort the label fields once for all of them
+        fields = label_fields = None
+        for point in data_points:
+            try:
+                if isinstance(point, dict):
+                    timestamp = point.get("timestamp")
+                    if not timestamp:
+                        continue
+
+                    if fields is None:
+                        fields, label_fields = point.keys(), self._get_label_fields(point)
+                    group_key = self._get_group_key(point, label_fields if point.keys() == fields else None)
+                    series = instance_data.get(group_key)
+                    if series is None:
+                        series = instance_data[group_key] = ([], [], self._extract_labels(point))
+                    series[0].append(timestamp)
+                    series[1].append(point.get("Average"))
+            except Exception as e:
+                raise Exception(f"Failed to convert data from Aliyun API: {e}") from e
+
+    def _build_timeseries(self, instance_data: Dict[str, tuple]) -> list[InputTimeSeries]:
+        """Build time series from data points grouped by `_group_datapoints`."""
+        result = []
+        for timestamps, values, labels in instance_data.values():
+            if None in values:
+                raise Exception(
+                    f"Failed to convert data from Aliyun API: Timestamp or value is None at index {values.index(None)}"
+                )
+            # Convert whole series at once instead of point by point
+            try:
+                timestamps_sec = (np.asarray(timestamps, dtype=np.int64) // 1000).tolist()
+                float_values = np.asarray(values, dtype=np.float64).tolist()
+            except (ValueError, TypeError) as e:
+                raise Exception(f"Failed to convert data from Aliyun API: {e}") from e
+
+            result.append(
+                InputTimeSeries(
+                    name=self.metric_name,
+                    timestamps=timestamps_sec,
+                    values=float_values,
+                    labels=labels,
+                    unique_key=generate_unique_key(self.metric_name, labels),
+                )
+            )
 
         return result
 
-    def _get_group_key(self, point: dict) -> str:
-        """Determine grouping key based on actual fields in point data."""
-        # Get all fields from point except timestamp and numeric fields as group keys
-        exclude_fields = {"timestamp", "Minimum", "Maximum", "Average"}
-        group_keys = []
+    def _get_group_key(self, point: dict, label_fields: Optional[tuple] = None) -> str:
+        """Determine grouping key based on actual fields in point data.
+
+        Args:
+            point: Data point
+            label_fields: Sorted label field names of the point, if already known
 
-        for field, value in point.items():
-            if field not in exclude_fields:
-                group_keys.append(f"{field}:{value}")
+        Returns:
+            Group key of the point
+        """
+        if label_fields is None:
+            # Get all fields from point except timestamp and numeric fields as group keys,
+            # sorted by field names to ensure consistency
+            label_fields = self._get_label_fields(point)
+        return "|".join([f"{field}:{point[field]}" for field in label_fields]) or "default"
 
-        if group_keys:
-            # Sort by field names to ensure consistency
-            group_keys.sort()
-            return "|".join(group_keys)
-        else:
-            return "default"
+    @staticmethod
+    def _get_label_fields(point: dict) -> tuple:
+        """Get the sorted label field names of a data point."""
+        return tuple(sorted(field for field in point if field not in _NON_LABEL_FIELDS))
 
     def _extract_labels(self, point: dict) -> dict:
         """Extract labels from data points."""
-        labels = {}
         # Get all fields from point except timestamp and numeric fields as labels
-        exclude_fields = {"timestamp", "Minimum", "Maximum", "Average"}
-
-        for field, value in point.items():
-            if field not in exclude_fields:
-                labels[field] = str(value)
-
-        return labels
+        return {field: str(value) for field, value in point.items() if field not in _NON_LABEL_FIELDS}
 
     @property
     def concurrency_group(self) -> str:
@@ -582,6 +673,17 @@ class AliyunDataSource(DataSource):
         ak = self.connect.aliyun_access_key_id
         return f"aliyun_{ak}"
 
+    @property
+    def rule_concurrency_group(self) -> str:
+        """Get the concurrency group for Aliyun alarm rule API requests.
+
+        Rule requests are throttled apart from metric requests of the same account.
+
+        Returns:
+            str: The concurrency group identifier based on ak/sk
+        """
+        return f"{self.concurrency_group}_rule"
+
     @property
     def get_concurrency_quota(self) -> int:
         """Get the concurrency quota for Aliyun API requests.
@@ -591,6 +693,18 @@ class AliyunDataSource(DataSource):
         """
         return 10
 
+    async def _run_rule_blocking(self, func, *args):
+        """Run a blocking rule SDK call on the rule executor of this account.
+
+        The executor is sized to the concurrency quota, so concurrent rule calls run in
+        parallel without exceeding it. Every call first takes a token from the rate limiter
+        of the rule group, so listing, putting and deleting rules are throttled before
+        reaching the API rather than after.
+        """
+        return await run_rate_limited(
+            self.rule_concurrency_group, self.get_concurrency_quota, EXECUTOR_THREAD_NAME_PREFIX, func, *args
+        )
+
     @staticmethod
     def _build_labels(task) -> list:
         """Build labels for the rule from task projects, products, and customers.
@@ -628,44 +742,70 @@ class AliyunDataSource(DataSource):
         Returns:
             PutResourceMetricRuleRequestEscalations object
         """
-        escalations_critical = (
-            cms_20190101_models.PutResourceMetricRuleRequestEscalationsCritical(
-                statistics=params["statistics"],
-                comparison_operator=params["comparison_operator"],
-                threshold=params["threshold"],
-                times=params["times"],
-            )
-            if aliyun_level == "critical"
-            else None
+        escalation_cls = _ESCALATION_CLASSES.get(aliyun_level)
+        if escalation_cls is None:
+            return cms_20190101_models.PutResourceMetricRuleRequestEscalations()
+
+        escalation = escalation_cls(
+            statistics=params["statistics"],
+            comparison_operator=params["comparison_operator"],
+            threshold=params["threshold"],
+            times=params["times"],
         )
+        # The escalation field on the request is named after the aliyun level
+        return cms_20190101_models.PutResourceMetricRuleRequestEscalations(**{aliyun_level: escalation})
 
-        escalations_warn = (
-            cms_20190101_models.PutResourceMetricRuleRequestEscalationsWarn(
-                statistics=params["statistics"],
-                comparison_operator=params["comparison_operator"],
-                threshold=params["threshold"],
-                times=params["times"],
-            )
-            if aliyun_level == "warn"
-            else None
-        )
+    def _make_rule_request(
+        self,
+        rule_id: str,
+        comparison_operator: str,
+        threshold: float,
+        period_threshold_rule,
+        aliyun_level: str,
+        resources_json: str,
+        contact_groups_str: str,
+        webhook: Optional[str],
+        labels: list,
+    ) -> cms_20190101_models.PutResourceMetricRuleRequest:
+        """Build the put request for a single threshold rule.
 
-        escalations_info = (
-            cms_20190101_models.PutResourceMetricRuleRequestEscalationsInfo(
-                statistics=params["statistics"],
-                comparison_operator=params["comparison_operator"],
-                threshold=params["threshold"],
-                times=params["times"],
-            )
-            if aliyun_level == "info"
-            else None
-        )
+        Args:
+            rule_id: Rule ID, also used as the rule name
+            comparison_operator: Aliyun comparison operator for the threshold
+            threshold: Threshold value
+            period_threshold_rule: Period threshold rule providing the effective hours and window size
+            aliyun_level: The aliyun level ("critical", "warn", "info")
+            resources_json: Serialized resources the rule applies to
+            contact_groups_str: Comma separated contact group IDs
+            webhook: Webhook url
+            labels: Rule labels built by `_build_labels`
 
-        escalations = cms_20190101_models.PutResourceMetricRuleRequestEscalations(
-            critical=escalations_critical, warn=escalations_warn, info=escalations_info
+        Returns:
+            PutResourceMetricRuleRequest object
+        """
+        # Create escalations based on alarm level
+        escalations = self._create_escalations(
+            aliyun_level,
+            {
+                "statistics": "Average",
+                "comparison_operator": comparison_operator,
+                "threshold": str(threshold),
+                "times": period_threshold_rule.window_size,
+            },
+        )
+        return cms_20190101_models.PutResourceMetricRuleRequest(
+            rule_id=rule_id,
+            rule_name=rule_id,
+            namespace=self.namespace,
+            metric_name=self.metric_name,
+            contact_groups=contact_groups_str,
+            webhook=webhook,
+            resources=resources_json,
+            effective_interval=f"{period_threshold_rule.start_hour:02d}:00-{period_threshold_rule.end_hour:02d}:00",
+            interval="60",
+            escalations=escalations,
+            labels=labels,
         )
-
-        return escalations
 
     def _generate_rules(self, task=None, task_version=None, contact_group_ids=None, webhook=None, alarm_level=None):
         """Generate desired rule keys from task result.
@@ -690,103 +830,101 @@ class AliyunDataSource(DataSource):
             alarm_level = getattr(task, "alarm_level", EventLevel.P2) if task else EventLevel.P2
         aliyun_level = AliyunRuleConfig.convert_alarm_level_to_aliyun_level(alarm_level)
 
+        # Shared by every rule generated for this task
+        labels = self._build_labels(task)
+        contact_groups_str = ",".join(contact_group_ids or [])
+
         for metric_threshold_result in task_version.result or []:
             unique_key = metric_threshold_result.unique_key
+            # Labels are shared by every period rule of this result, serialize them once
+            resources_json = orjson.dumps([{k: str(v) for k, v in metric_threshold_result.labels.items()}]).decode()
             for period_threshold_rule in metric_threshold_result.thresholds:
-                if period_threshold_rule.upper_bound is not None:
-                    rule_id = (
-                        f"{self.name}-{unique_key}-upper-"
-                        f"{period_threshold_rule.start_hour}-"
-                        f"{period_threshold_rule.end_hour}"
-                    )
-
-                    # Create escalations based on alarm level
-                    escalations_params = {
-                        "statistics": "Average",
-                        "comparison_operator": "GreaterThanThreshold",
-                        "threshold": str(period_threshold_rule.upper_bound),
-                        "times": period_threshold_rule.window_size,
-                    }
-
-                    escalations = self._create_escalations(aliyun_level, escalations_params)
-                    put_resource_metric_rule_request = cms_20190101_models.PutResourceMetricRuleRequest(
-                        rule_id=rule_id,
-                        rule_name=rule_id,
-                        namespace=self.namespace,
-                        metric_name=self.metric_name,
-                        contact_groups=",".join(contact_group_ids if contact_group_ids else []),
-                        webhook=webhook,
-                        resources=json.dumps([{k: str(v) for k, v in metric_threshold_result.labels.items()}]),
-                        effective_interval=f"{period_threshold_rule.start_hour:02d}:00-"
-                        f"{period_threshold_rule.end_hour:02d}:00",
-                        interval="60",
-                        escalations=escalations,
-                        labels=self._build_labels(task),
-                    )
+                for direction, comparison_operator, threshold in (
+                    ("upper", "GreaterThanThreshold", period_threshold_rule.upper_bound),
+                    ("lower", "LessThanThreshold", period_threshold_rule.lower_bound),
+                ):
+                    if threshold is None:
+                        continue
 
-                    result_rule_keys[rule_id] = put_resource_metric_rule_request
-
-                if period_threshold_rule.lower_bound is not None:
                     rule_id = (
-                        f"{self.name}-{unique_key}-lower-"
+                        f"{self.name}-{unique_key}-{direction}-"
                         f"{period_threshold_rule.start_hour}-"
                         f"{period_threshold_rule.end_hour}"
                     )
-
-                    # Create escalations based on alarm level
-                    escalations_params = {
-                        "statistics": "Average",
-                        "comparison_operator": "LessThanThreshold",
-                        "threshold": str(period_threshold_rule.lower_bound),
-                        "times": period_threshold_rule.window_size,
-                    }
-
-                    escalations = self._create_escalations(aliyun_level, escalations_params)
-                    put_resource_metric_rule_request = cms_20190101_models.PutResourceMetricRuleRequest(
+                    result_rule_keys[rule_id] = self._make_rule_request(
                         rule_id=rule_id,
-                        rule_name=rule_id,
-                        namespace=self.namespace,
-                        metric_name=self.metric_name,
-                        contact_groups=",".join(contact_group_ids if contact_group_ids else []),
+                        comparison_operator=comparison_operator,
+                        threshold=threshold,
+                        period_threshold_rule=period_threshold_rule,
+                        aliyun_level=aliyun_level,
+                        resources_json=resources_json,
+                        contact_groups_str=contact_groups_str,
                         webhook=webhook,
-                        resources=json.dumps([{k: str(v) for k, v in metric_threshold_result.labels.items()}]),
-                        effective_interval=f"{period_threshold_rule.start_hour:02d}:00-"
-                        f"{period_threshold_rule.end_hour:02d}:00",
-                        interval="60",
-                        escalations=escalations,
-                        labels=self._build_labels(task),
+                        labels=labels,
                     )
 
-                    result_rule_keys[rule_id] = put_resource_metric_rule_request
-
         return result_rule_keys
 
-    def _list_rules(self):
-        """List existing rules from Aliyun.
+    def _describe_rules_page(self, page: int):
+        """Fetch one page of existing rules from Aliyun.
+
+        Args:
+            page: Page number, starting at 1
 
         Returns:
-            Dict mapping rule ID to existing rules
+            DescribeMetricRuleList response for the page
         """
         request = cms_20190101_models.DescribeMetricRuleListRequest(
             namespace=self.namespace,
             metric_name=self.metric_name,
             rule_name=f"{self.name}",
+            page=page,
+            page_size=LIST_RULES_PAGE_SIZE,
         )
+        return self.client.get_existing_rules(request)
+
+    @staticmethod
+    def _get_page_rule_ids(response) -> List[str]:
+        """Extract the rule IDs of a DescribeMetricRuleList response.
+
+        Raises:
+            ValueError: If an alarm has no rule ID
+        """
+        alarms = []
+        if hasattr(response, "body") and hasattr(response.body, "alarms"):
+            if response.body.alarms and hasattr(response.body.alarms, "alarm"):
+                alarms = response.body.alarms.alarm or []
+
+        rule_ids = [alarm.rule_id for alarm in alarms]
+        if not all(rule_ids):
+            missing = next(alarm for alarm in alarms if not alarm.rule_id)
+            raise ValueError(f"Rule ID is None for alarm: {missing}")
+        return rule_ids
+
+    async def _list_rules(self) -> Dict[str, None]:
+        """List existing rules from Aliyun.
 
+        The first page reports the total number of rules, the remaining pages are
+        then fetched concurrently on the rule executor. Only the rule IDs are kept,
+        not the alarm objects, as rule comparison and deletion only need the IDs.
+
+        Returns:
+            Dict keyed by existing rule ID, in listing order
+        """
         try:
-            response = self.client.get_existing_rules(request)
-            existing_rule_keys = {}
-
-            if hasattr(response, "body") and hasattr(response.body, "alarms"):
-                alarms = response.body.alarms
-                if alarms and hasattr(alarms, "alarm"):
-                    for alarm in alarms.alarm:
-                        rule_id = getattr(alarm, "rule_id", None)
-                        if not rule_id:
-                            raise ValueError(f"Rule ID is None for alarm: {alarm}")
-                        existing_rule_keys[rule_id] = alarm
-
-            return existing_rule_keys
+            first_page = await self._run_rule_blocking(self._describe_rules_page, 1)
+            rule_ids = self._get_page_rule_ids(first_page)
+
+            total = int(getattr(first_page.body, "total", None) or 0)
+            page_count = -(-total // LIST_RULES_PAGE_SIZE)
+            if page_count > 1:
+                pages = await asyncio.gather(
+                    *(self._run_rule_blocking(self._describe_rules_page, page) for page in range(2, page_count + 1))
+                )
+                for page in pages:
+                    rule_ids.extend(self._get_page_rule_ids(page))
+
+            return dict.fromkeys(rule_ids)
         except Exception as e:
             logger.error(f"Failed to list existing rules: {e}")
             raise
@@ -796,7 +934,7 @@ class AliyunDataSource(DataSource):
         """Compare existing rules with desired rules.
 
         Args:
-            existing_rules: Dict of existing rules
+            existing_rules: Dict keyed by existing rule ID
             desired_rules: Dict of desired rules
 
         Returns:
@@ -804,18 +942,12 @@ class AliyunDataSource(DataSource):
         """
         create_rules = []
         update_rules = []
-        delete_rule_ids = []
 
+        # Partition desired rules in one pass, keeping their order
         for rule_id, desired_period_rule in desired_rules.items():
-            existing_period_rule = existing_rules.get(rule_id)
-            if not existing_period_rule:
-                create_rules.append(desired_period_rule)
-            else:
-                update_rules.append(desired_period_rule)
+            (update_rules if rule_id in existing_rules else create_rules).append(desired_period_rule)
 
-        for rule_id in existing_rules.keys():
-            if rule_id not in desired_rules:
-                delete_rule_ids.append(rule_id)
+        delete_rule_ids = [rule_id for rule_id in existing_rules if rule_id not in desired_rules]
 
         return create_rules, update_rules, delete_rule_ids
 
@@ -826,14 +958,14 @@ class AliyunDataSource(DataSource):
             rule: Rule object to create
 
         Returns:
-            Creation or update detail dictionary
+            Creation or update detail dictionary, holding the raw SDK response
         """
         try:
             response = self.client.create_rule(rule)
             return {
                 "rule_id": rule.rule_id,
                 "status": "success",
-                "response": response.to_dict() if hasattr(response, "to_dict") else str(response),
+                "response": response,
             }
         except Exception as e:
             logger.exception(f"Failed to put rule {rule.rule_id}: {e}")
@@ -846,7 +978,7 @@ class AliyunDataSource(DataSource):
             rule_ids: List of rule IDs to delete
 
         Returns:
-            Deletion detail dictionary
+            Deletion detail dictionary, holding the raw SDK response
         """
         try:
             request = cms_20190101_models.DeleteMetricRulesRequest(id=rule_ids)
@@ -855,39 +987,60 @@ class AliyunDataSource(DataSource):
             return {
                 "rule_ids": rule_ids,
                 "status": "success",
-                "response": response.to_dict() if hasattr(response, "to_dict") else str(response),
+                "response": response,
             }
         except Exception as e:
             logger.exception(f"Failed to delete rules {rule_ids}: {e}")
             raise
 
-    async def delete_all_rules(self) -> None:
+    async def delete_all_rules(self, batch_size: int = DELETE_RULES_BATCH_SIZE) -> None:
         """Delete all alarm rules associated with this data source.
 
         This method retrieves all rules associated with the current data source
         and deletes them in batches to avoid API limitations.
+
+        Args:
+            batch_size: Maximum number of rule IDs sent in a single DeleteMetricRules request
         """
         # Get all rules associated with this data source
-        existing_rules = self._list_rules()
+        existing_rules = await self._list_rules()
 
         if not existing_rules:
             logger.info("No rules found to delete for data source")
             return
 
-        # Extract rule IDs for deletion
-        rule_ids = list(existing_rules.keys())
-        logger.info(f"Found {len(rule_ids)} rules to delete")
+        logger.info(f"Found {len(existing_rules)} rules to delete")
+
+        # Batches are deleted concurrently on the rule executor, which is sized to the concurrency quota
+        async def _delete_batch(batch: List[str]):
+            """Delete a batch of rules, backing off while the API is throttling."""
+            max_retries = 3
+            retry_interval = 1  # Initial retry interval in seconds
+
+            for attempt in range(max_retries + 1):
+                try:
+                    result = await self._run_rule_blocking(self._delete_rules, batch)
+                    logger.info(f"Deleted batch of {len(batch)} rules")
+                    return result
+                except Exception as e:
+                    if attempt == max_retries or not _is_throttled(e):
+                        raise
+                    delay = retry_interval * (2**attempt) * (1 + random.random())  # Exponential backoff with jitter
+                    logger.warning(f"Deleting rules throttled, retrying in {delay:.1f}s: {e}")
+                    await asyncio.sleep(delay)
 
         # Delete rules in batches (Aliyun may have limits on bulk deletions)
-        batch_size = 10  # Adjust based on Aliyun's API limits
+        results = await asyncio.gather(
+            *(_delete_batch(list(batch)) for batch in batched(existing_rules, batch_size)),
+            return_exceptions=True,
+        )
 
-        for i in range(0, len(rule_ids), batch_size):
-            batch = rule_ids[i : i + batch_size]
-            # Delete the batch of rules
-            self._delete_rules(batch)
-            logger.info(f"Deleted batch of {len(batch)} rules")
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            error = errors[0]
+            raise Exception(f"Failed to delete {len(errors)} of {len(results)} rule batches: {error}") from error
 
-        logger.info(f"Successfully deleted all {len(rule_ids)} rules")
+        logger.info(f"Successfully deleted all {len(existing_rules)} rules")
 
     async def sync_rules_for_intelligent_threshold_task(self, **kwargs) -> Dict[str, Any]:
         """Synchronizes alarm rules with concurrent execution for better performance.
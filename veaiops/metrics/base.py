@@ -15,9 +15,10 @@
 import abc
 import asyncio
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Literal
@@ -37,12 +38,18 @@ __all__ = [
     "DataSource",
     "DataSourceTypeLiteralType",
     "generate_unique_key",
+    "get_executor",
     "rate_limit",
+    "run_rate_limited",
     "BaseRuleConfig",
     "BaseRuleSynchronizer",
 ]
 
 
+# Number of times a call rejected with HTTP 429 is retried after penalizing its bucket
+RATE_LIMIT_MAX_RETRIES = 3
+
+
 # Rate limiter implementation
 class RateLimiter:
     """Rate limiter for controlling QPS."""
@@ -64,7 +71,7 @@ class RateLimiter:
         while True:
             lock = cls._get_lock(key)
             async with lock:
-                now = asyncio.get_event_loop().time()
+                now = asyncio.get_running_loop().time()
                 bucket = cls._buckets.get(key) or {"tokens": float(qps), "last_refill": now, "qps": qps}
                 # refill
                 time_passed = now - bucket["last_refill"]
@@ -78,6 +85,85 @@ class RateLimiter:
                 cls._buckets[key] = bucket
             await asyncio.sleep(wait_time)
 
+    @classmethod
+    async def penalize(cls, group: str, qps: int):
+        """Drain the bucket below zero after the remote side rejected a call as rate limited.
+
+        The next token only becomes available after the bucket has refilled for longer than
+        one regular interval, which keeps concurrent callers from retrying in a tight loop.
+        """
+        key = f"{group}_{qps}"
+        async with cls._get_lock(key):
+            now = asyncio.get_running_loop().time()
+            cls._buckets[key] = {"tokens": -1.0, "last_refill": now, "qps": qps}
+
+
+# Executors running blocking SDK calls, one per concurrency group and size so that slow calls of one account neither
+# starve other accounts nor the default executor shared with the rest of the process
+_executors: Dict[Tuple[str, int], ThreadPoolExecutor] = {}
+
+
+def get_executor(group: str, max_workers: int, thread_name_prefix: str = "") -> ThreadPoolExecutor:
+    """Get the executor for blocking SDK calls of a concurrency group, creating it on first use.
+
+    Executors are keyed by group and size, so a caller asking for a different number of workers
+    never silently shares an executor sized for another caller.
+
+    Args:
+        group: Concurrency group of the calls
+        max_workers: Number of worker threads, usually the concurrency quota of the group
+        thread_name_prefix: Prefix of the worker thread names
+
+    Returns:
+        ThreadPoolExecutor: Executor shared by all calls of the group with the same size
+    """
+    key = (group, max_workers)
+    executor = _executors.get(key)
+    if executor is None:
+        executor = _executors[key] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+    return executor
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an SDK error is an HTTP 429 Too Many Requests response."""
+    return getattr(error, "status", None) == 429
+
+
+async def _call_rate_limited(group: str, qps: int, call):
+    """Await `call()` after taking a token from the rate limiter of a group.
+
+    Calls rejected with HTTP 429 penalize the bucket of the group and are retried.
+    """
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        logger.debug(f"Acquiring token for group {group} with QPS {qps}")
+        await RateLimiter.acquire_token(group, qps)
+
+        try:
+            return await call()
+        except Exception as e:
+            if not _is_rate_limited(e) or attempt == RATE_LIMIT_MAX_RETRIES:
+                raise
+            logger.warning(f"Rate limited in group {group}, retrying ({attempt + 1}/{RATE_LIMIT_MAX_RETRIES})")
+            await RateLimiter.penalize(group, qps)
+
+
+async def run_rate_limited(group: str, qps: int, thread_name_prefix: str, func, *args):
+    """Run a blocking SDK call on the executor of a concurrency group, throttled by its rate limiter.
+
+    Args:
+        group: Concurrency group of the call
+        qps: Concurrency quota of the group, used as rate limit and executor size
+        thread_name_prefix: Prefix of the executor thread names
+        func: Blocking function to call
+        *args: Positional arguments of the function
+
+    Returns:
+        Result of the function
+    """
+    executor = get_executor(group, qps, thread_name_prefix)
+    loop = asyncio.get_running_loop()
+    return await _call_rate_limited(group, qps, lambda: loop.run_in_executor(executor, func, *args))
+
 
 def rate_limit(func):
     """Decorator: Rate limiting based on data source's concurrency group and QPS quota."""
@@ -100,14 +186,14 @@ def rate_limit(func):
         else:
             qps = self.get_concurrency_quota
 
-        logger.debug(f"Acquiring token for group {group} with QPS {qps}")
-        await RateLimiter.acquire_token(group, qps)
+        async def call():
+            # Determine how to call based on whether the decorated function is a coroutine
+            if asyncio.iscoroutinefunction(func):
+                return await func(self, *args, **kwargs)
+            else:
+                return func(self, *args, **kwargs)
 
-        # Determine how to call based on whether the decorated function is a coroutine
-        if asyncio.iscoroutinefunction(func):
-            return await func(self, *args, **kwargs)
-        else:
-            return func(self, *args, **kwargs)
+        return await _call_rate_limited(group, qps, call)
 
     return wrapper
 
@@ -15,18 +15,33 @@
 """Data source factory for creating appropriate data source instances based on configuration."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from veaiops.metrics.aliyun import AliyunDataSource
 from veaiops.metrics.base import DataSource
 from veaiops.metrics.volcengine import VolcengineDataSource
 from veaiops.metrics.zabbix import ZabbixDataSource
 from veaiops.schema.documents import DataSource as DataSourceDocument
+from veaiops.schema.types import DataSourceType
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["DataSourceFactory"]
 
+# Document attribute holding the configuration of each data source type
+_CONFIG_ATTR = {
+    DataSourceType.Zabbix: "zabbix_config",
+    DataSourceType.Aliyun: "aliyun_config",
+    DataSourceType.Volcengine: "volcengine_config",
+}
+
+# Configuration fields reported by get_config_summary for each data source type
+_SUMMARY_FIELDS = {
+    DataSourceType.Zabbix: ("metric_name",),
+    DataSourceType.Aliyun: ("region", "namespace", "metric_name"),
+    DataSourceType.Volcengine: ("region", "namespace", "metric_name", "sub_namespace"),
+}
+
 
 class DataSourceFactory:
     """Factory class for creating data source instances based on configuration."""
@@ -55,15 +70,13 @@ class DataSourceFactory:
             "name": doc.name,
             "interval_seconds": 60,  # Default interval
         }
+        if doc.connect:
+            common_params["connect"] = doc.connect
 
-        if doc.type == "Zabbix":
-            return DataSourceFactory._create_zabbix_datasource(doc, common_params)
-        elif doc.type == "Aliyun":
-            return DataSourceFactory._create_aliyun_datasource(doc, common_params)
-        elif doc.type == "Volcengine":
-            return DataSourceFactory._create_volcengine_datasource(doc, common_params)
-        else:
+        builder = _BUILDERS.get(doc.type)
+        if builder is None:
             raise ValueError(f"Unsupported data source type: {doc.type}")
+        return builder(doc, common_params)
 
     @staticmethod
     def _create_zabbix_datasource(doc: DataSourceDocument, common_params: Dict[str, Any]) -> ZabbixDataSource:
@@ -71,25 +84,29 @@ class DataSourceFactory:
         if not doc.zabbix_config:
             raise ValueError("Zabbix configuration is required for Zabbix data source")
 
-        params = {**common_params}
+        config = doc.zabbix_config
 
         # Map zabbix_config to ZabbixDataSource parameters
-        if doc.zabbix_config.metric_name:
-            params["metric_name"] = doc.zabbix_config.metric_name
-
-        if doc.zabbix_config.history_type:
-            params["history_type"] = doc.zabbix_config.history_type
+        params = {
+            **common_params,
+            **{
+                key: value
+                for key, value in (
+                    ("metric_name", config.metric_name),
+                    ("history_type", config.history_type),
+                )
+                if value
+            },
+        }
 
         # Convert targets to ZabbixTarget objects
-        if doc.zabbix_config.targets:
+        if config.targets:
             from veaiops.metrics.zabbix import ZabbixTarget
 
             params["targets"] = [
-                ZabbixTarget(itemid=target.itemid, hostname=target.hostname) for target in doc.zabbix_config.targets
+                ZabbixTarget(itemid=target.itemid, hostname=target.hostname) for target in config.targets
             ]
 
-        if doc.connect:
-            params["connect"] = doc.connect
         return ZabbixDataSource(**params)
 
     @staticmethod
@@ -98,21 +115,23 @@ class DataSourceFactory:
         if not doc.aliyun_config:
             raise ValueError("Aliyun configuration is required for Aliyun data source")
 
-        params = {**common_params}
+        config = doc.aliyun_config
 
         # Map aliyun_config to AliyunDataSource parameters
-        if doc.aliyun_config.region:
-            params["region"] = doc.aliyun_config.region
-        if doc.aliyun_config.namespace:
-            params["namespace"] = doc.aliyun_config.namespace
-        if doc.aliyun_config.metric_name:
-            params["metric_name"] = doc.aliyun_config.metric_name
-        if doc.aliyun_config.dimensions:
-            params["dimensions"] = doc.aliyun_config.dimensions
-        if doc.aliyun_config.group_by:
-            params["group_by"] = doc.aliyun_config.group_by
-        if doc.connect:
-            params["connect"] = doc.connect
+        params = {
+            **common_params,
+            **{
+                key: value
+                for key, value in (
+                    ("region", config.region),
+                    ("namespace", config.namespace),
+                    ("metric_name", config.metric_name),
+                    ("dimensions", config.dimensions),
+                    ("group_by", config.group_by),
+                )
+                if value
+            },
+        }
 
         return AliyunDataSource(**params)
 
@@ -122,33 +141,35 @@ class DataSourceFactory:
         if not doc.volcengine_config:
             raise ValueError("Volcengine configuration is required for Volcengine data source")
 
-        params = {**common_params}
+        config = doc.volcengine_config
 
         # Map volcengine_config to VolcengineDataSource parameters
-        if doc.volcengine_config.region:
-            params["region"] = doc.volcengine_config.region
-        if doc.volcengine_config.namespace:
-            params["namespace"] = doc.volcengine_config.namespace
-        if doc.volcengine_config.metric_name:
-            params["metric_name"] = doc.volcengine_config.metric_name
-        if doc.volcengine_config.sub_namespace:
-            params["sub_namespace"] = doc.volcengine_config.sub_namespace
-        if doc.volcengine_config.group_by:
-            params["group_by"] = doc.volcengine_config.group_by
-        if doc.connect:
-            params["connect"] = doc.connect
+        params = {
+            **common_params,
+            **{
+                key: value
+                for key, value in (
+                    ("region", config.region),
+                    ("namespace", config.namespace),
+                    ("metric_name", config.metric_name),
+                    ("sub_namespace", config.sub_namespace),
+                    ("group_by", config.group_by),
+                )
+                if value
+            },
+        }
         # Convert instances format
-        if doc.volcengine_config.instances:
+        if config.instances:
             from volcenginesdkvolcobserve import DimensionForGetMetricDataInput, InstanceForGetMetricDataInput
 
-            instances = []
-            for instance_dict in doc.volcengine_config.instances:
-                dimensions = []
-                for key, value in instance_dict.items():
-                    dimensions.append(DimensionForGetMetricDataInput(name=key, value=value))
-                instances.append(InstanceForGetMetricDataInput(dimensions=dimensions))
-
-            params["instances"] = instances
+            params["instances"] = [
+                InstanceForGetMetricDataInput(
+                    dimensions=[
+                        DimensionForGetMetricDataInput(name=key, value=value) for key, value in instance.items()
+                    ]
+                )
+                for instance in config.instances
+            ]
 
         return VolcengineDataSource(**params)
 
@@ -165,14 +186,8 @@ class DataSourceFactory:
         if not doc:
             return False
 
-        config_map = {
-            "Zabbix": doc.zabbix_config,
-            "Aliyun": doc.aliyun_config,
-            "Volcengine": doc.volcengine_config,
-        }
-
-        required_config = config_map.get(doc.type)
-        return required_config is not None
+        config_attr = _CONFIG_ATTR.get(doc.type)
+        return config_attr is not None and getattr(doc, config_attr) is not None
 
     @staticmethod
     def get_config_summary(doc: DataSourceDocument) -> Dict[str, Any]:
@@ -187,29 +202,19 @@ class DataSourceFactory:
             "is_active": doc.is_active,
         }
 
-        if doc.type == "Zabbix" and doc.zabbix_config:
-            summary.update(
-                {
-                    "metric_name": doc.zabbix_config.metric_name,
-                    "targets_count": len(doc.zabbix_config.targets or []),
-                }
-            )
-        elif doc.type == "Aliyun" and doc.aliyun_config:
-            summary.update(
-                {
-                    "region": doc.aliyun_config.region,
-                    "namespace": doc.aliyun_config.namespace,
-                    "metric_name": doc.aliyun_config.metric_name,
-                }
-            )
-        elif doc.type == "Volcengine" and doc.volcengine_config:
-            summary.update(
-                {
-                    "region": doc.volcengine_config.region,
-                    "namespace": doc.volcengine_config.namespace,
-                    "metric_name": doc.volcengine_config.metric_name,
-                    "sub_namespace": doc.volcengine_config.sub_namespace,
-                }
-            )
+        config_attr = _CONFIG_ATTR.get(doc.type)
+        config = getattr(doc, config_attr) if config_attr else None
+        if config:
+            summary.update({field: getattr(config, field) for field in _SUMMARY_FIELDS[doc.type]})
+            if doc.type == DataSourceType.Zabbix:
+                summary["targets_count"] = len(config.targets or [])
 
         return summary
+
+
+# Data source builders keyed by data source type
+_BUILDERS: Dict[str, Callable[[DataSourceDocument, Dict[str, Any]], DataSource]] = {
+    DataSourceType.Zabbix: DataSourceFactory._create_zabbix_datasource,
+    DataSourceType.Aliyun: DataSourceFactory._create_aliyun_datasource,
+    DataSourceType.Volcengine: DataSourceFactory._create_volcengine_datasource,
+}
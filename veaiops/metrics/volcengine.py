@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import functools
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import batched
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import volcenginesdkcore
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, SecretStr
 from volcenginesdkvolcobserve import (
     ConditionForCreateRuleInput,
     ConditionForUpdateRuleInput,
@@ -42,7 +45,9 @@ from veaiops.metrics.base import (
     BaseRuleSynchronizer,
     DataSource,
     generate_unique_key,
+    get_executor,
     rate_limit,
+    run_rate_limited,
 )
 from veaiops.metrics.timeseries import InputTimeSeries
 from veaiops.schema.types import EventLevel
@@ -51,6 +56,27 @@ from veaiops.utils.log import logger
 
 __all__ = ["VolcengineDataSource", "VolcengineClient"]
 
+_VOLCENGINE_LEVEL_MAPPING = {EventLevel.P0: "critical", EventLevel.P1: "warning", EventLevel.P2: "notice"}
+
+# Maximum number of rule IDs sent in a single DeleteRulesByIds request
+DELETE_RULES_BATCH_SIZE = 10
+
+# Name prefix of the threads running blocking Volcengine SDK calls
+EXECUTOR_THREAD_NAME_PREFIX = "volc-observe"
+
+
+def _require_region(func):
+    """Decorator: resolve the `region` keyword to the client region and require one of them to be set."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, region: Optional[str] = None, **kwargs):
+        region = region or self.region
+        if not region:
+            raise ValueError("Region must be provided either in constructor or method call")
+        return func(self, *args, region=region, **kwargs)
+
+    return wrapper
+
 
 class VolcengineClient:
     """Unified client for managing Volcengine metrics and alarm rules."""
@@ -60,19 +86,34 @@ class VolcengineClient:
         self.sk = sk
         self.region = region
         self._api_instance = None
+        self._api_by_region: Dict[str, VOLCOBSERVEApi] = {}
+
+    def _create_api(self, region: Optional[str]) -> VOLCOBSERVEApi:
+        """Create a Volcengine OBSERVE API instance for a region."""
+        configuration = volcenginesdkcore.Configuration()
+        configuration.ak = self.ak
+        configuration.sk = self.sk
+        if region:
+            configuration.region = region
+        return VOLCOBSERVEApi(volcenginesdkcore.ApiClient(configuration))
 
     @property
     def api_instance(self):
         """Get Volcengine OBSERVE API instance."""
         if self._api_instance is None:
-            configuration = volcenginesdkcore.Configuration()
-            configuration.ak = self.ak
-            configuration.sk = self.sk
-            if self.region:
-                configuration.region = self.region
-            self._api_instance = VOLCOBSERVEApi(volcenginesdkcore.ApiClient(configuration))
+            self._api_instance = self._create_api(self.region)
         return self._api_instance
 
+    def _get_api(self, region: str) -> VOLCOBSERVEApi:
+        """Get the API instance for a region, reusing it so its connection pool stays warm."""
+        if region == self.region:
+            return self.api_instance
+        api = self._api_by_region.get(region)
+        if api is None:
+            api = self._api_by_region[region] = self._create_api(region)
+        return api
+
+    @_require_region
     def get_metric_data(
         self,
         namespace: str,
@@ -86,16 +127,6 @@ class VolcengineClient:
         group_by=None,
     ):
         """Fetch metric data from Volcengine."""
-        current_region = region or self.region
-        if not current_region:
-            raise ValueError("Region must be provided either in constructor or method call")
-
-        configuration = volcenginesdkcore.Configuration()
-        configuration.ak = self.ak
-        configuration.sk = self.sk
-        configuration.region = current_region
-        api_instance = VOLCOBSERVEApi(volcenginesdkcore.ApiClient(configuration))
-
         req = GetMetricDataRequest(
             namespace=namespace,
             sub_namespace=sub_namespace,
@@ -107,46 +138,39 @@ class VolcengineClient:
             group_by=group_by,
         )
 
-        resp = api_instance.get_metric_data(req)
+        resp = self._get_api(region).get_metric_data(req)
         return resp.to_dict()
 
+    @_require_region
     def create_rule(self, req: CreateRuleRequest, region: str = None) -> Dict[str, Any]:
         """Create an alarm rule.
 
         Wraps the CreateRule API.
         """
-        current_region = region or self.region
-        if not current_region:
-            raise ValueError("Region must be provided either in constructor or method call")
         resp = self.api_instance.create_rule(req)
         return resp.to_dict()
 
+    @_require_region
     def update_rule(self, req: UpdateRuleRequest, region: str = None) -> Dict[str, Any]:
         """Update an alarm rule.
 
         Wraps the UpdateRule API.
         """
-        current_region = region or self.region
-        if not current_region:
-            raise ValueError("Region must be provided either in constructor or method call")
-
         resp = self.api_instance.update_rule(req)
         return resp.to_dict()
 
+    @_require_region
     def delete_rules(self, rule_ids: List[str], region: str = None) -> Dict[str, Any]:
         """Delete one or more alarm rules by their IDs.
 
         Wraps the DeleteRulesByIds API.
         """
-        current_region = region or self.region
-        if not current_region:
-            raise ValueError("Region must be provided either in constructor or method call")
-
         req = DeleteRulesByIdsRequest(ids=rule_ids)
 
         resp = self.api_instance.delete_rules_by_ids(req)
         return resp.to_dict()
 
+    @_require_region
     def list_rules(
         self,
         page_number: int = 1,
@@ -163,10 +187,6 @@ class VolcengineClient:
 
         Wraps the ListRulesByPage API.
         """
-        current_region = region or self.region
-        if not current_region:
-            raise ValueError("Region must be provided either in constructor or method call")
-
         req = ListRulesRequest(
             project_name=project_name,
             page_number=page_number,
@@ -266,6 +286,29 @@ class VolcengineClient:
         return
 
 
+@functools.lru_cache(maxsize=128)
+def get_volcengine_client(ak: str, encrypted_sk: SecretStr, region: str) -> VolcengineClient:
+    """Get the Volcengine client shared by all data sources with the same credentials and region.
+
+    Clients are cached by the encrypted secret, so decrypted secrets are never part of the cache keys and
+    the secret is only decrypted when a client is created.
+
+    Args:
+        ak: Volcengine access key id
+        encrypted_sk: Encrypted Volcengine access key secret as stored on the connect
+        region: Volcengine region
+
+    Returns:
+        VolcengineClient: Shared client instance
+    """
+    return VolcengineClient(ak=ak, sk=decrypt_secret_value(encrypted_sk), region=region)
+
+
+def clear_volcengine_client_cache() -> None:
+    """Drop all shared Volcengine clients, e.g. after credentials were rotated."""
+    get_volcengine_client.cache_clear()
+
+
 class VolcengineDataSource(DataSource):
     """Volcengine data source implementation."""
 
@@ -285,10 +328,8 @@ class VolcengineDataSource(DataSource):
     def client(self):
         """Get Volcengine client instance."""
         if self._client is None:
-            self._client = VolcengineClient(
-                ak=self.connect.volcengine_access_key_id,
-                sk=decrypt_secret_value(self.connect.volcengine_access_key_secret),
-                region=self.region,
+            self._client = get_volcengine_client(
+                self.connect.volcengine_access_key_id, self.connect.volcengine_access_key_secret, self.region
             )
         return self._client
 
@@ -324,22 +365,20 @@ class VolcengineDataSource(DataSource):
         Returns:
             Response from the Volcengine API
         """
-
-        def _get_metric_data(*args):
-            return self.client.get_metric_data(
-                namespace=namespace,
-                sub_namespace=sub_namespace,
-                metric_name=metric_name,
-                start_time=start_time,
-                end_time=end_time,
-                period=period,
-                region=region,
-                instances=instances,
-                group_by=group_by,
-            )
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _get_metric_data)
+        get_metric_data = functools.partial(
+            self.client.get_metric_data,
+            namespace=namespace,
+            sub_namespace=sub_namespace,
+            metric_name=metric_name,
+            start_time=start_time,
+            end_time=end_time,
+            period=period,
+            region=region,
+            instances=instances,
+            group_by=group_by,
+        )
+        executor = get_executor(self.concurrency_group, self.get_concurrency_quota, EXECUTOR_THREAD_NAME_PREFIX)
+        return await asyncio.get_running_loop().run_in_executor(executor, get_metric_data)
 
     async def _fetch_one_slot(self, start: datetime, end: datetime | None = None) -> list[InputTimeSeries]:
         """Fetch metric data from Volcengine."""
@@ -371,9 +410,9 @@ class VolcengineDataSource(DataSource):
 
             timestamps, values = self._extract_timestamps_and_values(data_points)
 
-            labels = self._extract_labels(dimensions)
-
-            if timestamps and values:
+            # Timestamps and values always have the same length, empty series are skipped
+            if timestamps:
+                labels = self._extract_labels(dimensions)
                 unique_key = generate_unique_key(self.metric_name, labels)
                 result.append(
                     InputTimeSeries(
@@ -390,41 +429,49 @@ class VolcengineDataSource(DataSource):
     @staticmethod
     def _extract_timestamps_and_values(data_points):
         """Extract timestamps and values from data points."""
-        timestamps = []
-        values = []
-
         if not isinstance(data_points, list):
             data_points = [data_points] if data_points else []
 
-        for point in data_points:
-            if not isinstance(point, dict):
-                raise Exception(f"Data point is not a dictionary: {point}")
-
-            if "timestamp" not in point:
-                raise Exception(f"Missing 'timestamp' field in data point: {point}")
-
-            timestamp = point["timestamp"]
-            if timestamp > 1e10:  # If it's a millisecond timestamp
-                timestamp = timestamp // 1000
-            timestamps.append(int(timestamp))
-
-            if "value" not in point:
-                raise Exception(f"Missing 'value' field in data point: {point}")
+        try:
+            raw_timestamps = [point["timestamp"] for point in data_points]
+            raw_values = [point["value"] for point in data_points]
+        except (KeyError, TypeError):
+            # Locate the offending data point only when the fast path failed
+            for point in data_points:
+                if not isinstance(point, dict):
+                    raise Exception(f"Data point is not a dictionary: {point}")
+                if "timestamp" not in point:
+                    raise Exception(f"Missing 'timestamp' field in data point: {point}")
+                if "value" not in point:
+                    raise Exception(f"Missing 'value' field in data point: {point}")
+            raise
 
-            value = point["value"]
-            values.append(float(value))
+        # NumPy would turn None into NaN instead of failing like float(None)
+        if None in raw_timestamps or None in raw_values:
+            index = raw_timestamps.index(None) if None in raw_timestamps else raw_values.index(None)
+            raise Exception(f"Failed to convert data from Volcengine API: Timestamp or value is None at index {index}")
+        # Convert whole series at once instead of point by point
+        try:
+            timestamps = np.asarray(raw_timestamps, dtype=np.float64)
+            # Millisecond timestamps are converted to seconds
+            timestamps = np.where(timestamps > 1e10, timestamps // 1000, timestamps).astype(np.int64)
+            values = np.asarray(raw_values, dtype=np.float64)
+        except (ValueError, TypeError) as e:
+            raise Exception(f"Failed to convert data from Volcengine API: {e}") from e
 
-        return timestamps, values
+        return timestamps.tolist(), values.tolist()
 
     @staticmethod
     def _extract_labels(dimensions):
         """Extract labels from dimension information."""
         labels = {}
-        if dimensions:
-            for dim in dimensions:
-                if isinstance(dim, dict) and "name" in dim and "value" in dim:
-                    value = dim["value"] if dim["value"] not in [None, ""] else "unknown"
-                    labels[dim["name"]] = value
+        for dim in dimensions or ():
+            try:
+                name, value = dim["name"], dim["value"]
+            except (KeyError, TypeError):
+                # Skip dimensions that are not name/value mappings
+                continue
+            labels[name] = value if value not in (None, "") else "unknown"
         return labels
 
     @staticmethod
@@ -459,18 +506,13 @@ class VolcengineDataSource(DataSource):
         if not original_dimensions:
             return "Unknown"
 
-        # Convert original_dimensions to labels format
-        labels = {}
-        for key, values in original_dimensions.items():
-            if values and isinstance(values, list) and len(values) > 0:
-                labels[key] = values[0]
-
-        # Generate unique key
-        if labels:
-            labels_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-            return f"{metric_name}|{labels_str}"
-        else:
-            return "Unknown"
+        # Format the first value of each dimension as labels, sorted by dimension name
+        labels_str = ",".join(
+            f"{key}={values[0]}"
+            for key, values in sorted(original_dimensions.items())
+            if values and isinstance(values, list)
+        )
+        return f"{metric_name}|{labels_str}" if labels_str else "Unknown"
 
     @property
     def concurrency_group(self) -> str:
@@ -487,6 +529,17 @@ class VolcengineDataSource(DataSource):
         ak = self.connect.volcengine_access_key_id
         return f"volcengine_{ak}"
 
+    @property
+    def rule_concurrency_group(self) -> str:
+        """Get the concurrency group for Volcengine alarm rule API requests.
+
+        Rule requests are throttled apart from metric requests of the same access key.
+
+        Returns:
+            str: Unique concurrency group identifier in format "volcengine_{ak}_rule"
+        """
+        return f"{self.concurrency_group}_rule"
+
     @property
     def get_concurrency_quota(self) -> int:
         """Get the concurrency quota for Volcengine API requests.
@@ -496,6 +549,59 @@ class VolcengineDataSource(DataSource):
         """
         return 10
 
+    async def _run_rule_blocking(self, func, *args):
+        """Run a blocking rule SDK call on the rule executor of this account.
+
+        The executor is sized to the concurrency quota, so concurrent rule calls run in
+        parallel without blocking the event loop. Every call first takes a token from the
+        rate limiter of the rule group, and calls rejected with HTTP 429 are retried.
+        """
+        return await run_rate_limited(
+            self.rule_concurrency_group, self.get_concurrency_quota, EXECUTOR_THREAD_NAME_PREFIX, func, *args
+        )
+
+    async def _list_rules(
+        self, enable_state: Optional[List[str]] = None, ids_only: bool = False, batch_size: int = 100
+    ) -> List[DataForListRulesOutput] | List[str]:
+        """List the alarm rules of this data source, fetching pages concurrently.
+
+        The first page reports the total number of rules, the remaining pages are then
+        fetched concurrently on the rule executor. With `ids_only`, each page is reduced to
+        its rule IDs as soon as it arrives so the full rule objects are not kept around.
+
+        Args:
+            enable_state: Filter by enable state list (optional)
+            ids_only: Return the rule IDs instead of the rules (default: False)
+            batch_size: Number of rules to retrieve per page (default: 100)
+
+        Returns:
+            List of the alarm rules, or their IDs, in page order
+        """
+        list_page = functools.partial(
+            self.client.list_rules,
+            page_size=batch_size,
+            rule_name=self.name,
+            namespace=[self.namespace],
+            enable_state=enable_state,
+        )
+
+        def _page_items(page: ListRulesResponse) -> list:
+            rules = page.data or []
+            return [rule.id for rule in rules] if ids_only else list(rules)
+
+        first_page = await self._run_rule_blocking(list_page, 1)
+        all_rules = _page_items(first_page)
+
+        page_count = -(-(first_page.total_count or 0) // batch_size)
+        if page_count > 1:
+            pages = await asyncio.gather(
+                *(self._run_rule_blocking(list_page, page_number) for page_number in range(2, page_count + 1))
+            )
+            for page in pages:
+                all_rules.extend(_page_items(page))
+
+        return all_rules
+
     async def sync_rules_for_intelligent_threshold_task(self, **kwargs) -> Dict[str, Any]:
         """Synchronizes alarm rules with concurrent execution for better performance.
 
@@ -536,35 +642,42 @@ class VolcengineDataSource(DataSource):
         """Delete all alarm rules associated with this data source.
 
         This method retrieves all rules matching the data source's name and namespace,
-        then deletes them in batches of 10 to avoid API limitations.
+        then deletes them in concurrent batches to avoid API limitations.
         """
         logger.info(f"Starting deletion of all rules for data source: {self.name}")
 
         # Retrieve all rules associated with this data source
-        all_rules = self.client.list_all_rules(rule_name=self.name, namespace=[self.namespace])
+        rule_ids = await self._list_rules(ids_only=True)
 
-        if not all_rules:
+        if not rule_ids:
             logger.info("No rules found for deletion")
             return
 
-        logger.info(f"Found {len(all_rules)} rules for deletion")
-
-        # Extract rule IDs
-        rule_ids = [rule.id for rule in all_rules]
-
-        # Delete in batches of 10 to avoid API limitations
-        batch_size = 10
-
-        for i in range(0, len(rule_ids), batch_size):
-            batch = rule_ids[i : i + batch_size]
-            logger.info(
-                f"Deleting batch {i // batch_size + 1}/{(len(rule_ids) - 1) // batch_size + 1} "
-                f"containing {len(batch)} rules"
-            )
+        logger.info(f"Found {len(rule_ids)} rules for deletion")
+
+        batch_count = -(-len(rule_ids) // DELETE_RULES_BATCH_SIZE)
+
+        # Delete batches concurrently on the rule executor, each batch takes a rate limiter token and is retried
+        # when rejected with HTTP 429
+        async def _delete_batch(index: int, batch: List[str]):
+            # Loguru only formats the arguments when the record is emitted
+            logger.info("Deleting batch {}/{} containing {} rules", index, batch_count, len(batch))
+            result = await self._run_rule_blocking(self.client.delete_rules, batch)
+            logger.info("Successfully deleted batch of {} rules", len(batch))
+            return result
+
+        results = await asyncio.gather(
+            *(
+                _delete_batch(index, list(batch))
+                for index, batch in enumerate(batched(rule_ids, DELETE_RULES_BATCH_SIZE), 1)
+            ),
+            return_exceptions=True,
+        )
 
-            # Delete the batch of rules
-            self.client.delete_rules(batch)
-            logger.info(f"Successfully deleted batch of {len(batch)} rules")
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            error = errors[0]
+            raise Exception(f"Failed to delete {len(errors)} of {len(results)} rule batches: {error}") from error
 
         logger.info(f"Completed deletion of all {len(rule_ids)} rules")
 
@@ -588,8 +701,7 @@ class VolcengineRuleConfig(BaseRuleConfig):
         Returns:
             Corresponding Volcengine level string (critical, warning, or notice)
         """
-        level_mapping = {EventLevel.P0: "critical", EventLevel.P1: "warning", EventLevel.P2: "notice"}
-        return level_mapping.get(alarm_level, "notice")  # default to "notice" if not found
+        return _VOLCENGINE_LEVEL_MAPPING.get(alarm_level, "notice")  # default to "notice" if not found
 
 
 class RuleSynchronizer(BaseRuleSynchronizer):
@@ -599,6 +711,8 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         super().__init__(datasource)
         self.datasource = datasource
         self.client = datasource.client
+        self._request_template = None
+        self._metric_unit = None
 
     @property
     def concurrency_group(self) -> str:
@@ -609,7 +723,7 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         Returns:
             str: The concurrency group identifier based on ak/sk
         """
-        return f"{self.datasource.concurrency_group}_rule"
+        return self.datasource.rule_concurrency_group
 
     @property
     def get_concurrency_quota(self) -> int:
@@ -641,9 +755,7 @@ class RuleSynchronizer(BaseRuleSynchronizer):
 
     async def _fetch_existing_rules(self) -> Dict[str, List[Dict]]:
         """Fetch existing rules."""
-        rules = self.client.list_all_rules(
-            rule_name=self.datasource.name, namespace=[self.datasource.namespace], enable_state=["enable"]
-        )
+        rules = await self.datasource._list_rules(enable_state=["enable"])
 
         rule_map = {}
         for rule in rules:
@@ -749,15 +861,14 @@ class RuleSynchronizer(BaseRuleSynchronizer):
                 )
 
         # Process rules with unique_key that don't exist at all
-        for unique_key, existing_rules in existing.items():
-            if unique_key not in desired:
-                for rule_data in existing_rules:
-                    operations["delete"].append(
-                        {
-                            "rule": rule_data["rule"].to_dict(),
-                            "rule_id": rule_data["id"],
-                        }
-                    )
+        for unique_key in [key for key in existing if key not in desired]:
+            for rule_data in existing[unique_key]:
+                operations["delete"].append(
+                    {
+                        "rule": rule_data["rule"].to_dict(),
+                        "rule_id": rule_data["id"],
+                    }
+                )
 
         return operations
 
@@ -797,12 +908,15 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         # Use base class method to execute operations
         return await self.execute_operations(all_operations, operation_func_map)
 
-    @rate_limit
-    def _create_rule_wrapper(self, rule_data: Dict, config: VolcengineRuleConfig) -> Dict[str, Any]:
+    async def _run_blocking(self, func, *args):
+        """Run a blocking SDK call on the rule executor of this account."""
+        return await self.datasource._run_rule_blocking(func, *args)
+
+    async def _create_rule_wrapper(self, rule_data: Dict, config: VolcengineRuleConfig) -> Dict[str, Any]:
         """Create rule and return rule ID."""
         try:
             request = self._build_create_request(rule_data, config)
-            result = self.client.create_rule(request)
+            result = await self._run_blocking(self.client.create_rule, request)
 
             # Extract newly created rule ID
             data = result.get("data", [])
@@ -821,12 +935,11 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         except Exception as e:
             return {"action": "create", "status": "error", "error": str(e), "rule_name": rule_data["rule_name"]}
 
-    @rate_limit
-    def _update_rule_wrapper(self, rule_data: Dict, rule_id: str, config: VolcengineRuleConfig) -> Dict[str, Any]:
+    async def _update_rule_wrapper(self, rule_data: Dict, rule_id: str, config: VolcengineRuleConfig) -> Dict[str, Any]:
         """Update rule and return result."""
         try:
             request = self._build_update_request(rule_data, rule_id, config)
-            result = self.client.update_rule(request)
+            result = await self._run_blocking(self.client.update_rule, request)
 
             return {
                 "action": "update",
@@ -844,174 +957,114 @@ class RuleSynchronizer(BaseRuleSynchronizer):
                 "rule_name": rule_data["rule_name"],
             }
 
-    @rate_limit
-    def _delete_rules_wrapper(self, rule_ids: List[str]) -> Dict[str, Any]:
+    async def _delete_rules_wrapper(self, rule_ids: List[str]) -> Dict[str, Any]:
         """Delete rule and return result."""
         try:
-            result = self.client.delete_rules(rule_ids)
+            result = await self._run_blocking(self.client.delete_rules, rule_ids)
             return {"action": "delete", "status": "success", "rule_ids": rule_ids, "response": result}
         except Exception as e:
             return {"action": "delete", "status": "error", "rule_ids": rule_ids, "error": str(e)}
 
-    def _build_create_request(self, rule_data: Dict, config: VolcengineRuleConfig) -> CreateRuleRequest:
-        """Build create request."""
-        threshold = rule_data["threshold"]
-        original_dimensions = self.datasource._convert_label_to_dimensions(rule_data["labels"])
-
-        conditions = self._build_create_conditions(threshold, config)
-
-        tags = self._build_tags(config)
+    def _get_request_template(self, config: VolcengineRuleConfig) -> Dict[str, Any]:
+        """Get the request fields shared by every rule created or updated with this config.
 
-        # Convert alarm level from P0/P1/P2 to notice/warning/critical
-        volcengine_level = VolcengineRuleConfig.convert_alarm_level_to_monitor_level(config.alarm_level)
+        The fields are built once per config and reused for each rule of the synchronization.
+        """
+        if self._request_template is not None and self._request_template[0] is config:
+            return self._request_template[1]
 
         # Ensure alert_methods contains "Webhook" if webhook is provided
         alert_methods = config.alert_methods or []
         if config.webhook and "Webhook" not in alert_methods:
             alert_methods = alert_methods + ["Webhook"]
 
+        template = {
+            "alert_methods": alert_methods,
+            "condition_operator": "||",
+            "contact_group_ids": config.contact_group_ids or [],
+            "multiple_conditions": True,
+            "enable_state": "enable",
+            # Convert alarm level from P0/P1/P2 to notice/warning/critical
+            "level": VolcengineRuleConfig.convert_alarm_level_to_monitor_level(config.alarm_level),
+            "level_conditions": [],
+            "namespace": self.datasource.namespace,
+            "regions": [self.datasource.region],
+            "rule_type": "static",
+            "silence_time": config.default_silence_time,
+            "sub_namespace": self.datasource.sub_namespace,
+            "tags": self._build_tags(config),
+            "recovery_notify": RecoveryNotifyForCreateRuleInput(enable=True),
+            "webhook": config.webhook,
+        }
+        self._request_template = (config, template)
+        return template
+
+    def _build_rule_fields(self, rule_data: Dict, config: VolcengineRuleConfig) -> Dict[str, Any]:
+        """Build the request fields that depend on the rule, shared by create and update requests."""
+        return {
+            **self._get_request_template(config),
+            "effect_end_at": rule_data["end"],
+            "effect_start_at": rule_data["start"],
+            "evaluation_count": rule_data["threshold"].window_size or config.default_evaluation_count,
+            "rule_name": rule_data["rule_name"],
+            "original_dimensions": self.datasource._convert_label_to_dimensions(rule_data["labels"]),
+        }
+
+    def _build_create_request(self, rule_data: Dict, config: VolcengineRuleConfig) -> CreateRuleRequest:
+        """Build create request."""
         return CreateRuleRequest(
-            multiple_conditions=True,
-            alert_methods=alert_methods,
-            condition_operator="||",
-            conditions=conditions,
-            contact_group_ids=config.contact_group_ids or [],
-            effect_end_at=rule_data["end"],
-            effect_start_at=rule_data["start"],
-            enable_state="enable",
-            evaluation_count=threshold.window_size or config.default_evaluation_count,
-            level=volcengine_level,
-            level_conditions=[],
-            namespace=self.datasource.namespace,
-            regions=[self.datasource.region],
-            rule_name=self._generate_rule_name(rule_data["unique_key"], rule_data["start"], rule_data["end"]),
-            rule_type="static",
-            silence_time=config.default_silence_time,
-            sub_namespace=self.datasource.sub_namespace,
-            original_dimensions=original_dimensions,
-            tags=tags,
-            recovery_notify=RecoveryNotifyForCreateRuleInput(enable=True),
-            webhook=config.webhook,
+            **self._build_rule_fields(rule_data, config),
+            conditions=self._build_create_conditions(rule_data["threshold"], config),
         )
 
     def _build_update_request(self, rule_data: Dict, rule_id: str, config: VolcengineRuleConfig) -> UpdateRuleRequest:
         """Build update request."""
-        threshold = rule_data["threshold"]
-        original_dimensions = self.datasource._convert_label_to_dimensions(rule_data["labels"])
-
-        conditions = self._build_update_conditions(threshold, config)
-
-        tags = self._build_tags(config)
-
-        # Convert alarm level from P0/P1/P2 to notice/warning/critical
-        volcengine_level = VolcengineRuleConfig.convert_alarm_level_to_monitor_level(config.alarm_level)
-
-        # Ensure alert_methods contains "Webhook" if webhook is provided
-        alert_methods = config.alert_methods or []
-        if config.webhook and "Webhook" not in alert_methods:
-            alert_methods = alert_methods + ["Webhook"]
-
         return UpdateRuleRequest(
+            **self._build_rule_fields(rule_data, config),
             id=rule_id,
-            alert_methods=alert_methods,
-            condition_operator="||",
-            conditions=conditions,
-            contact_group_ids=config.contact_group_ids or [],
-            multiple_conditions=True,
-            effect_end_at=rule_data["end"],
-            effect_start_at=rule_data["start"],
-            enable_state="enable",
-            evaluation_count=threshold.window_size or config.default_evaluation_count,
-            level=volcengine_level,
-            namespace=self.datasource.namespace,
-            regions=[self.datasource.region],
-            rule_name=self._generate_rule_name(rule_data["unique_key"], rule_data["start"], rule_data["end"]),
-            rule_type="static",
-            silence_time=config.default_silence_time,
-            sub_namespace=self.datasource.sub_namespace,
-            original_dimensions=original_dimensions,
-            level_conditions=[],
-            tags=tags,
-            recovery_notify=RecoveryNotifyForCreateRuleInput(enable=True),
-            webhook=config.webhook,
+            conditions=self._build_update_conditions(rule_data["threshold"], config),
         )
 
+    def _get_metric_unit(self, config: VolcengineRuleConfig) -> str:
+        """Get the unit of the data source metric, resolved once per synchronization."""
+        if self._metric_unit is None:
+            metric = volcengine_metric_cache.get_metric_by_name(self.datasource.metric_name)
+            self._metric_unit = metric.unit if metric else config.default_unit
+        return self._metric_unit
+
+    def _build_conditions(self, condition_cls: type, threshold: Any, config: VolcengineRuleConfig) -> List[Any]:
+        """Build one condition per threshold bound that is set."""
+        base = {
+            "metric_name": self.datasource.metric_name,
+            "metric_unit": self._get_metric_unit(config),
+            "period": config.default_period,
+            "statistics": "avg",
+        }
+        return [
+            condition_cls(**base, comparison_operator=operator, threshold=str(bound))
+            for operator, bound in ((">", threshold.upper_bound), ("<", threshold.lower_bound))
+            if bound is not None
+        ]
+
     def _build_update_conditions(
         self, threshold: Any, config: VolcengineRuleConfig
     ) -> List[ConditionForUpdateRuleInput]:
         """Build condition list."""
-        conditions = []
-
-        # Get metric unit
-        metric = volcengine_metric_cache.get_metric_by_name(self.datasource.metric_name)
-        unit = metric.unit if metric else config.default_unit
-
-        if threshold.upper_bound is not None:
-            conditions.append(
-                ConditionForUpdateRuleInput(
-                    comparison_operator=">",
-                    metric_name=self.datasource.metric_name,
-                    metric_unit=unit,
-                    period=config.default_period,
-                    statistics="avg",
-                    threshold=str(threshold.upper_bound),
-                )
-            )
-
-        if threshold.lower_bound is not None:
-            conditions.append(
-                ConditionForUpdateRuleInput(
-                    comparison_operator="<",
-                    metric_name=self.datasource.metric_name,
-                    metric_unit=unit,
-                    period=config.default_period,
-                    statistics="avg",
-                    threshold=str(threshold.lower_bound),
-                )
-            )
-
-        return conditions
+        return self._build_conditions(ConditionForUpdateRuleInput, threshold, config)
 
     def _build_create_conditions(
         self, threshold: Any, config: VolcengineRuleConfig
     ) -> List[ConditionForCreateRuleInput]:
         """Build condition list."""
-        conditions = []
-
-        # Get metric unit
-        metric = volcengine_metric_cache.get_metric_by_name(self.datasource.metric_name)
-        unit = metric.unit if metric else config.default_unit
-
-        if threshold.upper_bound is not None:
-            conditions.append(
-                ConditionForCreateRuleInput(
-                    comparison_operator=">",
-                    metric_name=self.datasource.metric_name,
-                    metric_unit=unit,
-                    period=config.default_period,
-                    statistics="avg",
-                    threshold=str(threshold.upper_bound),
-                )
-            )
-
-        if threshold.lower_bound is not None:
-            conditions.append(
-                ConditionForCreateRuleInput(
-                    comparison_operator="<",
-                    metric_name=self.datasource.metric_name,
-                    metric_unit=unit,
-                    period=config.default_period,
-                    statistics="avg",
-                    threshold=str(threshold.lower_bound),
-                )
-            )
-
-        return conditions
+        return self._build_conditions(ConditionForCreateRuleInput, threshold, config)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def format_time_range(start_hour: int, end_hour: int) -> tuple[str, str]:
         """Convert hour range (0-24) to formatted time string.
 
+        The result only depends on the two hours, so it is cached across synchronizations.
+
         Args:
             start_hour: Start hour (0-24)
             end_hour: End hour (0-24)
@@ -1051,9 +1104,10 @@ class RuleSynchronizer(BaseRuleSynchronizer):
         tags = []
 
         # Add projects tags if projects exist in the task
-        if hasattr(config.task, "projects") and config.task.projects:
+        projects = getattr(config.task, "projects", None)
+        if projects:
             # Always create separate tags for each project
-            for i, project in enumerate(config.task.projects, 1):
+            for i, project in enumerate(projects, 1):
                 tag_key = f"projects_{i:02d}"  # projects01, projects02, etc.
                 tag_value = project  # value is a string, not a list
                 tags.append(
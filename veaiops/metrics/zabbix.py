@@ -53,6 +53,8 @@ __all__ = [
 
 DEFAULT_PAGE_SIZE = 5000
 
+_ZABBIX_PRIORITY_MAPPING = {EventLevel.P0: 4, EventLevel.P1: 2, EventLevel.P2: 1}
+
 
 class ZabbixTriggerTag(BaseModel):
     """Zabbix trigger tag configuration."""
@@ -243,7 +245,7 @@ class ZabbixClient:
                 sortorder="ASC",
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, _get_history)
 
     def get_triggers(self, pattern: str) -> List[Dict[str, Any]]:
@@ -1036,8 +1038,7 @@ class ZabbixRuleConfig(BaseRuleConfig):
         Returns:
             Corresponding Zabbix priority value (1 for info, 2 for warning, 4 for critical)
         """
-        level_mapping = {EventLevel.P0: 4, EventLevel.P1: 2, EventLevel.P2: 1}
-        return level_mapping.get(alarm_level, 1)  # default to 1 (info) if not found
+        return _ZABBIX_PRIORITY_MAPPING.get(alarm_level, 1)  # default to 1 (info) if not found
 
 
 class RuleSynchronizer(BaseRuleSynchronizer):
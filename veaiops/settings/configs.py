@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from cryptography.fernet import Fernet
 from pydantic import Field, SecretStr, model_validator
@@ -36,6 +36,16 @@ class MongoSettings(BaseSettings):
     host: str = "localhost"
     user: str = "demo"
     password: SecretStr = SecretStr("demopass")
+    # Skip index synchronization on startup, for dev/test deployments with stable indexes
+    skip_indexes: bool = False
+    # Connection pool
+    max_pool_size: int = 200
+    min_pool_size: int = 10
+    max_idle_time_ms: int = 60000
+    wait_queue_timeout_ms: int = 5000
+    server_selection_timeout_ms: int = 3000
+    # Wire protocol compression, negotiated with the server in order of preference
+    compressors: str = "zstd,zlib"
 
     @property
     def mongo_uri(self) -> str:
@@ -49,6 +59,23 @@ class MongoSettings(BaseSettings):
         else:
             return f"mongodb://{self.host}"
 
+    @property
+    def client_options(self) -> Dict[str, Any]:
+        """MongoDB client connection pool and compression options.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for AsyncMongoClient.
+        """
+        return {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "retryWrites": True,
+            "compressors": self.compressors,
+        }
+
     @model_validator(mode="after")
     def validate_default_settings(self) -> "MongoSettings":
         """Validate that settings are not empty after initialization."""
@@ -149,9 +176,12 @@ class O11ySettings(BaseSettings):
     # Sampler
     trace_id_ratio: float = 0.1
     # Processor
-    schedule_delay_millis: int = 5000
-    max_export_batch_size: int = 512
-    max_queue_size: int = 2048
+    schedule_delay_millis: int = 1000
+    max_export_batch_size: int = 128  # Keep export requests well under the gRPC message size limit
+    max_queue_size: int = 4096
+    export_timeout_millis: int = 10000
+    # Instrumentation
+    capture_mongo_statement: bool = False  # Attaching full BSON statements inflates every Mongo span
 
     @model_validator(mode="after")
     def validate_default_settings(self) -> "O11ySettings":
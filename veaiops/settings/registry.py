@@ -42,6 +42,8 @@ def get_settings(cls: Type[T]) -> T:
         Settings instance.
 
     """
-    if cls not in _Registry:
-        raise RuntimeError(f"{cls.__name__} not registered")
-    return _Registry[cls]  # type: ignore
+    # Instances are built once by init_settings, a lookup here never re-validates settings
+    try:
+        return _Registry[cls]  # type: ignore
+    except KeyError:
+        raise RuntimeError(f"{cls.__name__} not registered") from None
@@ -0,0 +1,44 @@
+# Copyright 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict
+
+from veaiops.schema.models.base import TimeRange
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=1024)
+def _utc_datetime_range(start_time: int, end_time: int) -> tuple[datetime, datetime]:
+    """Convert epoch seconds to UTC datetimes."""
+    return datetime.fromtimestamp(start_time, tz=_UTC), datetime.fromtimestamp(end_time, tz=_UTC)
+
+
+def time_range_filter(time_range: TimeRange) -> Dict[str, Any]:
+    """Convert a time range in epoch seconds to a MongoDB datetime range condition.
+
+    The UTC datetimes are cached per (start_time, end_time), so repeated pagination requests over the same
+    range skip the conversion. A new dict is returned on each call, callers are free to modify it.
+
+    Args:
+        time_range: Time range with start and end time in epoch seconds.
+
+    Returns:
+        Dict[str, Any]: Range condition like {"$gte": start, "$lte": end}.
+    """
+    start, end = _utc_datetime_range(time_range.start_time, time_range.end_time)
+    return {"$gte": start, "$lte": end}
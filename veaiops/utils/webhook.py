@@ -26,6 +26,8 @@ from veaiops.settings import WebhookSettings, get_settings
 from veaiops.utils.client import AsyncClientWithCtx
 from veaiops.utils.log import logger
 
+_OBJECT_ID_ENCODER = {PydanticObjectId: str}
+
 
 async def send_bot_notification(bot: Bot, data: AgentNotification):
     """Send notification to webhook URL for a specific bot.
@@ -77,7 +79,7 @@ async def send_http_request(
         else:
             payload = {"data": str(data)}
 
-        json_data = jsonable_encoder(payload, custom_encoder={PydanticObjectId: lambda r: str(r)})
+        json_data = jsonable_encoder(payload, custom_encoder=_OBJECT_ID_ENCODER)
     except Exception as e:
         logger.error(f"Failed to serialize data for webhook notification: {e}")
         raise e